@@ -1,15 +1,83 @@
-from fastapi import FastAPI, HTTPException
+import hashlib
+import json
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import Annotated, Any, AsyncIterator, Iterator, Optional, Union
 
+from myimpact import aio
 from myimpact.assembler import (
+    PROMPT_CODE_DIGEST,
+    PromptRequest,
     assemble_prompt,
-    discover_levels,
-    discover_orgs,
-    discover_scales,
+    assemble_prompts,
+    focus_prompt_cache,
+    iter_assemble_prompts,
+    list_orgs,
+    load_metadata,
     load_org_focus_areas,
+    normalize_prompt_request,
+    org_focus_areas_fingerprint,
+    prompt_cache,
+    resource_fingerprint,
+    use_resource_bundle,
+    use_resource_store,
+)
+from myimpact.generation import (
+    GenerationError,
+    GenerationResult,
+    LLMProvider,
+    provider_from_env,
 )
+from myimpact.materialize import load_prompt_artifact
+from myimpact.response_cache import CachingProvider, response_cache_from_env
+from myimpact.singleflight import SingleFlight
+from myimpact.stores import SQLiteStore
+from myimpact.tokens import estimate_prompt_tokens, segment_token_cache
+from myimpact.watcher import stop_watching, watch_resources
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm in-process caches before serving traffic."""
+    bundle_path = os.environ.get("MYIMPACT_RESOURCE_BUNDLE")
+    database_path = os.environ.get("MYIMPACT_RESOURCE_DB")
+    if bundle_path:
+        use_resource_bundle(bundle_path)
+    elif database_path:
+        use_resource_store(SQLiteStore(database_path))
+
+    artifact_path = os.environ.get("MYIMPACT_PROMPT_ARTIFACT")
+    if artifact_path:
+        load_prompt_artifact(artifact_path)
+
+    # Push-based invalidation: steady-state requests skip every stat/glob call
+    watcher = watch_resources() if _env_flag("MYIMPACT_WATCH_RESOURCES") else None
+    # Server-side generation is opt-in; without a provider responses stay prompts-only
+    provider = provider_from_env()
+    app.state.response_cache = None
+    if provider is not None:
+        app.state.response_cache = response_cache_from_env()
+        if app.state.response_cache is not None:
+            provider = CachingProvider(provider, app.state.response_cache)
+    app.state.llm_provider = provider
+    try:
+        yield
+    finally:
+        aio.shutdown()
+        if app.state.llm_provider is not None:
+            await app.state.llm_provider.aclose()
+        if watcher is not None:
+            stop_watching(watcher)
+
 
 app = FastAPI(
     title="MyImpact API",
@@ -21,6 +89,7 @@ app = FastAPI(
     license_info={
         "name": "MIT",
     },
+    lifespan=lifespan,
 )
 
 # Add CORS middleware to allow frontend requests
@@ -36,6 +105,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
@@ -52,6 +122,102 @@ class GenerateRequest(BaseModel):
     goal_style: str = Field(
         "independent", description="Goal style", examples=["independent", "progressive"]
     )
+    max_tokens: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Estimated prompt token budget; org focus areas are condensed to fit",
+    )
+
+
+class BatchGenerateRequest(BaseModel):
+    """Request model for batch prompt generation."""
+
+    items: list[GenerateRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=int(os.environ.get("MYIMPACT_BATCH_MAX_ITEMS", "10000")),
+        description="Prompt requests, answered in the same order",
+    )
+
+
+def _echo_inputs(request: GenerateRequest) -> dict:
+    """Return the request inputs with defaults applied, as echoed in responses."""
+    return {
+        "scale": request.scale,
+        "level": request.level,
+        "growth_intensity": request.growth_intensity,
+        "org": request.org or "demo",
+        "goal_style": request.goal_style or "independent",
+        "focus_area": request.focus_area,
+    }
+
+
+def _prompt_request(request: GenerateRequest) -> PromptRequest:
+    """Map an API request onto assembler inputs, applying the API defaults."""
+    return PromptRequest(
+        scale=request.scale,
+        level=request.level,
+        growth_intensity=request.growth_intensity,
+        org_name=request.org or "demo",
+        focus_area=request.focus_area or None,
+        goal_style=request.goal_style or "independent",
+    )
+
+
+def get_llm_provider(request: Request) -> Optional[LLMProvider]:
+    """Dependency: the configured generation provider, or None when running prompts-only."""
+    return getattr(request.app.state, "llm_provider", None)
+
+
+def _describe_error(e: Exception) -> tuple[int, str]:
+    """Map an assembler or generation exception to (HTTP status, detail message)."""
+    if isinstance(e, GenerationError):
+        return e.status_code, f"Generation failed: {str(e)}"
+    if isinstance(e, FileNotFoundError):
+        return 500, f"Configuration error: {str(e)}"
+    if isinstance(e, ValueError):
+        return 400, f"Invalid request parameters: {str(e)}"
+    return 500, f"Internal server error: {str(e)}"
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Longest accepted NDJSON input line; longer lines get a 413 error line and are discarded
+NDJSON_MAX_LINE_BYTES = int(os.environ.get("MYIMPACT_NDJSON_MAX_LINE_BYTES", "65536"))
+
+# HTTP caching for responses that are a pure function of the resource files
+CACHE_CONTROL = os.environ.get("MYIMPACT_CACHE_CONTROL", "public, max-age=300")
+
+
+def _make_etag(*parts) -> str:
+    """
+    Build a strong ETag from a resource fingerprint and the inputs it applies to.
+    The app version and the prompt code digest are mixed in, so a code-only deploy changes
+    every ETag too.
+    """
+    versioned = (app.version, PROMPT_CODE_DIGEST) + parts
+    digest = hashlib.sha256(repr(versioned).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Evaluate an If-None-Match header against an ETag (weak comparison, per RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+def _cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds this ETag, else None."""
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return None
 
 
 # Endpoints
@@ -60,75 +226,420 @@ async def health_check():
     return {"status": "healthy", "version": app.version}
 
 
-@app.get("/api/metadata", tags=["Metadata"])
-async def metadata():
-    scales = discover_scales()
-    levels = {scale: discover_levels(scale) for scale in scales}
-    return {
-        "scales": scales,
-        "levels": levels,
-        "growth_intensities": ["minimal", "moderate", "aggressive"],
-        "goal_styles": ["independent", "progressive"],
-        "organizations": discover_orgs(),
+@app.get("/api/metrics", tags=["Monitoring"])
+async def metrics(request: Request):
+    """Report in-process cache and request coalescing statistics."""
+    payload = {
+        "prompt_cache": prompt_cache.stats(),
+        "focus_prompt_cache": focus_prompt_cache.stats(),
+        "token_cache": segment_token_cache.stats(),
+        "coalescing": {
+            "prompts": prompt_flights.stats(),
+            "generation": generation_flights.stats(),
+        },
     }
+    response_cache = getattr(request.app.state, "response_cache", None)
+    if response_cache is not None:
+        if getattr(response_cache, "blocking", False):
+            payload["response_cache"] = await aio.run_blocking(response_cache.stats)
+        else:
+            payload["response_cache"] = response_cache.stats()
+    return payload
 
 
-@app.get("/api/orgs/{org_name}/focus-areas", tags=["Metadata"])
-async def get_org_focus_areas(org_name: str):
-    """Get strategic focus areas for an organization."""
+# (ETag, encoded body) of the last metadata response, per include_orgs
+_metadata_bodies: dict[bool, tuple[str, bytes]] = {}
+
+
+@app.get("/api/metadata", tags=["Metadata"])
+async def metadata(
+    request: Request,
+    include_orgs: bool = Query(
+        True, description="Include the full organizations list (use /api/orgs for large catalogs)"
+    ),
+):
+    fingerprint, payload = await aio.run_blocking(load_metadata, include_orgs=include_orgs)
+    etag = _make_etag("metadata", include_orgs, fingerprint)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    cached = _metadata_bodies.get(include_orgs)
+    if cached is None or cached[0] != etag:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        cached = _metadata_bodies[include_orgs] = (etag, body)
+    return Response(content=cached[1], media_type="application/json", headers=_cache_headers(etag))
+
+
+@app.get("/api/orgs", tags=["Metadata"])
+async def get_orgs(
+    prefix: str = Query("", description="Only organizations whose names start with this"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=500, description="Maximum organizations per page"),
+):
+    """Page through organization names in sorted order, optionally filtered by prefix."""
+    page = await aio.run_blocking(list_orgs, prefix=prefix, cursor=cursor, limit=limit)
+    return {"organizations": page.organizations, "next_cursor": page.next_cursor}
+
+
+def _load_org_focus_areas_or_none(org_name: str) -> Optional[str]:
     try:
-        content = load_org_focus_areas(org_name)
-        return {"content": content}
+        return load_org_focus_areas(org_name)
     except FileNotFoundError:
-        return {"content": None}
+        return None
+
+
+@app.get("/api/orgs/{org_name}/focus-areas", tags=["Metadata"])
+async def get_org_focus_areas(org_name: str, request: Request):
+    """Get strategic focus areas for an organization."""
+    fingerprint = await aio.run_blocking(org_focus_areas_fingerprint, org_name)
+    etag = _make_etag("focus-areas", org_name, fingerprint)
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    content = await aio.run_blocking(_load_org_focus_areas_or_none, org_name)
+    return JSONResponse({"content": content}, headers=_cache_headers(etag))
+
+
+# Concurrent identical requests share one assembly and one generation call
+prompt_flights = SingleFlight()
+generation_flights = SingleFlight()
+
+
+def _assemble_with_fingerprint(inputs: dict[str, Any]) -> tuple[str, str, tuple]:
+    """Return assemble_prompt(**inputs) plus the resource fingerprint it was built from."""
+    framework_prompt, user_context = assemble_prompt(**inputs)
+    return framework_prompt, user_context, resource_fingerprint(inputs["scale"], inputs["org_name"])
+
+
+async def _prompt_payload(request: GenerateRequest) -> tuple[dict, tuple]:
+    """
+    Assemble the prompts for a request into the generate response body (result pending).
+    Returns (payload, resource fingerprint). Cache misses are assembled in the I/O pool.
+    """
+    inputs: dict[str, Any] = {
+        "scale": request.scale,
+        "level": request.level,
+        "growth_intensity": request.growth_intensity,
+        "org_name": request.org or "demo",
+        "goal_style": request.goal_style or "independent",
+        "focus_area": request.focus_area or None,
+    }
+    # Only budgeted requests pass max_tokens, so the default path is unchanged
+    if request.max_tokens:
+        inputs["max_tokens"] = request.max_tokens
+
+    async def assemble() -> tuple[str, str, int, tuple]:
+        prompt: tuple[str, str, tuple]
+        cached = aio.cached_prompt(**inputs)
+        if cached is not None:
+            prompt = (*cached, resource_fingerprint(request.scale, inputs["org_name"]))
+        else:
+            prompt = await aio.run_blocking(_assemble_with_fingerprint, inputs)
+        framework_prompt, user_context, fingerprint = prompt
+        token_estimate = estimate_prompt_tokens(framework_prompt, user_context)
+        return framework_prompt, user_context, token_estimate, fingerprint
+
+    key = (normalize_prompt_request(*_prompt_request(request)), request.max_tokens)
+    framework_prompt, user_context, token_estimate, fingerprint = await prompt_flights.do(
+        key, assemble
+    )
+    payload = {
+        "inputs": _echo_inputs(request),
+        # modern structured format
+        "framework": framework_prompt,
+        "user_context": user_context,
+        "token_estimate": token_estimate,
+        "result": None,
+        "powered_by": "prompts-only",
+    }
+    return payload, fingerprint
 
 
 @app.post("/api/goals/generate")
-async def generate_prompts(request: GenerateRequest):
+async def generate_prompts(
+    request: GenerateRequest, provider: Optional[LLMProvider] = Depends(get_llm_provider)
+):
     """Generate goal-setting prompts.
     
     Returns a JSON object containing:
     - framework: The system/instruction prompt.
     - user_context: The data-driven context for the specific user.
+    - token_estimate: Estimated prompt size in tokens (framework plus user context).
+    - result: Generated goals ({content, model, usage}) when a provider is configured, else null.
     - powered_by: Indicates the generation engine ("prompts-only" for when copy only enabled).
     """
     try:
-        framework_prompt, user_context = assemble_prompt(
-            scale=request.scale,
-            level=request.level,
-            growth_intensity=request.growth_intensity,
-            org_name=request.org or "demo",
-            goal_style=request.goal_style or "independent",
-            focus_area=request.focus_area or None,
-        )
+        payload, fingerprint = await _prompt_payload(request)
+        framework_prompt, user_context = payload["framework"], payload["user_context"]
+        inputs = payload["inputs"]
 
-        return {
-            "inputs": {
-                "scale": request.scale,
-                "level": request.level,
-                "growth_intensity": request.growth_intensity,
-                "org": request.org or "demo",
-                "goal_style": request.goal_style or "independent",
-                "focus_area": request.focus_area,
-            },
-            # modern structured format
-            "framework": framework_prompt,
-            "user_context": user_context,
-            "result": None,
-            "powered_by": "prompts-only",
-        }
-    except FileNotFoundError as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Configuration error: {str(e)}",
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid request parameters: {str(e)}",
+        if provider is not None:
+            result = await generation_flights.do(
+                (provider.name, provider.model, framework_prompt, user_context),
+                lambda: provider.generate(framework_prompt, user_context),
+            )
+            payload["result"] = result._asdict()
+            payload["powered_by"] = provider.name
+            # Generated goals differ between runs, so they must not be cached or revalidated
+            return JSONResponse(payload, headers={"Cache-Control": "no-store"})
+
+        # Prompts-only responses are deterministic, so they can carry validators
+        etag = _make_etag(
+            "generate",
+            tuple(inputs.values()),
+            request.max_tokens,
+            fingerprint,
         )
+        return JSONResponse(payload, headers=_cache_headers(etag))
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}",
-        )
+        status_code, detail = _describe_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def _sse_event(event: str, payload: dict) -> bytes:
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+async def _sse_response(
+    request: GenerateRequest, provider: Optional[LLMProvider]
+) -> StreamingResponse:
+    """Assemble the prompts, then stream generation as server-sent events.
+
+    Assembly errors are raised before the stream starts, so they keep their HTTP status.
+    """
+    try:
+        payload, _ = await _prompt_payload(request)
+    except Exception as e:
+        status_code, detail = _describe_error(e)
+        raise HTTPException(status_code=status_code, detail=detail)
+    powered_by = provider.name if provider is not None else "prompts-only"
+
+    async def events():
+        prompt = {key: payload[key] for key in ("inputs", "framework", "user_context")}
+        yield _sse_event("prompt", {**prompt, "token_estimate": payload["token_estimate"]})
+        result = None
+        if provider is not None:
+            try:
+                async for item in provider.stream(payload["framework"], payload["user_context"]):
+                    if isinstance(item, GenerationResult):
+                        result = item._asdict()
+                    else:
+                        yield _sse_event("delta", {"content": item})
+            except Exception as e:
+                status_code, detail = _describe_error(e)
+                yield _sse_event("error", {"status_code": status_code, "detail": detail})
+                return
+        yield _sse_event("done", {"result": result, "powered_by": powered_by})
+
+    return StreamingResponse(
+        events(),
+        media_type=SSE_MEDIA_TYPE,
+        # Keep proxies from buffering the stream, and never cache generated goals
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+_SSE_RESPONSES: dict[Union[int, str], dict[str, Any]] = {200: {"content": {SSE_MEDIA_TYPE: {}}}}
+
+
+@app.get(
+    "/api/goals/generate/stream", response_class=StreamingResponse, responses=_SSE_RESPONSES
+)
+async def generate_goals_stream(
+    request: Annotated[GenerateRequest, Query()],
+    provider: Optional[LLMProvider] = Depends(get_llm_provider),
+):
+    """Stream generated goals as server-sent events (EventSource-friendly GET form).
+
+    Takes the /api/goals/generate inputs as query parameters. Events, each with a JSON data line:
+    - prompt: inputs, framework, user_context and token_estimate, sent first.
+    - delta: {content}, a chunk of generated text, in order (none when prompts-only).
+    - done: {result, powered_by}, the complete result as /api/goals/generate returns it.
+    - error: {status_code, detail}, if generation fails part-way; ends the stream.
+    """
+    return await _sse_response(request, provider)
+
+
+@app.post(
+    "/api/goals/generate/stream", response_class=StreamingResponse, responses=_SSE_RESPONSES
+)
+async def generate_goals_stream_post(
+    request: GenerateRequest, provider: Optional[LLMProvider] = Depends(get_llm_provider)
+):
+    """Stream generated goals as server-sent events, for a JSON body like /api/goals/generate."""
+    return await _sse_response(request, provider)
+
+
+def _budget_options(items: list[GenerateRequest]) -> dict[str, Any]:
+    """Return the assembler keyword arguments carrying per-item max_tokens budgets, if any."""
+    budgets = [item.max_tokens for item in items]
+    # Only budgeted batches pass max_tokens, so the default path is unchanged
+    return {"max_tokens": budgets} if any(budgets) else {}
+
+
+def _item_result(
+    index: int, item: GenerateRequest, result: Union[tuple[str, str], Exception]
+) -> dict[str, Any]:
+    """Build a batch or stream result entry for one assembled (or failed) item."""
+    entry: dict[str, Any] = {
+        "index": index,
+        "inputs": _echo_inputs(item),
+        "user_context": None,
+        "token_estimate": None,
+        "error": None,
+    }
+    if isinstance(result, Exception):
+        status_code, detail = _describe_error(result)
+        entry["error"] = {"status_code": status_code, "detail": detail}
+    else:
+        entry["user_context"] = result[1]
+        entry["token_estimate"] = estimate_prompt_tokens(*result)
+    return entry
+
+
+@app.post("/api/goals/generate:batch")
+async def generate_prompts_batch(batch: BatchGenerateRequest):
+    """Generate goal-setting prompts for many users in one round trip.
+
+    Identical inputs are assembled once. The framework prompt is shared by every item, so it
+    is returned once at the top level. Each result carries either a user_context and its
+    token_estimate or an error (with the status the single-item endpoint would have returned),
+    in request order. Items with max_tokens are trimmed to fit, as by /api/goals/generate.
+    """
+    requests = [_prompt_request(item) for item in batch.items]
+    options = _budget_options(batch.items)
+    results = await aio.run_blocking(assemble_prompts, requests, **options)
+
+    framework_prompt = None
+    items = []
+    errors = 0
+    for index, (item, result) in enumerate(zip(batch.items, results)):
+        entry = _item_result(index, item, result)
+        if entry["error"] is not None:
+            errors += 1
+        else:
+            framework_prompt = result[0]
+        items.append(entry)
+
+    return {
+        "framework": framework_prompt,
+        "results": items,
+        "count": len(items),
+        "errors": errors,
+        "powered_by": "prompts-only",
+    }
+
+
+def _ndjson_line(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse for handlers that keep reading the request body while responding.
+
+    StreamingResponse normally watches receive() for a disconnect alongside the body iterator,
+    which would steal request body chunks from the handler. Here the handler owns receive():
+    a client disconnect surfaces as ClientDisconnect from request.stream() instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@app.post(
+    "/api/goals/generate:stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+async def generate_prompts_stream(request: Request):
+    """Stream goal-setting prompts for very large cohorts as NDJSON.
+
+    The request body is NDJSON: one GenerateRequest object per line. Each input line produces
+    one output line as soon as it is assembled, so neither side buffers the cohort. Output lines
+    carry index, inputs, user_context, token_estimate and error (max_tokens is applied as by
+    /api/goals/generate); the shared framework prompt is included on the first successful line
+    (and again only if it changes). Lines over NDJSON_MAX_LINE_BYTES get a 413 error line.
+    """
+
+    async def input_lines() -> AsyncIterator[list[Optional[bytes]]]:
+        # Per network chunk, the complete lines in it; None stands for an overlong line, whose
+        # bytes are dropped as they arrive rather than buffered up to its newline
+        pending = bytearray()
+        oversized = False
+        async for chunk in request.stream():
+            lines: list[Optional[bytes]] = []
+            start = 0
+            end = chunk.find(b"\n")
+            while end >= 0:
+                if oversized or len(pending) + end - start > NDJSON_MAX_LINE_BYTES:
+                    lines.append(None)
+                else:
+                    pending += chunk[start:end]
+                    lines.append(bytes(pending))
+                pending.clear()
+                oversized = False
+                start = end + 1
+                end = chunk.find(b"\n", start)
+            if not oversized and len(pending) + len(chunk) - start > NDJSON_MAX_LINE_BYTES:
+                oversized = True
+                pending.clear()
+            elif not oversized:
+                pending += chunk[start:]
+            yield lines
+        yield [None if oversized else bytes(pending)]
+
+    async def output_lines() -> AsyncIterator[bytes]:
+        index = 0
+        last_framework = None
+        async for lines in input_lines():
+            parsed: list[tuple[int, Optional[GenerateRequest], Optional[dict]]] = []
+            for line in lines:
+                if line is None:
+                    detail = f"Input line exceeds {NDJSON_MAX_LINE_BYTES} bytes"
+                    parsed.append((index, None, {"status_code": 413, "detail": detail}))
+                    index += 1
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    parsed.append((index, GenerateRequest.model_validate_json(line), None))
+                except ValidationError as e:
+                    detail = json.loads(e.json(include_url=False))
+                    parsed.append((index, None, {"status_code": 422, "detail": detail}))
+                index += 1
+
+            # Assemble each network chunk's worth of lines in one pass, off the event loop
+            items = [item for _, item, _ in parsed if item is not None]
+            requests = [_prompt_request(item) for item in items]
+            options = _budget_options(items)
+            results: Iterator[Union[tuple[str, str], Exception]] = iter(
+                await aio.run_blocking(
+                    list, iter_assemble_prompts(requests, return_exceptions=True, **options)
+                )
+            )
+            for line_index, item, line_error in parsed:
+                if item is None:
+                    entry: dict[str, Any] = {
+                        "index": line_index,
+                        "inputs": None,
+                        "user_context": None,
+                        "token_estimate": None,
+                        "error": line_error,
+                    }
+                    yield _ndjson_line(entry)
+                    continue
+                result = next(results)
+                entry = _item_result(line_index, item, result)
+                if not isinstance(result, Exception) and result[0] != last_framework:
+                    entry["framework"] = last_framework = result[0]
+                yield _ndjson_line(entry)
+
+    return _DuplexStreamingResponse(output_lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,70 @@
+"""Async access to the assembler, for callers running on an event loop.
+
+Assembler calls block: a cold or revalidated resource means stat(), glob() and open() calls, or a
+SQLite query, and a slow disk would stall every connection on the loop. run_blocking() runs such
+calls in a small bounded thread pool instead. cached_prompt() answers the common case inline,
+from prompt_cache, when the resource store can provide signatures without I/O (a bundle, or
+files trusted under a watcher).
+
+The pool size comes from MYIMPACT_IO_THREADS (default 4). Callers beyond it queue for a thread,
+which also bounds how many concurrent reads a burst can put on the disk.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from myimpact import assembler
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def io_executor() -> ThreadPoolExecutor:
+    """Return the shared I/O thread pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.environ.get("MYIMPACT_IO_THREADS", "4")),
+                thread_name_prefix="myimpact-io",
+            )
+        return _executor
+
+
+def shutdown() -> None:
+    """Stop the I/O thread pool; the next call creates a new one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+async def run_blocking(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run fn(*args, **kwargs) in the I/O thread pool and return its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(io_executor(), functools.partial(fn, *args, **kwargs))
+
+
+def cached_prompt(**inputs) -> Optional[tuple[str, str]]:
+    """
+    Return assembler.cached_prompt(**inputs) if it can be answered without I/O, else None.
+    Takes the keyword arguments of assemble_prompt().
+    """
+    if not assembler.get_resource_store().signatures_in_memory():
+        return None
+    return assembler.cached_prompt(**inputs)
+
+
+async def assemble_prompt(**inputs) -> tuple[str, str]:
+    """assemble_prompt() for event loops: inline from the cache, else in the I/O pool."""
+    prompt = cached_prompt(**inputs)
+    if prompt is None:
+        prompt = await run_blocking(assembler.assemble_prompt, **inputs)
+    return prompt
@@ -1,13 +1,24 @@
-"""Prompt assembler: loads culture CSVs, org focus areas, and framework text to generate LLM context."""
+"""Prompt assembler: loads culture CSVs, org focus areas and framework text into LLM context."""
 
-import csv
+import functools
+import hashlib
+import itertools
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
 
+from myimpact.bundle import ResourceBundle
+from myimpact.cache import LRUCache
+from myimpact.culture import CultureMatrix
+from myimpact.stores import FilesystemStore, ResourceStore
+from myimpact.template import compile_template
+from myimpact.tokens import estimate_prompt_tokens
 
+
+@functools.lru_cache(maxsize=None)
 def _get_resource_dir(subdir: str) -> Path:
-    """Resolve resource directory relative to package root, supporting both dev and installed modes."""
+    """Resolve a resource directory relative to the package root (dev and installed modes)."""
     package_root = Path(__file__).parent.parent
     resource_path = package_root / subdir
     if resource_path.exists():
@@ -16,47 +27,86 @@ def _get_resource_dir(subdir: str) -> Path:
     return package_root / subdir
 
 
+def _culture_csv_path(scale: str) -> Path:
+    return _get_resource_dir("data") / f"culture_expectations_{scale}.csv"
+
+
+def _org_focus_areas_path(org_name: str) -> Path:
+    return _get_resource_dir("prompts") / f"org_focus_areas_{org_name}.md"
+
+
+def _framework_prompt_path() -> Path:
+    return _get_resource_dir("prompts") / "goal_generation_framework_prompt.txt"
+
+
+# Store every loader reads from; None means the package's data/ and prompts/ directories
+_store: Optional[ResourceStore] = None
+
+
+@functools.lru_cache(maxsize=8)
+def _filesystem_store(data_dir: Path, prompts_dir: Path) -> FilesystemStore:
+    return FilesystemStore(data_dir, prompts_dir)
+
+
+def get_resource_store() -> ResourceStore:
+    """Return the active resource store (by default, the data/ and prompts/ files)."""
+    if _store is not None:
+        return _store
+    return _filesystem_store(_get_resource_dir("data"), _get_resource_dir("prompts"))
+
+
+def use_resource_store(store: Optional[ResourceStore]) -> None:
+    """
+    Serve every resource from store, or from the data/ and prompts/ directories again when
+    store is None. Call once at startup.
+    """
+    global _store
+    _store = store
+    _org_sections.clear()
+    _metadata_snapshots.clear()
+
+
+def use_resource_bundle(path: Optional[Union[str, Path]]) -> None:
+    """Serve every resource from a bundle built by myimpact.bundle.build_bundle()."""
+    use_resource_store(ResourceBundle(path) if path is not None else None)
+
+
 def load_culture_csv(scale: str) -> dict:
-    """Load culture expectations CSV by scale (e.g., 'technical', 'leadership')."""
-    data_dir = _get_resource_dir("data")
-    csv_path = data_dir / f"culture_expectations_{scale}.csv"
+    """
+    Load culture expectations CSV by scale (e.g., 'technical', 'leadership').
+    The parsed dict is cached and shared between callers; do not mutate it. Stores other than
+    the filesystem rebuild it from the compiled matrix, so only named level columns appear.
+    """
+    try:
+        return get_resource_store().culture(scale)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Culture CSV not found: {_culture_csv_path(scale)}") from None
 
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Culture CSV not found: {csv_path}")
 
-    culture = {}
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            attr_name = row.get("Cultural Attribute", "").strip()
-            if not attr_name:  # Skip empty rows
-                continue
-            culture[attr_name] = {k: v for k, v in row.items() if k != "Cultural Attribute"}
-    return culture
+def load_culture_matrix(scale: str) -> CultureMatrix:
+    """Load the compiled, level-indexed culture matrix for a scale."""
+    try:
+        return get_resource_store().culture_matrix(scale)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Culture CSV not found: {_culture_csv_path(scale)}") from None
 
 
 def load_org_focus_areas(org_name: str) -> str:
     """Load org focus areas markdown file."""
-    prompts_dir = _get_resource_dir("prompts")
-    focus_areas_path = prompts_dir / f"org_focus_areas_{org_name}.md"
-
-    if not focus_areas_path.exists():
-        raise FileNotFoundError(f"Org focus areas file not found: {focus_areas_path}")
-
-    with open(focus_areas_path, "r", encoding="utf-8") as f:
-        return f.read()
+    try:
+        return get_resource_store().org_focus_areas(org_name)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Org focus areas file not found: {_org_focus_areas_path(org_name)}"
+        ) from None
 
 
 def load_framework_prompt() -> str:
     """Load goal generation framework text."""
-    prompts_dir = _get_resource_dir("prompts")
-    prompt_path = prompts_dir / "goal_generation_framework_prompt.txt"
-
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Framework file not found: {prompt_path}")
-
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    try:
+        return get_resource_store().framework_prompt()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Framework file not found: {_framework_prompt_path()}") from None
 
 
 def discover_scales() -> list[str]:
@@ -64,12 +114,7 @@ def discover_scales() -> list[str]:
     Discover available scales based on CSV files in data directory.
     Returns list of scale names (e.g. ['technical', 'leadership']).
     """
-    data_dir = Path(__file__).parent.parent / "data"
-    scales = []
-    for file in data_dir.glob("culture_expectations_*.csv"):
-        scale_name = file.stem.replace("culture_expectations_", "")
-        scales.append(scale_name)
-    return sorted(scales)
+    return get_resource_store().scales()
 
 
 def discover_all_levels() -> dict[str, list[str]]:
@@ -89,22 +134,42 @@ def discover_all_levels() -> dict[str, list[str]]:
 
 def discover_orgs() -> list:
     """Discover available organizations from org_focus_areas_*.md files."""
-    prompts_dir = _get_resource_dir("prompts")
-    org_names = []
-    for file in prompts_dir.glob("org_focus_areas_*.md"):
-        org_name = file.stem.replace("org_focus_areas_", "")
-        org_names.append(org_name)
-    return sorted(org_names)
+    return list(get_resource_store().orgs())
+
+
+class OrgPage(NamedTuple):
+    """One page of organization names; next_cursor is None on the last page."""
+
+    organizations: list[str]
+    next_cursor: Optional[str]
+
+
+def list_orgs(prefix: str = "", cursor: Optional[str] = None, limit: int = 50) -> OrgPage:
+    """
+    Page through the organizations whose names start with prefix, in sorted order.
+    Pass the previous page's next_cursor as cursor to continue after it. Each page is a
+    range lookup in the store's sorted org index, so its cost does not grow with the catalog.
+    """
+    names = get_resource_store().org_page(prefix, cursor, limit + 1)
+    if len(names) > limit:
+        return OrgPage(names[:limit], names[limit - 1])
+    return OrgPage(names, None)
+
+
+def catalog_fingerprint() -> tuple:
+    """
+    Return the version of the resource catalog: the name and signature of every culture scale
+    and org. Changes whenever one is added, removed or edited.
+    """
+    return get_resource_store().catalog_fingerprint()
 
 
 def extract_levels_from_csv(scale: str) -> list:
-    """Extract available job levels from CSV column headers."""
-    culture = load_culture_csv(scale)
-    if not culture:
-        return []
-    # Get first attribute's keys (all should have same levels)
-    first_attr = next(iter(culture.values()))
-    return sorted(first_attr.keys())
+    """Extract available job levels from CSV column headers (reads the header row only)."""
+    try:
+        return get_resource_store().levels(scale)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Culture CSV not found: {_culture_csv_path(scale)}") from None
 
 
 def discover_levels(scale: str) -> list:
@@ -114,74 +179,143 @@ def discover_levels(scale: str) -> list:
 
 def extract_culture_for_level(scale: str, level: str) -> dict:
     """Extract culture expectations for a specific level."""
-    culture = load_culture_csv(scale)
-    result = {}
-    for attr_name, levels in culture.items():
-        if level in levels:
-            result[attr_name] = levels[level]
-    return result
+    return load_culture_matrix(scale).expectations(level)
+
+
+_GROWTH_GUIDANCE = {
+    "minimal": (
+        "Focus on foundational skill-building and consistency. Emphasize learning over output."
+    ),
+    "moderate": (
+        "Balance learning with measurable contributions. Demonstrate reliability and growth."
+    ),
+    "aggressive": "Stretch goals that build strategic capabilities. Show leadership and impact.",
+}
+
+_GOAL_STYLE_GUIDANCE = {
+    "independent": (
+        "Generate 6–9 standalone goals. "
+        "Each goal is independent and can be pursued in any order."
+    ),
+    "progressive": (
+        "Generate 4 quarterly goals that build upon each other. "
+        "Each Q builds on prior success, demonstrating commitment and deepening expertise."
+    ),
+}
+
+
+GROWTH_INTENSITIES = tuple(_GROWTH_GUIDANCE)
+GOAL_STYLES = tuple(_GOAL_STYLE_GUIDANCE)
 
 
 def _get_growth_guidance(intensity: str) -> str:
     """Return growth intensity guidance for the LLM."""
-    guidance = {
-        "minimal": "Focus on foundational skill-building and consistency. Emphasize learning over output.",
-        "moderate": "Balance learning with measurable contributions. Demonstrate reliability and growth.",
-        "aggressive": "Stretch goals that build strategic capabilities. Show leadership and impact.",
-    }
-    return guidance.get(intensity, guidance["moderate"])
+    return _GROWTH_GUIDANCE.get(intensity, _GROWTH_GUIDANCE["moderate"])
 
 
 def _get_goal_style_guidance(style: str) -> str:
     """Return goal style guidance for the LLM."""
-    guidance = {
-        "independent": "Generate 6–9 standalone goals. Each goal is independent and can be pursued in any order.",
-        "progressive": "Generate 4 quarterly goals that build upon each other. Each Q builds on prior success, demonstrating commitment and deepening expertise.",
-    }
-    return guidance.get(style, guidance["independent"])
+    return _GOAL_STYLE_GUIDANCE.get(style, _GOAL_STYLE_GUIDANCE["independent"])
 
 
-def assemble_prompt(
-    scale: str,
-    level: str,
-    growth_intensity: str,
-    org_name: str = "demo",
-    focus_area: Optional[str] = None,
-    goal_style: str = "independent",
-) -> tuple[str, str]:
+# (catalog fingerprint, metadata payload) from the last load_metadata() call, per include_orgs
+_metadata_snapshots: dict[bool, tuple[tuple, dict]] = {}
+
+
+def load_metadata(include_orgs: bool = True) -> tuple[tuple, dict]:
     """
-    Assemble framework and user context from curated data.
-    Returns: (framework, user_context)
+    Build the form metadata (scales, levels, growth intensities, goal styles, organizations).
+    With include_orgs=False the organizations list is left out and the orgs are never listed,
+    so the cost no longer grows with the number of orgs; page through them with list_orgs().
+    The payload is cached and rebuilt only when the catalog fingerprint changes; do not mutate it.
+    Returns: (fingerprint, metadata)
     """
-    # Load and extract culture
-    culture = extract_culture_for_level(scale, level)
-    if not culture:
-        raise ValueError(f"No culture data found for scale={scale}, level={level}")
+    if include_orgs:
+        fingerprint = catalog_fingerprint()
+    else:
+        fingerprint = (get_resource_store().scale_fingerprint(),)
+    snapshot = _metadata_snapshots.get(include_orgs)
+    if snapshot is not None and snapshot[0] == fingerprint:
+        return snapshot
+
+    culture_files = fingerprint[0]
+    scales = sorted(scale for scale, _ in culture_files)
+    levels = {}
+    for scale in scales:
+        try:
+            levels[scale] = extract_levels_from_csv(scale)
+        except FileNotFoundError:
+            levels[scale] = []
+    metadata = {
+        "scales": scales,
+        "levels": levels,
+        "growth_intensities": list(GROWTH_INTENSITIES),
+        "goal_styles": list(GOAL_STYLES),
+    }
+    if include_orgs:
+        metadata["organizations"] = sorted(org_name for org_name, _ in fingerprint[1])
+    snapshot = _metadata_snapshots[include_orgs] = (fingerprint, metadata)
+    return snapshot
 
-    culture_text = "\n".join(
-        [f"- **{attr}**: {expectation}" for attr, expectation in culture.items()]
-    )
 
-    # Load full org focus areas content (all strategic focus areas)
-    try:
-        org_focus_areas_full = load_org_focus_areas(org_name)
-    except FileNotFoundError:
-        org_focus_areas_full = ""
+def _render_org_section(org_focus_areas_full: str) -> str:
+    """Render the organizational focus section of the user context from the org markdown."""
+    if not org_focus_areas_full:
+        return ""
+    return f"""
+### Organizational Strategic Focus Areas
+{org_focus_areas_full}
+"""
 
-    # User-specified focus (optional emphasis on top of full org context)
-    user_focus = focus_area.strip() if focus_area else ""
 
-    # Load goal framework prompt
-    framework = load_framework_prompt()
+# Rendered org sections keyed by (org_name, org signature)
+_org_sections = LRUCache(maxsize=1024)
+
+
+def _load_org_section(org_name: str) -> str:
+    """Load the pre-rendered org focus section ('' if the org has no focus areas)."""
+    store = get_resource_store()
+    key = (org_name, store.org_signature(org_name))
+    section: Optional[str] = _org_sections.get(key)
+    if section is None:
+        try:
+            section = _render_org_section(store.org_focus_areas(org_name))
+        except FileNotFoundError:
+            section = ""
+        _org_sections.put(key, section)
+    return section
+
+
+# Focus areas are blocks separated by blank lines: a heading line, then bullet lines
+_FOCUS_AREA_SEPARATOR = re.compile(r"\n[ \t]*\n")
+
+
+def _condense_org_focus_areas(org_focus_areas_full: str, bullets_per_area: int) -> str:
+    """Keep each focus area's heading and only its first bullets_per_area lines."""
+    areas = []
+    for block in _FOCUS_AREA_SEPARATOR.split(org_focus_areas_full.strip()):
+        lines = block.strip().splitlines()
+        if lines:
+            areas.append("\n".join(lines[: 1 + bullets_per_area]))
+    return "\n\n".join(areas)
+
+
+def _render_focus_section(user_focus: str) -> str:
+    """Render the user-specified focus section ('' when no focus was given)."""
+    if not user_focus:
+        return ""
+    return f"""
+### Your Focus Areas
+The user wants to emphasize the following focus areas:
+{user_focus}
+"""
 
-    # Build user context
-    growth_guidance = _get_growth_guidance(growth_intensity)
-    goal_style_guidance = _get_goal_style_guidance(goal_style)
 
-    user_context = f"""
+# User context layout; the org and focus sections are pre-rendered slot values
+_USER_CONTEXT_SOURCE = """
 ## Context for Goal Generation
 
-**Scale/Track**: {scale.capitalize()}
+**Scale/Track**: {scale_title}
 **Job Level**: {level}
 **Growth Intensity**: {growth_intensity}
 **Goal Style**: {goal_style}
@@ -195,24 +329,7 @@ def assemble_prompt(
 
 ### Goal Style Guidance
 {goal_style_guidance}
-"""
-
-    # Always include full organizational context
-    if org_focus_areas_full:
-        user_context += f"""
-### Organizational Strategic Focus Areas
-{org_focus_areas_full}
-"""
-
-    # Add user-specified focus if provided
-    if user_focus:
-        user_context += f"""
-### Your Focus Areas
-The user wants to emphasize the following focus areas:
-{user_focus}
-"""
-
-    user_context += """
+{org_section}{focus_section}
 ### Your Task
 Generate quarterly career goals that:
 1. Demonstrate progress toward the cultural principles above.
@@ -224,5 +341,298 @@ Generate quarterly career goals that:
 
 Generate the goals now.
 """
+_USER_CONTEXT_TEMPLATE = compile_template(_USER_CONTEXT_SOURCE)
+
+# Digest of the prompt text that lives in code rather than resource files. A deploy that edits
+# the template or guidance changes it, though no resource fingerprint would notice.
+PROMPT_CODE_DIGEST = hashlib.sha256(
+    repr((_USER_CONTEXT_SOURCE, _GROWTH_GUIDANCE, _GOAL_STYLE_GUIDANCE)).encode("utf-8")
+).hexdigest()[:16]
+
+
+class PromptRequest(NamedTuple):
+    """Normalized assemble_prompt inputs; equal requests always produce equal prompts."""
+
+    scale: str
+    level: str
+    growth_intensity: str
+    org_name: str = "demo"
+    focus_area: Optional[str] = None
+    goal_style: str = "independent"
+
+
+def normalize_prompt_request(
+    scale: str,
+    level: str,
+    growth_intensity: str,
+    org_name: str = "demo",
+    focus_area: Optional[str] = None,
+    goal_style: str = "independent",
+) -> PromptRequest:
+    """Build a PromptRequest, stripping the focus area and mapping a blank one to None."""
+    user_focus = focus_area.strip() if focus_area else ""
+    return PromptRequest(scale, level, growth_intensity, org_name, user_focus or None, goal_style)
+
+
+def resource_fingerprint(scale: str, org_name: str) -> tuple:
+    """
+    Return the version of every resource a prompt for (scale, org_name) depends on.
+    For files this costs one os.stat each; the fingerprint changes whenever any is edited.
+    """
+    store = get_resource_store()
+    return (
+        store.culture_signature(scale),
+        store.org_signature(org_name),
+        store.framework_signature(),
+    )
+
+
+def org_focus_areas_fingerprint(org_name: str) -> Optional[tuple[int, int]]:
+    """Return the version of an org's focus areas (None if it does not exist)."""
+    return get_resource_store().org_signature(org_name)
+
+
+# Assembled (framework, user_context) pairs keyed by (PromptRequest, resource fingerprint)
+prompt_cache = LRUCache(maxsize=int(os.environ.get("MYIMPACT_PROMPT_CACHE_SIZE", "1024")))
+# Prompts outside the discovered grid (see iter_prompt_grid): a free-text focus area, an unknown
+# org or scale, or an unlisted growth intensity or goal style. Kept apart so a burst of unique
+# inputs cannot evict the small, hot grid from prompt_cache
+focus_prompt_cache = LRUCache(
+    maxsize=int(os.environ.get("MYIMPACT_FOCUS_PROMPT_CACHE_SIZE", "256"))
+)
+
+
+def _prompt_cache_for(request: PromptRequest, fingerprint: tuple) -> LRUCache:
+    # A missing culture CSV or org file has no signature, so the fingerprint tells unknown
+    # scales and orgs apart without listing the catalog
+    culture_signature, org_signature = fingerprint[:2]
+    in_grid = (
+        request.focus_area is None
+        and request.growth_intensity in GROWTH_INTENSITIES
+        and request.goal_style in GOAL_STYLES
+        and culture_signature is not None
+        and org_signature is not None
+    )
+    return prompt_cache if in_grid else focus_prompt_cache
+
+
+def iter_prompt_grid() -> Iterator[PromptRequest]:
+    """Yield a PromptRequest for every no-focus-area combination of the discovered options."""
+    orgs = discover_orgs()
+    for scale, levels in discover_all_levels().items():
+        for level in levels:
+            for growth_intensity in GROWTH_INTENSITIES:
+                for org_name in orgs:
+                    for goal_style in GOAL_STYLES:
+                        yield PromptRequest(
+                            scale, level, growth_intensity, org_name, None, goal_style
+                        )
+
+
+def _assemble_prompt(request: PromptRequest, org_section: Optional[str] = None) -> tuple[str, str]:
+    """
+    Assemble (framework, user_context) for a normalized request, bypassing the cache.
+    org_section replaces the org's rendered focus section when given.
+    """
+    # Pre-rendered culture bullets for the level
+    culture_text = load_culture_matrix(request.scale).bullets(request.level)
+    if not culture_text:
+        raise ValueError(f"No culture data found for scale={request.scale}, level={request.level}")
+
+    # Load goal framework prompt
+    framework = load_framework_prompt()
+
+    # Full org context is included unless trimmed to a budget; user focus is optional
+    # emphasis on top of it
+    if org_section is None:
+        org_section = _load_org_section(request.org_name)
+    user_context = _USER_CONTEXT_TEMPLATE.render(
+        scale_title=request.scale.capitalize(),
+        level=request.level,
+        growth_intensity=request.growth_intensity,
+        goal_style=request.goal_style,
+        org_name=request.org_name,
+        culture_text=culture_text,
+        growth_guidance=_get_growth_guidance(request.growth_intensity),
+        goal_style_guidance=_get_goal_style_guidance(request.goal_style),
+        org_section=org_section,
+        focus_section=_render_focus_section(request.focus_area or ""),
+    )
 
     return framework, user_context
+
+
+def _cached_assemble_prompt(request: PromptRequest, fingerprint: tuple) -> tuple[str, str]:
+    """Serve a normalized request from its prompt cache, assembling and storing it on a miss."""
+    cache = _prompt_cache_for(request, fingerprint)
+    key = (request, fingerprint)
+    prompt: Optional[tuple[str, str]] = cache.get(key)
+    if prompt is None:
+        prompt = _assemble_prompt(request)
+        cache.put(key, prompt)
+    return prompt
+
+
+# Org focus trims tried in order when a prompt is over its max_tokens budget: bullets kept per
+# focus area (first bullet, then headings only), and None for no org section at all
+_TRIM_STEPS: tuple[Optional[int], ...] = (1, 0, None)
+
+
+def _trimmed_prompt(
+    request: PromptRequest, fingerprint: tuple, step: Optional[int]
+) -> tuple[str, str]:
+    """Serve a request with its org focus section trimmed by step, caching it per step."""
+    cache = _prompt_cache_for(request, fingerprint)
+    key = (request, fingerprint, step)
+    prompt: Optional[tuple[str, str]] = cache.get(key)
+    if prompt is None:
+        org_section = ""
+        if step is not None:
+            try:
+                org_focus_areas_full = get_resource_store().org_focus_areas(request.org_name)
+            except FileNotFoundError:
+                org_focus_areas_full = ""
+            org_section = _render_org_section(_condense_org_focus_areas(org_focus_areas_full, step))
+        prompt = _assemble_prompt(request, org_section=org_section)
+        cache.put(key, prompt)
+    return prompt
+
+
+def _fit_prompt(request: PromptRequest, fingerprint: tuple, max_tokens: int) -> tuple[str, str]:
+    """
+    Serve a prompt estimated at no more than max_tokens. Oversized prompts shed org focus
+    detail in fixed steps (_TRIM_STEPS) and the first step that fits is returned. Trimmed
+    prompts are cached per step, not per budget, so a request holds at most one entry per
+    step however many budgets it is asked for. Raises ValueError when none fits.
+    """
+    prompt = _cached_assemble_prompt(request, fingerprint)
+    tokens = estimate_prompt_tokens(*prompt)
+    if tokens <= max_tokens:
+        return prompt
+
+    for step in _TRIM_STEPS:
+        prompt = _trimmed_prompt(request, fingerprint, step)
+        tokens = estimate_prompt_tokens(*prompt)
+        if tokens <= max_tokens:
+            return prompt
+    raise ValueError(
+        f"Prompt needs about {tokens} tokens even without org focus areas, "
+        f"over the max_tokens budget of {max_tokens}"
+    )
+
+
+def assemble_prompt(
+    scale: str,
+    level: str,
+    growth_intensity: str,
+    org_name: str = "demo",
+    focus_area: Optional[str] = None,
+    goal_style: str = "independent",
+    max_tokens: Optional[int] = None,
+) -> tuple[str, str]:
+    """
+    Assemble framework and user context from curated data.
+    Results are memoized in prompt_cache (focus_prompt_cache for a focus_area or any input
+    outside the discovered options) until a resource file they depend on changes.
+    With max_tokens, the org focus section is condensed until the estimated prompt size
+    (see myimpact.tokens) fits; ValueError if it cannot.
+    Returns: (framework, user_context)
+    """
+    request = normalize_prompt_request(
+        scale, level, growth_intensity, org_name, focus_area, goal_style
+    )
+    fingerprint = resource_fingerprint(scale, org_name)
+    if max_tokens is not None:
+        return _fit_prompt(request, fingerprint, max_tokens)
+    return _cached_assemble_prompt(request, fingerprint)
+
+
+def _peek_prompt(key: tuple) -> Optional[tuple[str, str]]:
+    # A miss here is not counted: the caller falls back to assemble_prompt(), which counts it
+    cache = _prompt_cache_for(key[0], key[1])
+    return cache.get(key) if key in cache else None
+
+
+def cached_prompt(
+    scale: str,
+    level: str,
+    growth_intensity: str,
+    org_name: str = "demo",
+    focus_area: Optional[str] = None,
+    goal_style: str = "independent",
+    max_tokens: Optional[int] = None,
+) -> Optional[tuple[str, str]]:
+    """
+    Return what assemble_prompt() would if it is already cached, else None.
+    Never assembles or loads resources; only the resource signatures are looked up.
+    """
+    request = normalize_prompt_request(
+        scale, level, growth_intensity, org_name, focus_area, goal_style
+    )
+    fingerprint = resource_fingerprint(scale, org_name)
+    prompt = _peek_prompt((request, fingerprint))
+    if prompt is None or max_tokens is None or estimate_prompt_tokens(*prompt) <= max_tokens:
+        return prompt
+    for step in _TRIM_STEPS:
+        # An uncached step might be the first to fit, so nothing later can be trusted
+        prompt = _peek_prompt((request, fingerprint, step))
+        if prompt is None or estimate_prompt_tokens(*prompt) <= max_tokens:
+            return prompt
+    return None
+
+
+def iter_assemble_prompts(
+    requests: Iterable[PromptRequest],
+    return_exceptions: bool = False,
+    max_tokens: Optional[Iterable[Optional[int]]] = None,
+) -> Iterator:
+    """
+    Lazily assemble prompts, yielding each (framework, user_context) as soon as it is ready.
+    Memory stays flat for arbitrarily long inputs: only one resource fingerprint per
+    (scale, org) is retained, and repeated requests are served by prompt_cache. With
+    return_exceptions=True a failing request yields its exception instead of raising it.
+    max_tokens, if given, holds one budget (or None) per request, applied as by
+    assemble_prompt().
+    """
+    fingerprints = {}
+    budgets = itertools.repeat(None) if max_tokens is None else max_tokens
+    for request, budget in zip(requests, budgets):
+        request = normalize_prompt_request(*request)
+        resources = (request.scale, request.org_name)
+        if resources not in fingerprints:
+            fingerprints[resources] = resource_fingerprint(*resources)
+        result: Union[tuple[str, str], Exception]
+        try:
+            if budget is None:
+                result = _cached_assemble_prompt(request, fingerprints[resources])
+            else:
+                result = _fit_prompt(request, fingerprints[resources], budget)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            result = e
+        yield result
+
+
+def assemble_prompts(
+    requests: Iterable[PromptRequest], max_tokens: Optional[Iterable[Optional[int]]] = None
+) -> list:
+    """
+    Assemble prompts for many requests in one pass.
+    Identical normalized requests are assembled once and resource fingerprints are resolved
+    once per (scale, org). max_tokens, if given, holds one budget (or None) per request.
+    Returns one entry per request, in order: the (framework, user_context) tuple, or the
+    exception raised while assembling that request.
+    """
+    budgets = itertools.repeat(None) if max_tokens is None else max_tokens
+    keys = [
+        (normalize_prompt_request(*request), budget) for request, budget in zip(requests, budgets)
+    ]
+    unique = list(dict.fromkeys(keys))
+    results = iter_assemble_prompts(
+        [request for request, _ in unique],
+        return_exceptions=True,
+        max_tokens=[budget for _, budget in unique],
+    )
+    assembled = dict(zip(unique, results))
+    return [assembled[key] for key in keys]
@@ -0,0 +1,314 @@
+"""Micro-benchmarks for the assembler and API hot paths, run by `myimpact bench`.
+
+Each case times one operation repeatedly for at least min_time seconds and reports throughput,
+p50/p99 latency and allocation: how far traced memory peaks above its starting point during one
+operation (tracemalloc, in a separate pass so tracing does not skew the timings).
+
+Results can be saved as a baseline JSON file and later runs compared against it. A case is a
+regression when its throughput drops, or its allocation grows, by more than the tolerance.
+p99 is reported but not gated, because one scheduler hiccup moves it. Timings are specific to
+the machine, so compare only against a baseline saved on the same kind of host.
+
+API cases call the FastAPI app (api.main, imported from the working directory like `myimpact
+serve` does) in-process through httpx.ASGITransport. They need the api extras and are skipped
+when those are not installed.
+"""
+
+import asyncio
+import itertools
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterable, NamedTuple, Optional, Union
+
+BASELINE_FORMAT = 1
+
+API_CASES = ("api /api/metadata", "api /api/goals/generate")
+
+
+class BenchResult(NamedTuple):
+    """Measurements for one benchmark case; latencies in microseconds, allocation in bytes."""
+
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+    alloc_bytes: int
+
+
+class Regression(NamedTuple):
+    """A metric that moved the wrong way by more than the tolerance against the baseline."""
+
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return float(sorted_values[index])
+
+
+def measure(
+    name: str,
+    operation: Callable[[], object],
+    min_time: float = 0.5,
+    max_iterations: int = 100_000,
+    alloc_iterations: int = 20,
+) -> BenchResult:
+    """Benchmark operation() after one warm-up call."""
+    operation()
+    durations: list[int] = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * 1e9)
+    while len(durations) < max_iterations:
+        start = clock()
+        operation()
+        end = clock()
+        durations.append(end - start)
+        if end >= deadline:
+            break
+
+    # Peak growth of traced memory within one call (the median over a few calls)
+    peaks = []
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(max(0, peak - before))
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    durations.sort()
+    return BenchResult(
+        name=name,
+        iterations=len(durations),
+        ops_per_sec=len(durations) / (sum(durations) / 1e9),
+        p50_us=_percentile(durations, 0.50) / 1e3,
+        p99_us=_percentile(durations, 0.99) / 1e3,
+        alloc_bytes=int(statistics.median(peaks)),
+    )
+
+
+def _assembler_cases() -> dict[str, Callable[[], Callable[[], object]]]:
+    """Return {name: setup} for the assembler cases; setup() returns the operation to time."""
+    from myimpact import assembler
+    from myimpact.cache import resource_cache
+
+    def load_culture_csv():
+        scales = itertools.cycle(assembler.discover_scales())
+        return lambda: assembler.load_culture_csv(next(scales))
+
+    def load_culture_csv_cold():
+        scales = itertools.cycle(assembler.discover_scales())
+
+        def operation():
+            resource_cache.clear()
+            return assembler.load_culture_csv(next(scales))
+
+        return operation
+
+    def extract_culture_for_level():
+        pairs = itertools.cycle(
+            [
+                (scale, level)
+                for scale, levels in assembler.discover_all_levels().items()
+                for level in levels
+            ]
+        )
+        return lambda: assembler.extract_culture_for_level(*next(pairs))
+
+    def assemble_grid():
+        grid = list(assembler.iter_prompt_grid())
+        return lambda: [assembler.assemble_prompt(*request) for request in grid]
+
+    def assemble_grid_uncached():
+        grid = list(assembler.iter_prompt_grid())
+
+        def operation():
+            assembler.prompt_cache.clear()
+            return [assembler.assemble_prompt(*request) for request in grid]
+
+        return operation
+
+    return {
+        "load_culture_csv": load_culture_csv,
+        "load_culture_csv[cold]": load_culture_csv_cold,
+        "extract_culture_for_level": extract_culture_for_level,
+        "assemble_prompt[grid]": assemble_grid,
+        "assemble_prompt[grid,uncached]": assemble_grid_uncached,
+    }
+
+
+def _api_cases(loop: asyncio.AbstractEventLoop, client) -> dict[str, Callable[[], Callable]]:
+    """Return {name: setup} for in-process API cases, all sharing one client on loop."""
+    from myimpact import assembler
+
+    def call(request) -> Callable[[], object]:
+        def operation():
+            response = loop.run_until_complete(request())
+            response.raise_for_status()
+            return response
+
+        return operation
+
+    def metadata():
+        return call(lambda: client.get("/api/metadata"))
+
+    def generate():
+        payloads = itertools.cycle(
+            [
+                {
+                    "scale": request.scale,
+                    "level": request.level,
+                    "growth_intensity": request.growth_intensity,
+                    "org": request.org_name,
+                    "goal_style": request.goal_style,
+                }
+                for request in assembler.iter_prompt_grid()
+            ]
+        )
+        return call(lambda: client.post("/api/goals/generate", json=next(payloads)))
+
+    return dict(zip(API_CASES, (metadata, generate)))
+
+
+def _load_app():
+    """Import the FastAPI app; RuntimeError if api.main is not importable from here."""
+    try:
+        from api.main import app
+    except ModuleNotFoundError as e:
+        if e.name not in ("api", "api.main"):
+            raise
+        raise RuntimeError(
+            "API benchmarks import api.main from the working directory; "
+            "run from the repository root"
+        ) from None
+    return app
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None, min_time: float = 0.5
+) -> tuple[list[BenchResult], list[str]]:
+    """
+    Run the named cases (all by default) in a fixed order.
+    Returns (results, skipped) where skipped lists cases whose dependencies (the api extras)
+    are not installed.
+    """
+    wanted = None if names is None else set(names)
+    results: list[BenchResult] = []
+    skipped: list[str] = []
+    cases = _assembler_cases()
+    loop = asyncio.new_event_loop()
+    client = None
+    try:
+        if wanted is None or not wanted.isdisjoint(API_CASES):
+            try:
+                import fastapi  # noqa: F401
+                import httpx
+            except ImportError:
+                skipped.extend(API_CASES)
+            else:
+                transport = httpx.ASGITransport(app=_load_app())
+                client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+                cases.update(_api_cases(loop, client))
+        if wanted is not None:
+            unknown = wanted - set(cases) - set(skipped)
+            if unknown:
+                raise ValueError(f"Unknown benchmark: {', '.join(sorted(unknown))}")
+        for name, setup in cases.items():
+            if wanted is None or name in wanted:
+                results.append(measure(name, setup(), min_time=min_time))
+    finally:
+        if client is not None:
+            loop.run_until_complete(client.aclose())
+        loop.close()
+    skipped = [name for name in skipped if wanted is None or name in wanted]
+    return results, skipped
+
+
+def save_baseline(path: Union[str, Path], results: list[BenchResult]) -> None:
+    """Write results as a baseline JSON file."""
+    document = {
+        "format": BASELINE_FORMAT,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: result._asdict() for result in results},
+    }
+    Path(path).write_text(json.dumps(document, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: Union[str, Path]) -> dict[str, dict]:
+    """Read a baseline file written by save_baseline(); returns {name: measurements}."""
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Unsupported benchmark baseline format in {path}")
+    results: dict[str, dict] = document["results"]
+    return results
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, dict],
+    tolerance: float = 0.4,
+    names: Optional[Iterable[str]] = None,
+) -> list[Regression]:
+    """
+    Return the regressions against baseline: throughput more than tolerance below it, or
+    allocation more than tolerance above it (and at least 1 KiB more). Cases missing from
+    the baseline are not compared. A baseline case that did not run (among names, the cases
+    that were asked for, if given) is a "missing" regression with a current value of 0.
+    """
+    ran = {result.name for result in results}
+    wanted = set(baseline) if names is None else set(baseline).intersection(names)
+    regressions = [
+        Regression(name, "missing", baseline[name]["ops_per_sec"], 0.0)
+        for name in sorted(wanted - ran)
+    ]
+    for result in results:
+        expected = baseline.get(result.name)
+        if expected is None:
+            continue
+        if result.ops_per_sec < expected["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                Regression(result.name, "ops_per_sec", expected["ops_per_sec"], result.ops_per_sec)
+            )
+        allowed = max(expected["alloc_bytes"] * (1 + tolerance), expected["alloc_bytes"] + 1024)
+        if result.alloc_bytes > allowed:
+            regressions.append(
+                Regression(result.name, "alloc_bytes", expected["alloc_bytes"], result.alloc_bytes)
+            )
+    return regressions
+
+
+def format_results(results: list[BenchResult], baseline: Optional[dict[str, dict]] = None) -> str:
+    """Render results as a fixed-width table, with throughput relative to baseline if given."""
+    header = f"{'benchmark':<32} {'ops/sec':>11} {'p50 us':>10} {'p99 us':>10} {'alloc KiB':>10}"
+    if baseline is not None:
+        header += f" {'vs base':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = (
+            f"{result.name:<32} {result.ops_per_sec:>11,.1f} {result.p50_us:>10,.1f} "
+            f"{result.p99_us:>10,.1f} {result.alloc_bytes / 1024:>10,.1f}"
+        )
+        if baseline is not None:
+            expected = baseline.get(result.name)
+            change = (
+                f"{result.ops_per_sec / expected['ops_per_sec'] - 1:+.0%}" if expected else "new"
+            )
+            line += f" {change:>8}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,191 @@
+"""Precompiled resource bundle: every culture scale, org and the framework prompt in one file.
+
+Layout (little-endian):
+
+    header   8-byte magic, uint32 format version, uint32 index length
+    index    UTF-8 JSON: what the bundle holds and where each blob lives
+    blobs    UTF-8 blobs addressed by [offset, length] relative to the end of the index
+
+Culture scales are stored already compiled (attributes, levels and the expectation grid), org
+focus areas and the framework prompt as their raw text. A ResourceBundle memory-maps the file
+read-only, so loading a resource is a slice of the mapping rather than an open() and a CSV
+parse, and worker processes that map the same bundle share its pages through the OS page cache.
+Each resource also records the signature its source store reported, which lets prompt-cache
+fingerprints and prebuilt prompt artifacts line up with a filesystem deployment.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Optional, Union
+
+from myimpact.culture import _MISSING, CultureMatrix
+from myimpact.stores import ResourceStore
+
+BUNDLE_MAGIC = b"MYIMPBDL"
+BUNDLE_FORMAT = 1
+
+_HEADER = struct.Struct("<8sII")
+
+
+def build_bundle(output_path: Union[str, Path], source: ResourceStore) -> dict:
+    """
+    Compile every resource in source into a bundle at output_path.
+    Returns counts of what was written: {"scales": n, "orgs": n}.
+    """
+    blobs = bytearray()
+
+    def add_blob(text: str) -> list:
+        data = text.encode("utf-8")
+        offset = len(blobs)
+        blobs.extend(data)
+        return [offset, len(data)]
+
+    # A resource whose signature is None vanished after it was listed; it is left out
+    culture = {}
+    for scale in source.scales():
+        signature = source.culture_signature(scale)
+        if signature is None:
+            continue
+        matrix = source.culture_matrix(scale)
+        compiled = {
+            "attributes": list(matrix.attributes),
+            "levels": list(matrix.levels),
+            "columns": [
+                [None if cell is _MISSING else cell for cell in matrix.column(level) or ()]
+                for level in matrix.levels
+            ],
+        }
+        culture[scale] = {
+            "signature": list(signature),
+            "levels": source.levels(scale),
+            "blob": add_blob(json.dumps(compiled, ensure_ascii=False)),
+        }
+
+    orgs = {}
+    for org_name in source.orgs():
+        signature = source.org_signature(org_name)
+        if signature is None:
+            continue
+        orgs[org_name] = {
+            "signature": list(signature),
+            "blob": add_blob(source.org_focus_areas(org_name)),
+        }
+
+    framework = None
+    signature = source.framework_signature()
+    if signature is not None:
+        framework = {
+            "signature": list(signature),
+            "blob": add_blob(source.framework_prompt()),
+        }
+
+    index = json.dumps(
+        {"culture": culture, "orgs": orgs, "framework": framework},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    with open(output_path, "wb") as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT, len(index)))
+        f.write(index)
+        f.write(blobs)
+    return {"scales": len(culture), "orgs": len(orgs)}
+
+
+class ResourceBundle(ResourceStore):
+    """
+    Resource store reading a bundle file through a shared, read-only memory mapping.
+
+    Compiled culture matrices are memoized per bundle, which is safe because a bundle never
+    changes once written.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Resource bundle not found: {self.path}")
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_length = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic, version, index_length = b"", None, 0
+        if magic != BUNDLE_MAGIC or version != BUNDLE_FORMAT:
+            self._mmap.close()
+            raise ValueError(f"Not a supported resource bundle: {self.path}")
+        index_end = _HEADER.size + index_length
+        index = json.loads(self._mmap[_HEADER.size : index_end].decode("utf-8"))
+        self._blobs_offset = index_end
+        self._culture: dict = index["culture"]
+        self._orgs: dict = index["orgs"]
+        self._framework: Optional[dict] = index["framework"]
+        self._matrices: dict[str, CultureMatrix] = {}
+        self._org_names = sorted(self._orgs)
+
+    @staticmethod
+    def _entry(entries: dict, name: str, kind: str) -> dict:
+        try:
+            entry: dict = entries[name]
+        except KeyError:
+            raise FileNotFoundError(f"{kind} not in bundle: {name}") from None
+        return entry
+
+    def _text(self, entry: dict) -> str:
+        offset, length = entry["blob"]
+        start = self._blobs_offset + offset
+        return self._mmap[start : start + length].decode("utf-8")
+
+    def scales(self) -> list[str]:
+        return sorted(self._culture)
+
+    def orgs(self) -> list[str]:
+        return self._org_names
+
+    def levels(self, scale: str) -> list[str]:
+        return list(self._entry(self._culture, scale, "Scale")["levels"])
+
+    def culture_matrix(self, scale: str) -> CultureMatrix:
+        matrix = self._matrices.get(scale)
+        if matrix is None:
+            compiled = json.loads(self._text(self._entry(self._culture, scale, "Scale")))
+            columns = tuple(
+                tuple(_MISSING if cell is None else cell for cell in column)
+                for column in compiled["columns"]
+            )
+            matrix = CultureMatrix(
+                tuple(sys.intern(attr) for attr in compiled["attributes"]),
+                tuple(sys.intern(level) for level in compiled["levels"]),
+                columns,
+            )
+            self._matrices[scale] = matrix
+        return matrix
+
+    def org_focus_areas(self, org_name: str) -> str:
+        return self._text(self._entry(self._orgs, org_name, "Org"))
+
+    def framework_prompt(self) -> str:
+        if self._framework is None:
+            raise FileNotFoundError("Framework prompt not in bundle")
+        return self._text(self._framework)
+
+    def culture_signature(self, scale: str) -> Optional[tuple[int, int]]:
+        return self._signature(self._culture.get(scale))
+
+    def org_signature(self, org_name: str) -> Optional[tuple[int, int]]:
+        return self._signature(self._orgs.get(org_name))
+
+    def framework_signature(self) -> Optional[tuple[int, int]]:
+        return self._signature(self._framework)
+
+    def signatures_in_memory(self) -> bool:
+        return True
+
+    @staticmethod
+    def _signature(entry: Optional[dict]) -> Optional[tuple[int, int]]:
+        return None if entry is None else tuple(entry["signature"])
+
+    def close(self) -> None:
+        self._matrices.clear()
+        self._mmap.close()
@@ -0,0 +1,215 @@
+"""In-process caches for parsed resource files and assembled prompts."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, Union
+
+PathLike = Union[str, Path]
+T = TypeVar("T")
+
+# Most file signatures a trusted ResourceCache memoizes. Paths are built from request inputs
+# (org and scale names), so the memo must be bounded; evicted paths are simply stat'ed again.
+SIGNATURE_MEMO_SIZE = 4096
+
+_UNKNOWN = object()
+
+
+def stat_signature(path: PathLike) -> Optional[tuple[int, int]]:
+    """Return the (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ResourceCache:
+    """
+    Holds parsed resource files in memory, revalidated with a cheap os.stat check.
+
+    Entries are keyed by (path, kind) so one file can be cached under several parsed
+    representations. A changed mtime or size triggers a re-parse on the next load, so
+    edits are picked up without a restart. Cached values are shared between callers
+    and must be treated as read-only.
+
+    In trusted mode (enabled by a ResourceWatcher) file signatures and directory listings
+    are memoized too (signatures in an LRU of SIGNATURE_MEMO_SIZE paths), so steady-state
+    loads make no filesystem calls at all; the watcher calls invalidate() when something on
+    disk changes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[tuple[int, int], Any]] = {}
+        self._signatures = LRUCache(maxsize=SIGNATURE_MEMO_SIZE)
+        self._listings: dict[tuple[str, str], list[Path]] = {}
+        # Bumped by invalidate() so a lookup racing with it never memoizes a stale result
+        self._generation = 0
+        self.trusted = False
+
+    def signature(self, path: PathLike) -> Optional[tuple[int, int]]:
+        """Return stat_signature(path), memoized while in trusted mode."""
+        if not self.trusted:
+            return stat_signature(path)
+        key = str(path)
+        memoized = self._signatures.get(key, _UNKNOWN)
+        if memoized is not _UNKNOWN:
+            signature: Optional[tuple[int, int]] = memoized
+            return signature
+        generation = self._generation
+        signature = stat_signature(path)
+        if generation == self._generation:
+            self._signatures.put(key, signature)
+        return signature
+
+    def listdir(self, directory: PathLike, pattern: str) -> list[Path]:
+        """Return sorted paths in directory matching a glob pattern, memoized while trusted."""
+        key = (str(directory), pattern)
+        if self.trusted and key in self._listings:
+            return self._listings[key]
+        generation = self._generation
+        paths = sorted(Path(directory).glob(pattern))
+        if self.trusted and generation == self._generation:
+            self._listings[key] = paths
+        return paths
+
+    def load(self, path: PathLike, parser: Callable[[Path], T], kind: str = "text") -> T:
+        """Return parser(path), re-parsing only when the file's signature changed."""
+        key = (str(path), kind)
+        signature = self.signature(path)
+        if signature is None:
+            self._entries.pop(key, None)
+            raise FileNotFoundError(f"Resource not found: {path}")
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            value: T = entry[1]
+            return value
+
+        value = parser(Path(path))
+        self._entries[key] = (signature, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Forget memoized signatures and listings; parsed entries revalidate on next load."""
+        self._generation += 1
+        self._signatures.clear()
+        self._listings.clear()
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe least-recently-used cache with hit/miss/eviction counters.
+
+    A maxsize of 0 disables caching: every lookup is a miss and nothing is stored.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key (marking it most recently used), or default."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries beyond maxsize."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """LRUCache whose entries also expire ttl seconds after they were stored."""
+
+    def __init__(
+        self, maxsize: int = 1024, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic
+    ):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self.expirations = 0
+        self._clock = clock
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key unless it has expired, or default."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store value under key for ttl seconds."""
+        super().put(key, (self._clock() + self.ttl, value))
+
+    def clear(self) -> None:
+        super().clear()
+        self.expirations = 0
+
+    def stats(self) -> dict:
+        """Return LRUCache.stats() plus the TTL and expired-entry count."""
+        stats = super().stats()
+        stats.update(ttl=self.ttl, expirations=self.expirations)
+        return stats
+
+
+# Process-wide cache shared by all resource loaders
+resource_cache = ResourceCache()
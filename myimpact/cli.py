@@ -1,36 +1,59 @@
-"""Command-line interface for MyImpact goal generator."""
+"""Command-line interface for MyImpact goal generator.
+
+The CLI runs thousands of times from shell pipelines, so startup stays cheap: this module
+imports only click, and the assembler (plus resource discovery) loads on first use inside
+the subcommand that needs it.
+"""
 
 import click
-from pathlib import Path
-from myimpact.assembler import (
-    load_culture_csv,
-    extract_levels_from_csv,
-    assemble_prompt,
-    _get_resource_dir,
-)
 
 GROWTH_INTENSITIES = ["minimal", "moderate", "aggressive"]
 GOAL_STYLES = ["independent", "progressive"]
 
 
+def assemble_prompt(*args, **kwargs) -> tuple[str, str]:
+    """Assemble (framework, user_context); see myimpact.assembler.assemble_prompt."""
+    from myimpact import assembler
+
+    return assembler.assemble_prompt(*args, **kwargs)
+
+
+def discover_scales() -> list[str]:
+    """Discover available scales from culture_expectations_*.csv files."""
+    from myimpact import assembler
+
+    return assembler.discover_scales()
+
+
+def extract_levels_from_csv(scale: str) -> list:
+    """Return the job levels defined for a scale."""
+    from myimpact import assembler
+
+    return assembler.extract_levels_from_csv(scale)
+
+
 def discover_org_names() -> list:
     """Discover available organizations from org_focus_areas_*.md files."""
-    prompts_dir = _get_resource_dir("prompts")
-    org_names = []
-    for file in prompts_dir.glob("org_focus_areas_*.md"):
-        org_name = file.stem.replace("org_focus_areas_", "")
-        org_names.append(org_name)
-    return sorted(org_names)
+    from myimpact import assembler
 
+    return assembler.discover_orgs()
 
-def discover_scales() -> list:
-    """Discover available scales from culture_expectations_*.csv files."""
-    data_dir = _get_resource_dir("data")
-    scales = []
-    for file in data_dir.glob("culture_expectations_*.csv"):
-        scale = file.stem.replace("culture_expectations_", "")
-        scales.append(scale)
-    return sorted(scales)
+
+def format_prompt(framework_prompt: str, user_prompt: str) -> str:
+    """Lay out a framework and user context the way `generate` prints them."""
+    rule = "=" * 80
+    return "\n".join(
+        [
+            rule,
+            "GOAL FRAMEWORK",
+            rule,
+            framework_prompt,
+            "\n" + rule,
+            "USER CONTEXT",
+            rule,
+            user_prompt,
+        ]
+    )
 
 
 @click.group()
@@ -51,9 +74,16 @@ def main():
     default="independent",
     help="Goal generation style",
 )
-def generate(scale, level, growth_intensity, org, focus_area, goal_style):
+@click.option(
+    "--max-tokens",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Estimated prompt token budget; org focus areas are condensed to fit",
+)
+def generate(scale, level, growth_intensity, org, focus_area, goal_style, max_tokens):
     """Generate a prompt for goal creation."""
     try:
+        budget = {"max_tokens": max_tokens} if max_tokens else {}
         framework_prompt, user_prompt = assemble_prompt(
             scale=scale,
             level=level,
@@ -61,20 +91,99 @@ def generate(scale, level, growth_intensity, org, focus_area, goal_style):
             org_name=org,
             focus_area=focus_area,
             goal_style=goal_style,
+            **budget,
         )
-        click.echo("=" * 80)
-        click.echo("GOAL FRAMEWORK")
-        click.echo("=" * 80)
-        click.echo(framework_prompt)
-        click.echo("\n" + "=" * 80)
-        click.echo("USER CONTEXT")
-        click.echo("=" * 80)
-        click.echo(user_prompt)
+        click.echo(format_prompt(framework_prompt, user_prompt))
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         raise click.exceptions.Exit(1)
 
 
+@main.command("generate-batch")
+@click.argument("roster", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Write one prompt file per roster entry into this directory",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    default=None,
+    help="Write all prompts to a single JSONL file (default: stdout)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Assemble in a pool of this many processes (for very large rosters)",
+)
+def generate_batch(roster, output_dir, output, workers):
+    """Generate prompts for every employee in a CSV or JSONL roster."""
+    import json
+    from collections import deque
+    from pathlib import Path
+
+    from myimpact.roster import assemble_roster, output_filename, read_roster
+
+    if output_dir and output:
+        raise click.UsageError("Use either --output-dir or --output, not both.")
+
+    pending = deque()
+
+    def requests():
+        for entry in read_roster(roster):
+            pending.append(entry)
+            yield entry.request
+
+    generated = failed = 0
+    last_framework = None
+    written = set()
+    try:
+        if output_dir:
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            jsonl = None
+        else:
+            jsonl = click.open_file(output or "-", "w", encoding="utf-8")
+        for result in assemble_roster(requests(), workers=workers):
+            entry = pending.popleft()
+            if isinstance(result, Exception):
+                failed += 1
+                click.echo(f"Error: {entry.id}: {result}", err=True)
+            else:
+                generated += 1
+            if jsonl is not None:
+                line = {"id": entry.id, "inputs": entry.request._asdict()}
+                if isinstance(result, Exception):
+                    line.update(user_context=None, error=str(result))
+                else:
+                    framework_prompt, line["user_context"] = result
+                    line["error"] = None
+                    if framework_prompt != last_framework:
+                        line["framework"] = last_framework = framework_prompt
+                jsonl.write(json.dumps(line, ensure_ascii=False) + "\n")
+            elif not isinstance(result, Exception):
+                filename = output_filename(entry.id)
+                if filename in written:
+                    raise ValueError(f"Roster ids collide on output file name {filename}")
+                written.add(filename)
+                (Path(output_dir) / filename).write_text(
+                    format_prompt(*result) + "\n", encoding="utf-8"
+                )
+        if jsonl is not None:
+            jsonl.close()
+    except (OSError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.exceptions.Exit(1)
+
+    click.echo(f"Generated {generated} prompts ({failed} failed)", err=True)
+    if failed:
+        raise click.exceptions.Exit(1)
+
+
 @main.command()
 def list_options():
     """List all available configuration options."""
@@ -111,5 +220,198 @@ def list_options():
     click.echo()
 
 
+@main.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="prompt_artifact.json.gz",
+    show_default=True,
+    help="Artifact file to write",
+)
+def materialize(output):
+    """Pre-render every no-focus-area prompt into an artifact the API can load at startup."""
+    from myimpact.materialize import materialize_prompts
+
+    try:
+        count = materialize_prompts(output)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.exceptions.Exit(1)
+    click.echo(f"Materialized {count} prompts to {output}")
+
+
+@main.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="resources.bundle",
+    show_default=True,
+    help="Bundle file to write",
+)
+def bundle(output):
+    """Compile data/ and prompts/ into one memory-mappable resource bundle."""
+    from myimpact.assembler import get_resource_store
+    from myimpact.bundle import build_bundle
+
+    try:
+        counts = build_bundle(output, get_resource_store())
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.exceptions.Exit(1)
+    click.echo(f"Bundled {counts['scales']} scales and {counts['orgs']} orgs to {output}")
+
+
+@main.command("export-sqlite")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="resources.db",
+    show_default=True,
+    help="SQLite database to write",
+)
+def export_sqlite(output):
+    """Copy data/ and prompts/ into an indexed SQLite resource database."""
+    from myimpact.assembler import get_resource_store
+    from myimpact.stores import build_sqlite_store
+
+    try:
+        counts = build_sqlite_store(output, get_resource_store())
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.exceptions.Exit(1)
+    click.echo(f"Exported {counts['scales']} scales and {counts['orgs']} orgs to {output}")
+
+
+@main.command()
+@click.option(
+    "--case",
+    "cases",
+    multiple=True,
+    help="Benchmark to run (repeatable; default: all)",
+)
+@click.option(
+    "--min-time",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.5,
+    show_default=True,
+    help="Seconds to spend timing each benchmark",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Baseline JSON to compare against; regressions exit with status 1",
+)
+@click.option(
+    "--save-baseline",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write these results as a baseline JSON file",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.4,
+    show_default=True,
+    help="Allowed fractional throughput drop or allocation growth against the baseline",
+)
+def bench(cases, min_time, baseline, save_baseline, tolerance):
+    """Benchmark resource loading, prompt assembly and the API hot paths."""
+    import os
+    import sys
+
+    from myimpact.bench import compare, format_results, load_baseline, run_benchmarks
+    from myimpact.bench import save_baseline as write_baseline
+
+    # Like serve, import the API app from the working directory
+    sys.path.insert(0, os.getcwd())
+    try:
+        expected = load_baseline(baseline) if baseline else None
+        results, skipped = run_benchmarks(cases or None, min_time=min_time)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.exceptions.Exit(1)
+
+    click.echo(format_results(results, expected))
+    for name in skipped:
+        click.echo(f"Skipped {name}: the API extras are not installed", err=True)
+    if save_baseline:
+        write_baseline(save_baseline, results)
+        click.echo(f"Saved baseline to {save_baseline}")
+    if expected is not None:
+        regressions = compare(results, expected, tolerance, names=cases or None)
+        for regression in regressions:
+            if regression.metric == "missing":
+                click.echo(f"REGRESSION {regression.name}: in the baseline but not run", err=True)
+                continue
+            click.echo(
+                f"REGRESSION {regression.name}: {regression.metric} "
+                f"{regression.baseline:,.1f} -> {regression.current:,.1f}",
+                err=True,
+            )
+        if regressions:
+            raise click.exceptions.Exit(1)
+
+
+@main.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Bind address")
+@click.option("--port", type=int, default=8000, show_default=True, help="Bind port")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of uvicorn worker processes",
+)
+def serve(host, port, workers):
+    """
+    Run the API with resources compiled once and shared by every worker.
+
+    Unless MYIMPACT_RESOURCE_BUNDLE already names a bundle, the resources are compiled into a
+    temporary bundle before the workers start. Each worker memory-maps that one file read-only,
+    so the resource bytes are held once in the page cache however many workers run. With
+    MYIMPACT_RESOURCE_DB set the workers serve that database instead, which the page cache
+    already shares, so no bundle is built.
+    """
+    import os
+    import sys
+    import tempfile
+
+    try:
+        import uvicorn
+    except ImportError:
+        click.echo('Error: the API extras are not installed (pip install -e ".[api]")', err=True)
+        raise click.exceptions.Exit(1)
+    from myimpact.assembler import get_resource_store
+    from myimpact.bundle import build_bundle
+
+    temporary_bundle = None
+    if not os.environ.get("MYIMPACT_RESOURCE_BUNDLE") and not os.environ.get(
+        "MYIMPACT_RESOURCE_DB"
+    ):
+        fd, temporary_bundle = tempfile.mkstemp(prefix="myimpact-", suffix=".bundle")
+        os.close(fd)
+        try:
+            build_bundle(temporary_bundle, get_resource_store())
+        except Exception as e:
+            os.unlink(temporary_bundle)
+            click.echo(f"Error: {e}", err=True)
+            raise click.exceptions.Exit(1)
+        # Inherited by the worker processes uvicorn spawns
+        os.environ["MYIMPACT_RESOURCE_BUNDLE"] = temporary_bundle
+
+    # Like the uvicorn CLI, import the app from the working directory
+    sys.path.insert(0, os.getcwd())
+    try:
+        uvicorn.run("api.main:app", host=host, port=port, workers=workers)
+    finally:
+        if temporary_bundle is not None:
+            del os.environ["MYIMPACT_RESOURCE_BUNDLE"]
+            os.unlink(temporary_bundle)
+
+
 if __name__ == "__main__":
     main()
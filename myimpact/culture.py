@@ -0,0 +1,90 @@
+"""Compiled, level-indexed representation of culture expectations."""
+
+import sys
+from typing import Optional
+
+# Marks a (level, attribute) cell that is absent from the source data
+_MISSING = object()
+
+
+class CultureMatrix:
+    """
+    Culture expectations for one scale, stored column-major by level.
+
+    Attribute and level names are interned and mapped to integer indexes. Each level's column
+    holds its expectations in attribute order, so fetching every expectation for one level is
+    a single dict lookup. The markdown bullet block for each level is rendered once at compile
+    time and reused by every prompt that needs it.
+    """
+
+    __slots__ = ("attributes", "levels", "attribute_index", "level_index", "_columns", "_bullets")
+
+    def __init__(self, attributes: tuple, levels: tuple, columns: tuple):
+        self.attributes = attributes
+        self.levels = levels
+        self.attribute_index = {attr: i for i, attr in enumerate(attributes)}
+        self.level_index = {level: j for j, level in enumerate(levels)}
+        self._columns: tuple[tuple, ...] = columns
+        self._bullets = tuple(self._render_bullets(column) for column in columns)
+
+    def _render_bullets(self, column: tuple) -> str:
+        return "\n".join(
+            [
+                f"- **{attr}**: {expectation}"
+                for attr, expectation in zip(self.attributes, column)
+                if expectation is not _MISSING
+            ]
+        )
+
+    def column(self, level: str) -> Optional[tuple]:
+        """Return the expectations for a level in attribute order, or None if unknown."""
+        j = self.level_index.get(level)
+        if j is None:
+            return None
+        return self._columns[j]
+
+    def expectations(self, level: str) -> dict:
+        """Return {attribute: expectation} for a level (empty dict if unknown)."""
+        column = self.column(level)
+        if column is None:
+            return {}
+        return {
+            attr: expectation
+            for attr, expectation in zip(self.attributes, column)
+            if expectation is not _MISSING
+        }
+
+    def as_dict(self) -> dict:
+        """Return the {attribute: {level: expectation}} mapping the matrix was compiled from."""
+        return {
+            attr: {
+                level: column[i]
+                for level, column in zip(self.levels, self._columns)
+                if column[i] is not _MISSING
+            }
+            for i, attr in enumerate(self.attributes)
+        }
+
+    def bullets(self, level: str) -> str:
+        """Return the pre-rendered markdown bullet block for a level ('' if unknown)."""
+        j = self.level_index.get(level)
+        if j is None:
+            return ""
+        return self._bullets[j]
+
+
+def compile_culture_matrix(culture: dict) -> CultureMatrix:
+    """Compile a parsed {attribute: {level: expectation}} mapping into a CultureMatrix."""
+    attributes = tuple(sys.intern(attr) for attr in culture)
+    levels = []
+    seen = set()
+    for row in culture.values():
+        for level in row:
+            if isinstance(level, str) and level not in seen:
+                seen.add(level)
+                levels.append(sys.intern(level))
+
+    columns = tuple(
+        tuple(culture[attr].get(level, _MISSING) for attr in culture) for level in levels
+    )
+    return CultureMatrix(attributes, tuple(levels), columns)
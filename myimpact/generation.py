@@ -0,0 +1,312 @@
+"""Server-side goal generation: LLM providers that turn an assembled prompt into goals.
+
+The API stays prompts-only unless a provider is configured (see provider_from_env()).
+StubProvider answers deterministically without a network, for tests and local demos;
+OpenAICompatibleProvider calls an OpenAI-style chat completions endpoint (OpenAI, Azure OpenAI,
+or any compatible gateway) through one pooled httpx.AsyncClient.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Mapping, NamedTuple, Optional, Union
+
+from myimpact.tokens import estimate_prompt_tokens, estimate_tokens
+
+
+class GenerationResult(NamedTuple):
+    """Generated goals and what produced them; returned as the API's result payload."""
+
+    content: str
+    model: str
+    usage: Optional[dict] = None
+
+
+class GenerationError(Exception):
+    """A provider failed or timed out; status_code is the HTTP status to report."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class LLMProvider(ABC):
+    """
+    Base class for generation providers.
+
+    Subclasses implement _complete(), and _stream() when they can stream. generate() bounds
+    how many completions run at once (callers beyond max_concurrency wait for a slot) and how
+    long one call may take, including that wait. stream() shares the same slots.
+    """
+
+    name = "llm"
+
+    def __init__(self, model: str, max_concurrency: int = 8, timeout: float = 60.0):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    def sampling_params(self) -> dict:
+        """Return the sampling parameters sent with every completion (part of cache keys)."""
+        return {}
+
+    @abstractmethod
+    async def _complete(self, framework: str, user_context: str) -> GenerationResult:
+        raise NotImplementedError
+
+    async def _stream(
+        self, framework: str, user_context: str
+    ) -> AsyncIterator[Union[str, GenerationResult]]:
+        # Providers that cannot stream send the whole completion as one chunk
+        result = await self._complete(framework, user_context)
+        yield result.content
+        yield result
+
+    async def _limited(self, framework: str, user_context: str) -> GenerationResult:
+        async with self._slots:
+            return await self._complete(framework, user_context)
+
+    async def generate(self, framework: str, user_context: str) -> GenerationResult:
+        """Generate goals for a (framework, user_context) prompt."""
+        try:
+            return await asyncio.wait_for(self._limited(framework, user_context), self.timeout)
+        except asyncio.TimeoutError:
+            raise GenerationError(504, f"{self.name} timed out after {self.timeout:g}s") from None
+
+    async def stream(
+        self, framework: str, user_context: str
+    ) -> AsyncIterator[Union[str, GenerationResult]]:
+        """
+        Generate goals for a prompt, yielding text chunks as they are produced and finally the
+        complete GenerationResult. The wait for a concurrency slot is bounded by timeout; once
+        streaming, HTTP providers bound each read by it instead of the whole completion.
+        """
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise GenerationError(504, f"{self.name} timed out after {self.timeout:g}s") from None
+        try:
+            async for item in self._stream(framework, user_context):
+                yield item
+        finally:
+            self._slots.release()
+
+    async def aclose(self) -> None:
+        """Release connections; call once when the application shuts down."""
+
+
+_PROMPT_FIELD = re.compile(r"^\*\*(Job Level|Goal Style)\*\*: (.+)$", re.MULTILINE)
+
+
+class StubProvider(LLMProvider):
+    """
+    Offline provider whose goals are a pure function of the prompt: the same prompt always
+    yields the same text. Progressive prompts get four quarterly goals, others six. Streams
+    one goal line per chunk, each after delay seconds.
+    """
+
+    name = "stub"
+
+    def __init__(self, model: str = "stub", delay: float = 0.0, **kwargs):
+        super().__init__(model, **kwargs)
+        self.delay = delay
+
+    def goals(self, framework: str, user_context: str) -> list[str]:
+        """Return the goals this provider generates for a prompt, one line each."""
+        fields = dict(_PROMPT_FIELD.findall(user_context))
+        level = fields.get("Job Level", "your level")
+        progressive = fields.get("Goal Style") == "progressive"
+        digest = hashlib.sha256(f"{framework}\0{user_context}".encode("utf-8")).hexdigest()
+        return [
+            f"{index}. {f'Q{index}: ' if progressive else ''}Goal {index} for {level} "
+            f"(stub {digest[index * 4 : index * 4 + 8]})"
+            for index in range(1, 5 if progressive else 7)
+        ]
+
+    def _result(self, framework: str, user_context: str, content: str) -> GenerationResult:
+        usage = {
+            "prompt_tokens": estimate_prompt_tokens(framework, user_context),
+            "completion_tokens": estimate_tokens(content),
+        }
+        return GenerationResult(content, self.model, usage)
+
+    async def _complete(self, framework: str, user_context: str) -> GenerationResult:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        content = "\n".join(self.goals(framework, user_context)) + "\n"
+        return self._result(framework, user_context, content)
+
+    async def _stream(
+        self, framework: str, user_context: str
+    ) -> AsyncIterator[Union[str, GenerationResult]]:
+        chunks = []
+        for goal in self.goals(framework, user_context):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            chunks.append(f"{goal}\n")
+            yield chunks[-1]
+        yield self._result(framework, user_context, "".join(chunks))
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Provider for OpenAI-style chat completions APIs. Requests share one httpx.AsyncClient whose
+    connection pool is sized to max_concurrency, so keep-alive connections are reused.
+    """
+
+    name = "openai"
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, str]] = None,
+        temperature: float = 0.9,
+        max_concurrency: int = 8,
+        timeout: float = 60.0,
+        transport=None,
+    ):
+        import httpx
+
+        super().__init__(model, max_concurrency, timeout)
+        self.temperature = temperature
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency, max_keepalive_connections=max_concurrency
+            ),
+            transport=transport,
+        )
+
+    def sampling_params(self) -> dict:
+        return {"temperature": self.temperature}
+
+    def _body(self, framework: str, user_context: str) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": framework},
+                {"role": "user", "content": user_context},
+            ],
+            **self.sampling_params(),
+        }
+
+    async def _complete(self, framework: str, user_context: str) -> GenerationResult:
+        import httpx
+
+        body = self._body(framework, user_context)
+        try:
+            response = await self._client.post("/chat/completions", json=body)
+        except httpx.TimeoutException:
+            raise GenerationError(504, f"{self.name} timed out after {self.timeout:g}s") from None
+        except httpx.HTTPError as e:
+            raise GenerationError(502, f"{self.name} request failed: {e}") from None
+        if response.status_code >= 400:
+            raise GenerationError(
+                502, f"{self.name} returned {response.status_code}: {response.text[:200]}"
+            )
+        try:
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            raise GenerationError(502, f"{self.name} returned an unexpected response") from None
+        return GenerationResult(content, data.get("model") or self.model, data.get("usage"))
+
+    async def _stream(
+        self, framework: str, user_context: str
+    ) -> AsyncIterator[Union[str, GenerationResult]]:
+        import httpx
+
+        body = {**self._body(framework, user_context), "stream": True}
+        chunks = []
+        model = usage = None
+        try:
+            async with self._client.stream("POST", "/chat/completions", json=body) as response:
+                if response.status_code >= 400:
+                    text = (await response.aread()).decode("utf-8", "replace")
+                    raise GenerationError(
+                        502, f"{self.name} returned {response.status_code}: {text[:200]}"
+                    )
+                # Server-sent events: one "data: {chunk}" line per delta, then "data: [DONE]"
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        event = json.loads(data)
+                        model = event.get("model") or model
+                        usage = event.get("usage") or usage
+                        choices = event.get("choices") or [{}]
+                        content = (choices[0].get("delta") or {}).get("content")
+                    except (ValueError, AttributeError, TypeError):
+                        raise GenerationError(
+                            502, f"{self.name} returned an unexpected response"
+                        ) from None
+                    if content:
+                        chunks.append(content)
+                        yield content
+        except httpx.TimeoutException:
+            raise GenerationError(504, f"{self.name} timed out after {self.timeout:g}s") from None
+        except httpx.HTTPError as e:
+            raise GenerationError(502, f"{self.name} request failed: {e}") from None
+        yield GenerationResult("".join(chunks), model or self.model, usage)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def provider_from_env(environ: Mapping[str, str] = os.environ) -> Optional[LLMProvider]:
+    """
+    Build the provider named by MYIMPACT_LLM_PROVIDER, or None (prompts-only) when unset.
+
+    - stub: StubProvider
+    - openai: MYIMPACT_LLM_BASE_URL (default https://api.openai.com/v1), MYIMPACT_LLM_API_KEY,
+      MYIMPACT_LLM_MODEL (default gpt-4o-mini)
+    - azure: AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_KEY, AZURE_OPENAI_DEPLOYMENT,
+      AZURE_OPENAI_API_VERSION
+
+    Every provider honors MYIMPACT_LLM_MAX_CONCURRENCY (default 8) and MYIMPACT_LLM_TIMEOUT
+    (seconds, default 60); HTTP providers also GEN_TEMPERATURE (default 0.9).
+    """
+    kind = environ.get("MYIMPACT_LLM_PROVIDER", "").strip().lower()
+    if not kind:
+        return None
+    max_concurrency = int(environ.get("MYIMPACT_LLM_MAX_CONCURRENCY", "8"))
+    timeout = float(environ.get("MYIMPACT_LLM_TIMEOUT", "60"))
+    if kind == "stub":
+        return StubProvider(max_concurrency=max_concurrency, timeout=timeout)
+
+    temperature = float(environ.get("GEN_TEMPERATURE", "0.9"))
+    if kind == "openai":
+        return OpenAICompatibleProvider(
+            environ.get("MYIMPACT_LLM_BASE_URL", "https://api.openai.com/v1"),
+            environ.get("MYIMPACT_LLM_MODEL", "gpt-4o-mini"),
+            headers={"Authorization": f"Bearer {environ.get('MYIMPACT_LLM_API_KEY', '')}"},
+            temperature=temperature,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+        )
+    if kind == "azure":
+        deployment = environ["AZURE_OPENAI_DEPLOYMENT"]
+        provider = OpenAICompatibleProvider(
+            f"{environ['AZURE_OPENAI_ENDPOINT'].rstrip('/')}/openai/deployments/{deployment}",
+            deployment,
+            headers={"api-key": environ.get("AZURE_OPENAI_API_KEY", "")},
+            params={"api-version": environ.get("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")},
+            temperature=temperature,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+        )
+        provider.name = "azure-openai"
+        return provider
+    raise ValueError(f"Unknown MYIMPACT_LLM_PROVIDER: {kind!r} (expected stub, openai or azure)")
@@ -0,0 +1,129 @@
+"""Ahead-of-time materialization of every no-focus-area prompt into a compact artifact.
+
+The artifact is gzip-compressed JSON holding the framework text once, one user context per
+option combination, and the os.stat signature of every resource file it was built from.
+Loading it seeds the assembler's prompt cache, so the first request after a cold start is a
+cache hit. Entries whose source files have changed since the build are skipped, which means
+the artifact must be built from the same files (with the same mtimes) that will be served,
+e.g. in the container image build.
+"""
+
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Union
+
+from myimpact import assembler
+from myimpact.assembler import (
+    PromptRequest,
+    _culture_csv_path,
+    _framework_prompt_path,
+    _org_focus_areas_path,
+    assemble_prompt,
+    iter_prompt_grid,
+    prompt_cache,
+    resource_fingerprint,
+)
+
+ARTIFACT_FORMAT = 1
+
+logger = logging.getLogger(__name__)
+
+
+def _source_key(path: Path) -> str:
+    """Identify a resource file by its path relative to the package root."""
+    # Looked up at call time, like the path helpers, so the resource root can be relocated
+    return path.relative_to(assembler._get_resource_dir("data").parent).as_posix()
+
+
+def _recorded_fingerprint(sources: dict, scale: str, org_name: str) -> tuple:
+    """Rebuild the resource_fingerprint() a prompt had when the artifact was built."""
+    paths = (_culture_csv_path(scale), _org_focus_areas_path(org_name), _framework_prompt_path())
+    recorded = []
+    for path in paths:
+        signature = sources.get(_source_key(path))
+        recorded.append(tuple(signature) if signature is not None else None)
+    return tuple(recorded)
+
+
+def materialize_prompts(output_path: Union[str, Path]) -> int:
+    """
+    Pre-render every no-focus-area prompt and write them to a compact artifact.
+    Returns the number of prompts written.
+    """
+    framework = None
+    entries = []
+    sources = {}
+    for request in iter_prompt_grid():
+        framework, user_context = assemble_prompt(*request)
+        entries.append(
+            [
+                request.scale,
+                request.level,
+                request.growth_intensity,
+                request.org_name,
+                request.goal_style,
+                user_context,
+            ]
+        )
+        paths = (
+            _culture_csv_path(request.scale),
+            _org_focus_areas_path(request.org_name),
+            _framework_prompt_path(),
+        )
+        for path, signature in zip(paths, resource_fingerprint(request.scale, request.org_name)):
+            if signature is not None:
+                sources[_source_key(path)] = list(signature)
+
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "sources": sources,
+        "framework": framework,
+        "entries": entries,
+    }
+    payload = json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with gzip.open(output_path, "wb", compresslevel=9) as f:
+        f.write(payload)
+    return len(entries)
+
+
+def load_prompt_artifact(path: Union[str, Path]) -> int:
+    """
+    Seed the prompt cache from an artifact written by materialize_prompts().
+    Returns the number of prompts loaded; stale entries are skipped.
+
+    prompt_cache grows by the number of fresh entries, so the whole grid stays cached and the
+    configured size remains for prompts assembled at runtime. A disabled cache (size 0) is
+    left disabled and nothing is loaded.
+    """
+    with gzip.open(path, "rb") as f:
+        artifact = json.loads(f.read().decode("utf-8"))
+
+    if artifact.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"Unsupported prompt artifact format: {artifact.get('format')}")
+
+    framework = artifact["framework"]
+    sources = artifact["sources"]
+    fresh = []
+    skipped = 0
+    for scale, level, growth_intensity, org_name, goal_style, user_context in artifact["entries"]:
+        fingerprint = resource_fingerprint(scale, org_name)
+        if fingerprint != _recorded_fingerprint(sources, scale, org_name):
+            skipped += 1
+            continue
+        request = PromptRequest(scale, level, growth_intensity, org_name, None, goal_style)
+        fresh.append(((request, fingerprint), (framework, user_context)))
+
+    if skipped:
+        logger.warning("Skipped %d stale prompts from artifact %s", skipped, path)
+    if prompt_cache.maxsize > 0:
+        prompt_cache.maxsize += len(fresh)
+    for key, prompt in fresh:
+        prompt_cache.put(key, prompt)
+    loaded = sum(1 for key, _ in fresh if key in prompt_cache)
+    if loaded < len(fresh):
+        logger.warning(
+            "Prompt cache kept %d of %d prompts from artifact %s", loaded, len(fresh), path
+        )
+    return loaded
@@ -0,0 +1,91 @@
+"""Process-pool prompt assembly for large offline batches.
+
+Prompt assembly is pure-Python string work, so threads cannot use more than one core. This
+engine fans requests out to worker processes instead. Each worker compiles every culture matrix,
+org section and the framework prompt once in its initializer. Requests travel in chunks to
+amortize pickling and IPC. Workers send back only the user contexts plus the framework text once
+per chunk, and results are yielded in input order.
+
+Workers resolve resource files the same way the parent does, from the package's data/ and
+prompts/ directories.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from myimpact.assembler import (
+    PromptRequest,
+    _load_org_section,
+    assemble_prompts,
+    discover_orgs,
+    discover_scales,
+    load_culture_matrix,
+    load_framework_prompt,
+)
+
+# Requests sent to a worker per round trip
+CHUNK_SIZE = 256
+
+
+def _init_worker() -> None:
+    """Pre-load compiled resources so a worker's first chunk pays no parsing cost."""
+    for scale in discover_scales():
+        load_culture_matrix(scale)
+    for org_name in discover_orgs():
+        _load_org_section(org_name)
+    try:
+        load_framework_prompt()
+    except FileNotFoundError:
+        # Requests will report the missing file individually
+        pass
+
+
+def _assemble_chunk(requests: list[PromptRequest]) -> tuple[Optional[str], list]:
+    """
+    Assemble a chunk in a worker. Returns (framework, results) where each result is the
+    user_context string or the exception raised for that request.
+    """
+    framework = None
+    results = []
+    for result in assemble_prompts(requests):
+        if isinstance(result, Exception):
+            results.append(result)
+        else:
+            framework, user_context = result
+            results.append(user_context)
+    return framework, results
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def assemble_parallel(
+    requests: Iterable[PromptRequest],
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator:
+    """
+    Assemble prompts in a pool of worker processes (default: one per CPU).
+    Yields one entry per request, in input order: the (framework, user_context) tuple, or the
+    exception raised while assembling that request. Input is consumed lazily, with at most two
+    chunks per worker in flight.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(requests, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = deque(
+            executor.submit(_assemble_chunk, chunk) for chunk in islice(chunks, 2 * workers)
+        )
+        while pending:
+            framework, results = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_assemble_chunk, chunk))
+            for result in results:
+                yield result if isinstance(result, Exception) else (framework, result)
@@ -0,0 +1,218 @@
+"""Response cache for generated goals, so repeating a request does not repeat the LLM call.
+
+Entries are content-addressed: the key hashes everything that determines a completion (the
+framework, the user context, the provider and model, and its sampling parameters). They
+expire after a TTL and the cache is bounded in size. Two backends share the get/put/stats
+interface: an in-process TTLCache (per worker) and SQLiteResponseCache, a file every worker
+and restart shares.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import AsyncIterator, Mapping, Optional, Union
+
+from myimpact import aio
+from myimpact.cache import TTLCache
+from myimpact.generation import GenerationResult, LLMProvider
+
+
+def response_cache_key(
+    framework: str, user_context: str, provider: str, model: str, params: Mapping
+) -> str:
+    """Return the content hash identifying one completion request."""
+    material = json.dumps(
+        [framework, user_context, provider, model, dict(params)],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+
+class SQLiteResponseCache:
+    """
+    Response cache in a SQLite database, shared by every process that opens the same file.
+
+    Values must be JSON-serializable. Expired rows are skipped on lookup and purged on write;
+    beyond maxsize rows the oldest are evicted first. Times are wall-clock so that processes
+    agree on expiry.
+    """
+
+    # Calls wait on disk and on other processes' write locks, so event loops must not make them
+    blocking = True
+
+    def __init__(
+        self, path: Union[str, Path], maxsize: int = 1024, ttl: float = 300.0, clock=time.time
+    ):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SQLITE_SCHEMA)
+
+    def get(self, key: str, default=None):
+        """Return the cached value for key unless it has expired, or default."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value) -> None:
+        """Store value under key for ttl seconds, purging expired and evicting old rows."""
+        if self.maxsize <= 0:
+            return
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now + self.ttl),
+            )
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if size > self.maxsize:
+                evicted = self._connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY created_at LIMIT ?)",
+                    (size - self.maxsize,),
+                ).rowcount
+                self.evictions += evicted
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return size, limits and this process's hit/miss/eviction counters."""
+        with self._lock:
+            (size,) = self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+            return {
+                "size": size,
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class CachingProvider(LLMProvider):
+    """
+    Wraps a provider with a response cache: a request whose key is cached is answered from the
+    cache, any other goes to the provider and its result is stored. Failures are not cached.
+    Caches with a true blocking attribute are called through the I/O pool (myimpact.aio).
+    """
+
+    def __init__(self, provider: LLMProvider, cache):
+        self.provider = provider
+        self.cache = cache
+        self.name = provider.name
+        self.model = provider.model
+        self.max_concurrency = provider.max_concurrency
+        self.timeout = provider.timeout
+
+    def cache_key(self, framework: str, user_context: str) -> str:
+        return response_cache_key(
+            framework, user_context, self.name, self.model, self.provider.sampling_params()
+        )
+
+    def sampling_params(self) -> dict:
+        return self.provider.sampling_params()
+
+    async def _complete(self, framework: str, user_context: str) -> GenerationResult:
+        return await self.provider._complete(framework, user_context)
+
+    async def _cache_get(self, key: str) -> Optional[dict]:
+        # Blocking backends (SQLite) run in the I/O pool so a locked database cannot stall the loop
+        if getattr(self.cache, "blocking", False):
+            return await aio.run_blocking(self.cache.get, key)
+        cached: Optional[dict] = self.cache.get(key)
+        return cached
+
+    async def _cache_put(self, key: str, value: dict) -> None:
+        if getattr(self.cache, "blocking", False):
+            await aio.run_blocking(self.cache.put, key, value)
+        else:
+            self.cache.put(key, value)
+
+    async def generate(self, framework: str, user_context: str) -> GenerationResult:
+        key = self.cache_key(framework, user_context)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return GenerationResult(**cached)
+        result = await self.provider.generate(framework, user_context)
+        await self._cache_put(key, result._asdict())
+        return result
+
+    async def stream(
+        self, framework: str, user_context: str
+    ) -> AsyncIterator[Union[str, GenerationResult]]:
+        key = self.cache_key(framework, user_context)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            result = GenerationResult(**cached)
+            yield result.content
+            yield result
+            return
+        async for item in self.provider.stream(framework, user_context):
+            if isinstance(item, GenerationResult):
+                await self._cache_put(key, item._asdict())
+            yield item
+
+    async def aclose(self) -> None:
+        await self.provider.aclose()
+        close = getattr(self.cache, "close", None)
+        if close is not None:
+            close()
+
+
+def response_cache_from_env(environ: Mapping[str, str] = os.environ):
+    """
+    Build the response cache configured by the environment, or None when disabled.
+
+    MYIMPACT_RESPONSE_CACHE_TTL (seconds, default 300; 0 disables) and
+    MYIMPACT_RESPONSE_CACHE_SIZE (default 1024) apply to both backends. With
+    MYIMPACT_RESPONSE_CACHE_DB the cache is that SQLite file, else it is in-process.
+    """
+    ttl = float(environ.get("MYIMPACT_RESPONSE_CACHE_TTL", "300"))
+    maxsize = int(environ.get("MYIMPACT_RESPONSE_CACHE_SIZE", "1024"))
+    if ttl <= 0 or maxsize <= 0:
+        return None
+    database_path: Optional[str] = environ.get("MYIMPACT_RESPONSE_CACHE_DB")
+    if database_path:
+        return SQLiteResponseCache(database_path, maxsize=maxsize, ttl=ttl)
+    return TTLCache(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,122 @@
+"""Roster files for bulk prompt generation: one employee's prompt inputs per row.
+
+A roster is either CSV with a header row or JSONL with one object per line. Recognized columns
+are scale, level, growth_intensity (or intensity), org (or org_name), goal_style (or style),
+focus_area (or focus) and an optional id used to name output files. Only scale, level and
+growth_intensity are required; the rest fall back to the `generate` command's defaults.
+"""
+
+import csv
+import json
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from myimpact.assembler import (
+    GOAL_STYLES,
+    GROWTH_INTENSITIES,
+    PromptRequest,
+    iter_assemble_prompts,
+    normalize_prompt_request,
+)
+from myimpact.parallel import assemble_parallel
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+_COLUMN_ALIASES = {
+    "intensity": "growth_intensity",
+    "org": "org_name",
+    "style": "goal_style",
+    "focus": "focus_area",
+}
+_REQUIRED_COLUMNS = ("scale", "level", "growth_intensity")
+
+
+class RosterEntry(NamedTuple):
+    """One roster row: its identifier (explicit id or 1-based row number) and prompt inputs."""
+
+    id: str
+    request: PromptRequest
+
+
+def _column_name(name: str) -> str:
+    key = re.sub(r"[\s-]+", "_", name.strip().lower())
+    return _COLUMN_ALIASES.get(key, key)
+
+
+def _iter_rows(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() in JSONL_SUFFIXES:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON: {e.msg}") from None
+                if not isinstance(row, dict):
+                    raise ValueError(f"{path}:{line_number}: expected a JSON object")
+                yield row
+        else:
+            yield from csv.DictReader(f)
+
+
+def _entry_from_row(row: dict, row_number: int) -> RosterEntry:
+    values = {}
+    for name, value in row.items():
+        if name is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        if value not in (None, ""):
+            values[_column_name(name)] = str(value)
+
+    missing = [column for column in _REQUIRED_COLUMNS if column not in values]
+    if missing:
+        raise ValueError(f"Roster row {row_number}: missing {', '.join(missing)}")
+    request = normalize_prompt_request(
+        scale=values["scale"],
+        level=values["level"],
+        growth_intensity=values["growth_intensity"],
+        org_name=values.get("org_name", "demo"),
+        focus_area=values.get("focus_area"),
+        goal_style=values.get("goal_style", "independent"),
+    )
+    if request.growth_intensity not in GROWTH_INTENSITIES:
+        raise ValueError(
+            f"Roster row {row_number}: invalid growth_intensity '{request.growth_intensity}'"
+        )
+    if request.goal_style not in GOAL_STYLES:
+        raise ValueError(f"Roster row {row_number}: invalid goal_style '{request.goal_style}'")
+    return RosterEntry(values.get("id", str(row_number)), request)
+
+
+def read_roster(path: Union[str, Path]) -> Iterator[RosterEntry]:
+    """
+    Lazily read a CSV or JSONL roster (chosen by file suffix).
+    Raises ValueError naming the row for malformed rows and duplicate ids.
+    """
+    seen = set()
+    for row_number, row in enumerate(_iter_rows(Path(path)), start=1):
+        entry = _entry_from_row(row, row_number)
+        if entry.id in seen:
+            raise ValueError(f"Roster row {row_number}: duplicate id '{entry.id}'")
+        seen.add(entry.id)
+        yield entry
+
+
+def assemble_roster(requests: Iterable[PromptRequest], workers: Optional[int] = None) -> Iterator:
+    """
+    Assemble prompts for roster requests in order, yielding each (framework, user_context)
+    or the exception raised for that request. With workers > 1 the requests are assembled
+    by the process-pool engine in myimpact.parallel.
+    """
+    if workers and workers > 1:
+        return assemble_parallel(requests, workers=workers)
+    return iter_assemble_prompts(requests, return_exceptions=True)
+
+
+def output_filename(entry_id: str) -> str:
+    """Return a filesystem-safe file name for a roster entry's prompt."""
+    name = re.sub(r"[^\w.-]+", "_", entry_id).strip("._")
+    return f"{name or 'prompt'}.txt"
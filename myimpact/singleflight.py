@@ -0,0 +1,46 @@
+"""Request coalescing: concurrent identical calls share one in-flight result."""
+
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent async calls by key. The first caller for a key starts the work; callers
+    arriving with the same key while it runs await the same task instead of repeating it, and
+    all of them get its result or exception. Nothing is kept once the task finishes, so this
+    complements a cache rather than replacing one.
+
+    The shared task is shielded: a caller that is cancelled (say, its client disconnected)
+    stops waiting without cancelling the work for the others. Use from one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        """Return await work(), or the result of the call already in flight for key."""
+        self.calls += 1
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(work())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception retrieved even if every caller was cancelled before it arrived
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> dict:
+        """Return calls made, calls that joined one already in flight, and keys in flight."""
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._in_flight)}
@@ -0,0 +1,472 @@
+"""Resource stores: where the assembler reads culture scales, org focus areas and the framework.
+
+FilesystemStore reads the data/ and prompts/ directories (the default). SQLiteStore serves
+the same resources from an indexed database, for catalogs too large to glob. A compiled
+ResourceBundle (see myimpact.bundle) is a store too.
+"""
+
+import bisect
+import csv
+import itertools
+import json
+import sqlite3
+import sys
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Union
+
+from myimpact.cache import ResourceCache, resource_cache
+from myimpact.culture import _MISSING, CultureMatrix, compile_culture_matrix
+
+Signature = Optional[tuple[int, int]]
+
+
+class ResourceStore(ABC):
+    """
+    Source of every resource the assembler reads.
+
+    Looking up a resource the store does not hold raises FileNotFoundError. Signatures are
+    version tokens, None for an absent resource, that change whenever the resource changes;
+    they key the prompt and metadata caches. Stores that copy resources from files keep the
+    files' (mtime_ns, size) signatures, so cache keys and prebuilt prompt artifacts carry over.
+    """
+
+    @abstractmethod
+    def scales(self) -> list[str]:
+        """Return the available scale names, sorted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def orgs(self) -> list[str]:
+        """Return the available organization names, sorted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def levels(self, scale: str) -> list[str]:
+        """Return a scale's job levels, sorted."""
+        raise NotImplementedError
+
+    def culture(self, scale: str) -> dict:
+        """Return {attribute: {level: expectation}} for a scale."""
+        return self.culture_matrix(scale).as_dict()
+
+    @abstractmethod
+    def culture_matrix(self, scale: str) -> CultureMatrix:
+        """Return the compiled culture matrix for a scale."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def org_focus_areas(self, org_name: str) -> str:
+        """Return an org's focus areas markdown."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def framework_prompt(self) -> str:
+        """Return the goal generation framework text."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def culture_signature(self, scale: str) -> Signature:
+        raise NotImplementedError
+
+    @abstractmethod
+    def org_signature(self, org_name: str) -> Signature:
+        raise NotImplementedError
+
+    @abstractmethod
+    def framework_signature(self) -> Signature:
+        raise NotImplementedError
+
+    def signatures_in_memory(self) -> bool:
+        """True when signature lookups are answered from memory, without file or database I/O."""
+        return False
+
+    def org_page(self, prefix: str = "", after: Optional[str] = None, limit: int = 50) -> list[str]:
+        """
+        Return up to limit org names starting with prefix, in sorted order, skipping every name
+        up to and including after.
+        """
+        names = self.orgs()
+        start = bisect.bisect_left(names, prefix)
+        if after is not None:
+            start = max(start, bisect.bisect_right(names, after))
+        page = []
+        for org_name in itertools.islice(names, start, start + limit):
+            if not org_name.startswith(prefix):
+                break
+            page.append(org_name)
+        return page
+
+    def scale_fingerprint(self) -> tuple:
+        """Return ((scale, signature), ...) for every culture scale."""
+        return tuple((scale, self.culture_signature(scale)) for scale in self.scales())
+
+    def org_fingerprint(self) -> tuple:
+        """Return ((org, signature), ...) for every org."""
+        return tuple((org_name, self.org_signature(org_name)) for org_name in self.orgs())
+
+    def catalog_fingerprint(self) -> tuple:
+        """Return scale_fingerprint(), org_fingerprint() for the whole catalog."""
+        return self.scale_fingerprint(), self.org_fingerprint()
+
+
+def _parse_culture_csv(csv_path: Path) -> dict:
+    """Parse a culture expectations CSV into {attribute: {level: expectation}}."""
+    culture = {}
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            attr_name = row.get("Cultural Attribute", "").strip()
+            if not attr_name:  # Skip empty rows
+                continue
+            # A short row leaves its trailing cells None; they are missing, not empty
+            culture[attr_name] = {
+                k: v for k, v in row.items() if k != "Cultural Attribute" and v is not None
+            }
+    return culture
+
+
+def _read_text(path: Path) -> str:
+    """Read a UTF-8 text resource."""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_csv_levels(csv_path: Path) -> tuple:
+    """Read only the header row of a culture CSV and return its sorted level columns."""
+    with open(csv_path, "r", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    return tuple(sorted(name for name in header if name and name != "Cultural Attribute"))
+
+
+class FilesystemStore(ResourceStore):
+    """
+    Resources read from culture_expectations_<scale>.csv files in data_dir and
+    org_focus_areas_<org>.md plus goal_generation_framework_prompt.txt in prompts_dir.
+    Parsed files are held in a ResourceCache and revalidated with a stat check.
+    """
+
+    def __init__(
+        self,
+        data_dir: Union[str, Path],
+        prompts_dir: Union[str, Path],
+        cache: ResourceCache = resource_cache,
+    ):
+        self.data_dir = Path(data_dir)
+        self.prompts_dir = Path(prompts_dir)
+        self.cache = cache
+        # (prompts_dir signature, sorted org names) from the last orgs() call
+        self._org_names: Optional[tuple[Signature, list[str]]] = None
+
+    def culture_path(self, scale: str) -> Path:
+        return self.data_dir / f"culture_expectations_{scale}.csv"
+
+    def org_path(self, org_name: str) -> Path:
+        return self.prompts_dir / f"org_focus_areas_{org_name}.md"
+
+    def framework_path(self) -> Path:
+        return self.prompts_dir / "goal_generation_framework_prompt.txt"
+
+    def _culture_files(self) -> list[Path]:
+        return self.cache.listdir(self.data_dir, "culture_expectations_*.csv")
+
+    def _org_files(self) -> list[Path]:
+        return self.cache.listdir(self.prompts_dir, "org_focus_areas_*.md")
+
+    def scales(self) -> list[str]:
+        return sorted(
+            path.stem.replace("culture_expectations_", "") for path in self._culture_files()
+        )
+
+    def orgs(self) -> list[str]:
+        # Adding or removing a file changes the directory's mtime, so one os.stat (none while
+        # trusted) revalidates the sorted names; only a change re-globs and re-sorts
+        signature = self.cache.signature(self.prompts_dir)
+        if self._org_names is None or self._org_names[0] != signature:
+            names = sorted(path.stem.replace("org_focus_areas_", "") for path in self._org_files())
+            self._org_names = (signature, names)
+        return self._org_names[1]
+
+    def levels(self, scale: str) -> list[str]:
+        # Header row only: metadata requests never parse the full CSV
+        return list(self.cache.load(self.culture_path(scale), _read_csv_levels, kind="levels"))
+
+    def culture(self, scale: str) -> dict:
+        return self.cache.load(self.culture_path(scale), _parse_culture_csv, kind="culture")
+
+    def _compile_culture_csv(self, csv_path: Path) -> CultureMatrix:
+        """Compile a culture CSV into a CultureMatrix, reusing the cached parse."""
+        return compile_culture_matrix(self.cache.load(csv_path, _parse_culture_csv, kind="culture"))
+
+    def culture_matrix(self, scale: str) -> CultureMatrix:
+        return self.cache.load(
+            self.culture_path(scale), self._compile_culture_csv, kind="culture_matrix"
+        )
+
+    def org_focus_areas(self, org_name: str) -> str:
+        return self.cache.load(self.org_path(org_name), _read_text)
+
+    def framework_prompt(self) -> str:
+        return self.cache.load(self.framework_path(), _read_text)
+
+    def culture_signature(self, scale: str) -> Signature:
+        return self.cache.signature(self.culture_path(scale))
+
+    def org_signature(self, org_name: str) -> Signature:
+        return self.cache.signature(self.org_path(org_name))
+
+    def framework_signature(self) -> Signature:
+        return self.cache.signature(self.framework_path())
+
+    def signatures_in_memory(self) -> bool:
+        # Trusted caches memoize signatures until a watcher reports a change
+        return self.cache.trusted
+
+    # Built from one listing per directory, so names and signatures are consistent
+    def scale_fingerprint(self) -> tuple:
+        return tuple(
+            (path.stem.replace("culture_expectations_", ""), self.cache.signature(path))
+            for path in self._culture_files()
+        )
+
+    def org_fingerprint(self) -> tuple:
+        return tuple(
+            (path.stem.replace("org_focus_areas_", ""), self.cache.signature(path))
+            for path in self._org_files()
+        )
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scales (
+    scale TEXT PRIMARY KEY,
+    levels TEXT NOT NULL,
+    attributes TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS culture_cells (
+    scale TEXT NOT NULL,
+    level TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    expectation TEXT NOT NULL,
+    PRIMARY KEY (scale, level, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS org_focus_areas (
+    org TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS documents (
+    name TEXT PRIMARY KEY,
+    body TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+_FRAMEWORK_DOCUMENT = "goal_generation_framework_prompt"
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Return the smallest string greater than every string starting with prefix."""
+    while prefix and prefix[-1] == chr(sys.maxunicode):
+        prefix = prefix[:-1]
+    if not prefix:
+        return chr(sys.maxunicode)
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class SQLiteStore(ResourceStore):
+    """
+    Resources served from an indexed SQLite database built by build_sqlite_store().
+
+    Culture expectations are one row per (scale, level, attribute position) cell, org focus
+    areas one row per org; every lookup is a primary-key search. The (mtime_ns, size) columns
+    are the signatures: anything that rewrites a row must change them, or cached prompts and
+    compiled matrices will not notice. The connection is opened read-only and shared between
+    threads behind a lock.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(f"Resource database not found: {self.path}")
+        self._connection = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._matrices: dict[str, tuple[Signature, CultureMatrix]] = {}
+
+    def _query(self, sql: str, *params) -> list:
+        with self._lock:
+            rows: list = self._connection.execute(sql, params).fetchall()
+        return rows
+
+    def _one(self, sql: str, *params, missing: str) -> tuple:
+        rows = self._query(sql, *params)
+        if not rows:
+            raise FileNotFoundError(missing)
+        return tuple(rows[0])
+
+    def scales(self) -> list[str]:
+        return [scale for (scale,) in self._query("SELECT scale FROM scales ORDER BY scale")]
+
+    def orgs(self) -> list[str]:
+        return [org for (org,) in self._query("SELECT org FROM org_focus_areas ORDER BY org")]
+
+    def levels(self, scale: str) -> list[str]:
+        (levels,) = self._one(
+            "SELECT levels FROM scales WHERE scale = ?", scale, missing=f"Unknown scale: {scale}"
+        )
+        return list(json.loads(levels))
+
+    def culture_matrix(self, scale: str) -> CultureMatrix:
+        levels, attributes, mtime_ns, size = self._one(
+            "SELECT levels, attributes, mtime_ns, size FROM scales WHERE scale = ?",
+            scale,
+            missing=f"Unknown scale: {scale}",
+        )
+        cached = self._matrices.get(scale)
+        if cached is not None and cached[0] == (mtime_ns, size):
+            return cached[1]
+
+        attributes = json.loads(attributes)
+        grid: dict[str, list] = {}
+        for level, position, expectation in self._query(
+            "SELECT level, position, expectation FROM culture_cells WHERE scale = ?", scale
+        ):
+            grid.setdefault(level, [_MISSING] * len(attributes))[position] = expectation
+        culture = {
+            attr: {level: column[i] for level, column in grid.items() if column[i] is not _MISSING}
+            for i, attr in enumerate(attributes)
+        }
+        matrix = compile_culture_matrix(culture)
+        self._matrices[scale] = ((mtime_ns, size), matrix)
+        return matrix
+
+    def org_focus_areas(self, org_name: str) -> str:
+        (body,) = self._one(
+            "SELECT body FROM org_focus_areas WHERE org = ?",
+            org_name,
+            missing=f"Unknown org: {org_name}",
+        )
+        return str(body)
+
+    def framework_prompt(self) -> str:
+        (body,) = self._one(
+            "SELECT body FROM documents WHERE name = ?",
+            _FRAMEWORK_DOCUMENT,
+            missing="Framework prompt not in database",
+        )
+        return str(body)
+
+    def _signature(self, sql: str, key: str) -> Signature:
+        rows = self._query(sql, key)
+        return tuple(rows[0]) if rows else None
+
+    def culture_signature(self, scale: str) -> Signature:
+        return self._signature("SELECT mtime_ns, size FROM scales WHERE scale = ?", scale)
+
+    def org_signature(self, org_name: str) -> Signature:
+        return self._signature("SELECT mtime_ns, size FROM org_focus_areas WHERE org = ?", org_name)
+
+    def framework_signature(self) -> Signature:
+        return self._signature(
+            "SELECT mtime_ns, size FROM documents WHERE name = ?", _FRAMEWORK_DOCUMENT
+        )
+
+    def org_page(self, prefix: str = "", after: Optional[str] = None, limit: int = 50) -> list[str]:
+        # A primary-key range scan that stops after limit rows, however many orgs there are
+        sql = "SELECT org FROM org_focus_areas WHERE org >= ?"
+        params = [prefix]
+        if prefix:
+            sql += " AND org < ?"
+            params.append(_prefix_upper_bound(prefix))
+        if after is not None:
+            sql += " AND org > ?"
+            params.append(after)
+        rows = self._query(sql + " ORDER BY org LIMIT ?", *params, limit)
+        return [org for (org,) in rows if org.startswith(prefix)]
+
+    # One index scan instead of one signature query per scale or org
+    def scale_fingerprint(self) -> tuple:
+        return tuple(
+            (scale, (mtime_ns, size))
+            for scale, mtime_ns, size in self._query(
+                "SELECT scale, mtime_ns, size FROM scales ORDER BY scale"
+            )
+        )
+
+    def org_fingerprint(self) -> tuple:
+        return tuple(
+            (org, (mtime_ns, size))
+            for org, mtime_ns, size in self._query(
+                "SELECT org, mtime_ns, size FROM org_focus_areas ORDER BY org"
+            )
+        )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def build_sqlite_store(output_path: Union[str, Path], source: ResourceStore) -> dict:
+    """
+    Copy every resource in source into a SQLite database at output_path, replacing any rows
+    already there. Returns counts of what was written: {"scales": n, "orgs": n}.
+    """
+    connection = sqlite3.connect(output_path)
+    try:
+        with connection:
+            connection.executescript(_SQLITE_SCHEMA)
+            for table in ("scales", "culture_cells", "org_focus_areas", "documents"):
+                connection.execute(f"DELETE FROM {table}")
+
+            # A resource whose signature is None vanished after it was listed; it is left out
+            scales = 0
+            for scale in source.scales():
+                scale_signature = source.culture_signature(scale)
+                if scale_signature is None:
+                    continue
+                matrix = source.culture_matrix(scale)
+                connection.execute(
+                    "INSERT INTO scales VALUES (?, ?, ?, ?, ?)",
+                    (
+                        scale,
+                        json.dumps(source.levels(scale), ensure_ascii=False),
+                        json.dumps(list(matrix.attributes), ensure_ascii=False),
+                        *scale_signature,
+                    ),
+                )
+                scales += 1
+                connection.executemany(
+                    "INSERT INTO culture_cells VALUES (?, ?, ?, ?)",
+                    (
+                        (scale, level, position, expectation)
+                        for level in matrix.levels
+                        for position, expectation in enumerate(matrix.column(level) or ())
+                        if expectation is not _MISSING
+                    ),
+                )
+
+            orgs = 0
+            for org_name in source.orgs():
+                org_signature = source.org_signature(org_name)
+                if org_signature is None:
+                    continue
+                connection.execute(
+                    "INSERT INTO org_focus_areas VALUES (?, ?, ?, ?)",
+                    (org_name, source.org_focus_areas(org_name), *org_signature),
+                )
+                orgs += 1
+
+            signature = source.framework_signature()
+            if signature is not None:
+                connection.execute(
+                    "INSERT INTO documents VALUES (?, ?, ?, ?)",
+                    (_FRAMEWORK_DOCUMENT, source.framework_prompt(), *signature),
+                )
+    finally:
+        connection.close()
+    return {"scales": scales, "orgs": orgs}
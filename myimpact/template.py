@@ -0,0 +1,55 @@
+"""Compiled prompt templates: static text segments interleaved with named slots."""
+
+import re
+
+# "{name}" marks a slot; "{{" and "}}" are literal braces
+_TOKEN_PATTERN = re.compile(r"\{\{|\}\}|\{(\w+)\}")
+
+
+class PromptTemplate:
+    """
+    A template split into static segments and named slots at compile time.
+
+    Rendering copies the precomputed part list, drops the slot values into their positions
+    and performs a single join, so static text is never re-formatted per request.
+    """
+
+    __slots__ = ("slots", "_parts", "_slot_positions")
+
+    def __init__(self, parts: list, slot_positions: tuple):
+        self._parts = parts
+        self._slot_positions = slot_positions
+        self.slots = tuple(dict.fromkeys(name for _, name in slot_positions))
+
+    def render(self, **values: str) -> str:
+        """Render the template; every slot must be given a string value."""
+        parts = self._parts.copy()
+        for position, name in self._slot_positions:
+            parts[position] = values[name]
+        return "".join(parts)
+
+
+def compile_template(source: str) -> PromptTemplate:
+    """Compile template source with {slot} placeholders into a PromptTemplate."""
+    parts = []
+    slot_positions = []
+    static = []
+    last = 0
+    for match in _TOKEN_PATTERN.finditer(source):
+        static.append(source[last : match.start()])
+        last = match.end()
+        name = match.group(1)
+        if name is None:
+            static.append(match.group(0)[0])
+            continue
+        text = "".join(static)
+        if text:
+            parts.append(text)
+        static = []
+        slot_positions.append((len(parts), name))
+        parts.append("")
+    static.append(source[last:])
+    text = "".join(static)
+    if text:
+        parts.append(text)
+    return PromptTemplate(parts, tuple(slot_positions))
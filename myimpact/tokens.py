@@ -0,0 +1,102 @@
+"""Offline prompt token estimation.
+
+estimate_tokens() approximates the token counts of the cl100k-style BPE vocabularies used by
+current OpenAI chat models, without a tokenizer dependency or vocabulary download. Text is
+split into pieces with the same kind of pre-tokenization pattern those tokenizers use (words
+with their leading space, digit groups, punctuation runs, whitespace) and each piece is costed
+by its shape. Common words are single tokens, long or non-ASCII words cost more. Estimates are
+deterministic but approximate, so budgets built on them should leave some headroom.
+"""
+
+import functools
+import hashlib
+import re
+from typing import Iterator, Optional
+
+from myimpact.cache import LRUCache
+
+# Pieces in the order a cl100k pre-tokenizer would match them (\p{L} ~ [^\W\d_], \p{N} ~ \d)
+_PIECE_PATTERN = re.compile(
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)"
+    r"|[^\r\n\w]?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?(?:_|[^\s\w])+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+# Letters a single vocabulary entry typically covers before a word is split
+_WORD_CHARS_PER_TOKEN = 6
+_SINGLE_TOKEN_WORD_LENGTH = 7
+
+
+@functools.lru_cache(maxsize=65536)
+def _piece_tokens(piece: str) -> int:
+    """Estimate the tokens in one pre-tokenized piece (memoized: prompts repeat their words)."""
+    if piece.isspace():
+        return 1
+    text = piece.lstrip()
+    non_ascii = sum(1 for char in text if ord(char) > 0x7F)
+    ascii_length = len(text) - non_ascii
+    if text[0].isalpha():
+        extra = max(0, ascii_length - _SINGLE_TOKEN_WORD_LENGTH) // _WORD_CHARS_PER_TOKEN
+        return 1 + extra + non_ascii
+    if text[0].isdigit():
+        return 1
+    # Punctuation runs: common pairs and triples ("**", "###", ".\n") are single entries
+    return max(1, (ascii_length + 2) // 3) + non_ascii
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate how many tokens text encodes to."""
+    if not text:
+        return 0
+    return sum(_piece_tokens(piece) for piece in _PIECE_PATTERN.findall(text))
+
+
+def _segments(text: str) -> Iterator[str]:
+    """
+    Split text after each blank line that is followed by a non-space character. A piece always
+    ends there, so segment estimates add up to exactly the whole-text estimate.
+    """
+    start = position = 0
+    while True:
+        blank = text.find("\n\n", position)
+        if blank < 0:
+            break
+        position = blank + 2
+        while position < len(text) and text[position] == "\n":
+            position += 1
+        if position < len(text) and not text[position].isspace():
+            yield text[start:position]
+            start = position
+    if start < len(text):
+        yield text[start:]
+
+
+# Segment token counts keyed by a digest of the segment, so entries stay small however long
+# the framework or org focus text is
+segment_token_cache = LRUCache(maxsize=4096)
+
+
+def segment_tokens(segment: str) -> int:
+    """Return estimate_tokens(segment), memoized by content hash."""
+    key = hashlib.blake2b(segment.encode("utf-8"), digest_size=16).digest()
+    count: Optional[int] = segment_token_cache.get(key)
+    if count is None:
+        count = estimate_tokens(segment)
+        segment_token_cache.put(key, count)
+    return count
+
+
+def estimate_prompt_tokens(framework: str, user_context: str) -> int:
+    """
+    Estimate the tokens a (framework, user_context) prompt sends to the model.
+    Both parts are summed segment by segment (split at blank lines). The framework, org focus
+    areas, guidance and culture blocks repeat across requests and hit segment_token_cache, so
+    only new text such as a user's focus area is tokenized.
+    """
+    return sum(
+        segment_tokens(segment) for text in (framework, user_context) for segment in _segments(text)
+    )
@@ -0,0 +1,162 @@
+"""Optional watcher that pushes data/ and prompts/ changes into the in-process caches.
+
+While a watcher runs, the shared resource cache is put in trusted mode: file signatures and
+directory listings are memoized, so discovery, loading and fingerprinting make no filesystem
+calls in steady state. When a watched file is added, removed or edited the watcher invalidates
+the memoized state and the next request revalidates against disk.
+
+Change notifications come from the `watchfiles` package (inotify and friends) when it is
+installed, and from a stdlib os.scandir polling loop otherwise.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from myimpact import assembler
+from myimpact.cache import ResourceCache, resource_cache
+
+try:
+    import watchfiles
+except ImportError:  # pragma: no cover - depends on installed extras
+    watchfiles = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _snapshot(directories: Iterable[Path]) -> dict[str, tuple[int, int]]:
+    """Return {path: (mtime_ns, size)} for every file directly inside the directories."""
+    snapshot = {}
+    for directory in directories:
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+class ResourceWatcher:
+    """
+    Watches resource directories on a background thread and reports changed paths.
+
+    on_change receives the set of paths that were added, removed or modified. Set
+    force_polling to skip the native backend (polling checks every `interval` seconds).
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[Union[str, Path]],
+        on_change: Callable[[set[str]], None],
+        interval: float = 1.0,
+        force_polling: bool = False,
+    ):
+        self.directories = [Path(d) for d in directories]
+        self.on_change = on_change
+        self.interval = interval
+        self.backend = "polling" if force_polling or watchfiles is None else "watchfiles"
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ResourceWatcher":
+        """Start watching; returns once the initial state has been captured."""
+        if self.running:
+            return self
+        self._stop.clear()
+        self._ready.clear()
+        target = self._watch_native if self.backend == "watchfiles" else self._watch_polling
+        self._thread = threading.Thread(target=target, name="myimpact-watcher", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _notify(self, changed: set[str]) -> None:
+        try:
+            self.on_change(changed)
+        except Exception:
+            logger.exception("Resource change callback failed")
+
+    def _watch_polling(self) -> None:
+        previous = _snapshot(self.directories)
+        self._ready.set()
+        while not self._stop.wait(self.interval):
+            current = _snapshot(self.directories)
+            if current != previous:
+                changed = {
+                    path
+                    for path in previous.keys() | current.keys()
+                    if previous.get(path) != current.get(path)
+                }
+                previous = current
+                self._notify(changed)
+
+    def _watch_native(self) -> None:
+        directories = [str(d) for d in self.directories if d.exists()]
+        try:
+            # The first (possibly empty) batch means the OS watches are registered
+            for changes in watchfiles.watch(
+                *directories, stop_event=self._stop, rust_timeout=100, yield_on_timeout=True
+            ):
+                self._ready.set()
+                if changes:
+                    self._notify({path for _, path in changes})
+        except Exception:
+            # Never leave trusted caches unwatched: degrade to polling
+            logger.exception("Native resource watcher failed; falling back to polling")
+            self.backend = "polling"
+            self._ready.set()
+            self._notify(set())
+            self._watch_polling()
+
+
+def watch_resources(
+    cache: ResourceCache = resource_cache,
+    interval: float = 1.0,
+    force_polling: bool = False,
+) -> ResourceWatcher:
+    """
+    Start a watcher on the assembler's data/ and prompts/ directories that keeps `cache` in
+    trusted mode and invalidates it on change. Call stop_watching() to go back to stat checks.
+    """
+
+    def invalidate(changed: set[str]) -> None:
+        logger.info("Resource files changed: %s", ", ".join(sorted(changed)))
+        cache.invalidate()
+
+    watcher = ResourceWatcher(
+        [assembler._get_resource_dir("data"), assembler._get_resource_dir("prompts")],
+        invalidate,
+        interval=interval,
+        force_polling=force_polling,
+    )
+    watcher.start()
+    cache.invalidate()
+    cache.trusted = True
+    return watcher
+
+
+def stop_watching(watcher: ResourceWatcher, cache: ResourceCache = resource_cache) -> None:
+    """Stop a watcher started by watch_resources() and restore per-load stat checks."""
+    watcher.stop()
+    cache.trusted = False
+    cache.invalidate()
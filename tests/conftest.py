@@ -1,6 +1,37 @@
+import pytest
+
+
 def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "unit: Unit tests - fast, isolated, use mocks/fixtures")
     config.addinivalue_line("markers", "integration: Integration tests - use real data or controlled temp fixtures")
     config.addinivalue_line("markers", "smoke: Smoke tests - validate shipped demo data works")
-    config.addinivalue_line("markers", "slow: Tests that may take longer to run")
\ No newline at end of file
+    config.addinivalue_line("markers", "slow: Tests that may take longer to run")
+
+
+@pytest.fixture
+def test_workspace(tmp_path, monkeypatch):
+    """
+    Isolated data/ and prompts/ directories with one scale and one org.
+    The assembler resolves its resource directories here for the duration of the test.
+    """
+    data_dir = tmp_path / "data"
+    prompts_dir = tmp_path / "prompts"
+    data_dir.mkdir()
+    prompts_dir.mkdir()
+    (data_dir / "culture_expectations_technical.csv").write_text(
+        "Cultural Attribute,L10 (Entry),L20 (Developing)\n"
+        "Humble,Asks for help.,Shares credit.\n"
+        "Ownership,Finishes tasks.,Owns features.\n",
+        encoding="utf-8",
+    )
+    (prompts_dir / "org_focus_areas_acme.md").write_text(
+        "Ship Faster\n- Automate releases.\n", encoding="utf-8"
+    )
+    (prompts_dir / "goal_generation_framework_prompt.txt").write_text(
+        "You generate SMART goals.\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(
+        "myimpact.assembler._get_resource_dir", lambda subdir: tmp_path / subdir
+    )
+    return tmp_path
@@ -0,0 +1,231 @@
+"""Tests for myimpact.aio module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state which calls run inline and which leave the event loop
+- Bounded: A slow disk is simulated by caches that sleep before each file or database access
+- Fast: Simulated disk latency is tens of milliseconds
+- Reliable: Event loop stalls are measured against a generous threshold
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from api.main import app
+from myimpact import aio, assembler
+from myimpact.cache import ResourceCache
+from myimpact.generation import StubProvider
+from myimpact.response_cache import CachingProvider, SQLiteResponseCache
+from myimpact.stores import FilesystemStore
+
+INPUTS = {"scale": "technical", "level": "L10 (Entry)", "growth_intensity": "moderate"}
+
+
+@pytest.fixture
+def restore_store():
+    """Serve from the default store again after the test."""
+    yield
+    assembler.use_resource_store(None)
+
+
+@pytest.mark.unit
+class TestAsyncAssembler:
+    """Test the event-loop access path to the assembler."""
+
+    def test_blocking_calls_run_in_io_pool(self):
+        """
+        Given: A blocking function
+        When: It is awaited through run_blocking()
+        Then: It runs on an I/O pool thread and its result is returned
+        """
+
+        async def run():
+            return await aio.run_blocking(lambda: threading.current_thread().name)
+
+        assert asyncio.run(run()).startswith("myimpact-io")
+
+    def test_cached_prompt_needs_in_memory_signatures(self, test_workspace, restore_store):
+        """
+        Given: A prompt already assembled from plain files (signatures need a stat call)
+        When: aio.cached_prompt() is called
+        Then: Returns None, leaving the lookup to the I/O pool
+        """
+        assembler.use_resource_store(None)
+        assembler.assemble_prompt(**INPUTS, org_name="acme")
+
+        assert aio.cached_prompt(**INPUTS, org_name="acme") is None
+
+    def test_cached_prompt_served_inline_from_trusted_files(self, test_workspace, restore_store):
+        """
+        Given: Files trusted under a watcher and a prompt already assembled
+        When: aio.cached_prompt() and aio.assemble_prompt() are called
+        Then: Both return the assembled prompt without assembling again
+        """
+        store = FilesystemStore(
+            test_workspace / "data", test_workspace / "prompts", cache=ResourceCache()
+        )
+        store.cache.trusted = True
+        assembler.use_resource_store(store)
+        expected = assembler.assemble_prompt(**INPUTS, org_name="acme")
+        misses = assembler.prompt_cache.stats()["misses"]
+
+        assert aio.cached_prompt(**INPUTS, org_name="acme") == expected
+        assert asyncio.run(aio.assemble_prompt(**INPUTS, org_name="acme")) == expected
+        assert assembler.prompt_cache.stats()["misses"] == misses
+
+    def test_cold_assembly_matches_sync_assembler(self, test_workspace):
+        """
+        Given: A prompt that is not cached
+        When: aio.assemble_prompt() is awaited with a token budget
+        Then: Returns what assemble_prompt() returns
+        """
+        result = asyncio.run(aio.assemble_prompt(**INPUTS, org_name="acme", max_tokens=10_000))
+
+        assert result == assembler.assemble_prompt(**INPUTS, org_name="acme")
+
+
+class SlowDiskCache(ResourceCache):
+    """ResourceCache whose every stat, listing and read first waits like a slow disk."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.accesses = 0
+
+    def _wait(self):
+        self.accesses += 1
+        time.sleep(self.latency)
+
+    def signature(self, path):
+        self._wait()
+        return super().signature(path)
+
+    def listdir(self, directory, pattern):
+        self._wait()
+        return super().listdir(directory, pattern)
+
+    def load(self, path, parser, kind="text"):
+        self._wait()
+        return super().load(path, parser, kind)
+
+
+async def _max_loop_lag(work, interval: float = 0.005) -> float:
+    """Await work while a heartbeat measures the longest the event loop went unresponsive."""
+    loop = asyncio.get_running_loop()
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal lag
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(interval)
+            lag = max(lag, loop.time() - start - interval)
+
+    monitor = asyncio.ensure_future(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await work
+    finally:
+        done.set()
+        await monitor
+    return lag
+
+
+@pytest.mark.integration
+class TestEventLoopResponsiveness:
+    """Test that API handlers never block the event loop on resource I/O."""
+
+    LATENCY = 0.05
+    MAX_LAG = 0.03
+
+    def test_slow_disk_does_not_stall_event_loop(self, test_workspace, restore_store):
+        """
+        Given: Resources on a disk taking 50 ms per stat, listing or read
+        When: Metadata, org, focus area, generate and batch requests run concurrently
+        Then: All succeed and the event loop never stalls for more than 30 ms
+        """
+        cache = SlowDiskCache(self.LATENCY)
+        assembler.use_resource_store(
+            FilesystemStore(test_workspace / "data", test_workspace / "prompts", cache=cache)
+        )
+        generate = {**INPUTS, "org": "acme"}
+
+        async def requests():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(
+                    client.get("/api/metadata"),
+                    client.get("/api/orgs"),
+                    client.get("/api/orgs/acme/focus-areas"),
+                    client.post("/api/goals/generate", json=generate),
+                    client.post("/api/goals/generate", json={**generate, "max_tokens": 10_000}),
+                    client.post("/api/goals/generate:batch", json={"items": [generate] * 3}),
+                )
+
+        async def run():
+            responses = []
+
+            async def collect():
+                responses.extend(await requests())
+
+            return await _max_loop_lag(collect()), responses
+
+        lag, responses = asyncio.run(run())
+
+        assert [response.status_code for response in responses] == [200] * 6
+        assert cache.accesses > 0
+        assert lag < self.MAX_LAG
+
+
+class SlowSQLiteResponseCache(SQLiteResponseCache):
+    """SQLiteResponseCache whose every lookup and write first waits like a locked database."""
+
+    def __init__(self, path, latency: float):
+        super().__init__(path)
+        self.latency = latency
+
+    def get(self, key, default=None):
+        time.sleep(self.latency)
+        return super().get(key, default)
+
+    def put(self, key, value):
+        time.sleep(self.latency)
+        super().put(key, value)
+
+
+@pytest.mark.integration
+class TestResponseCacheOffLoop:
+    """Test that a SQLite response cache never blocks the event loop."""
+
+    def test_locked_sqlite_cache_does_not_stall_event_loop(self, tmp_path):
+        """
+        Given: A SQLite response cache taking 50 ms per lookup or write
+        When: A generation misses and stores, then hits, and a stream replays it
+        Then: All return the same goals and the event loop never stalls for more than 30 ms
+        """
+        cache = SlowSQLiteResponseCache(
+            tmp_path / "responses.db", TestEventLoopResponsiveness.LATENCY
+        )
+        provider = CachingProvider(StubProvider(), cache)
+
+        async def run():
+            results = []
+
+            async def work():
+                results.append(await provider.generate("framework", "context"))
+                results.append(await provider.generate("framework", "context"))
+                async for item in provider.stream("framework", "context"):
+                    results.append(item)
+
+            return await _max_loop_lag(work()), results
+
+        lag, results = asyncio.run(run())
+        cache.close()
+
+        assert results[0] == results[1] == results[-1]
+        assert cache.hits == 2
+        assert lag < TestEventLoopResponsiveness.MAX_LAG
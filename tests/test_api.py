@@ -7,11 +7,17 @@ Following Martin Fowler's Test Shapes principles:
 - Reliable: Only fail for useful reasons (real API contract changes)
 """
 
+import asyncio
 import pytest
+import json
 from unittest.mock import patch
+
+import httpx
 from fastapi.testclient import TestClient
 
-from api.main import app
+from api.main import app, generation_flights, get_llm_provider
+from myimpact.generation import GenerationError, StubProvider
+from myimpact.tokens import estimate_prompt_tokens
 
 
 @pytest.mark.unit
@@ -373,6 +379,367 @@ class TestAPIGenerateEndpoint:
         # Should return error, not crash
         assert response.status_code >= 400
 
+    @patch('api.main.assemble_prompt')
+    def test_generate_returns_token_estimate(self, mock_assemble):
+        """
+        Given: An assembler returning a short prompt
+        When: POST /api/goals/generate
+        Then: Response carries the estimated prompt token count
+        """
+        mock_assemble.return_value = ("You generate goals.", "Level: L30")
+
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+        response = self.client.post("/api/goals/generate", json=payload)
+
+        assert response.json()["token_estimate"] == estimate_prompt_tokens(
+            "You generate goals.", "Level: L30"
+        )
+
+    @patch('api.main.assemble_prompt')
+    def test_generate_passes_max_tokens_budget(self, mock_assemble):
+        """
+        Given: Generate request with max_tokens
+        When: POST /api/goals/generate
+        Then: Assembler receives the budget; a non-positive budget is rejected
+        """
+        mock_assemble.return_value = ("sys", "user")
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+        self.client.post("/api/goals/generate", json={**payload, "max_tokens": 800})
+        rejected = self.client.post("/api/goals/generate", json={**payload, "max_tokens": 0})
+
+        assert mock_assemble.call_args[1]["max_tokens"] == 800
+        assert rejected.status_code == 422
+
+
+@pytest.mark.unit
+class TestAPIServerSideGeneration:
+    """Test /api/goals/generate with a generation provider configured."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Serve generation from the deterministic stub provider."""
+        self.provider = StubProvider()
+        app.dependency_overrides[get_llm_provider] = lambda: self.provider
+        self.client = TestClient(app)
+        yield
+        app.dependency_overrides.clear()
+
+    @patch('api.main.assemble_prompt')
+    def test_generate_fills_result_from_provider(self, mock_assemble):
+        """
+        Given: A stub provider and an assembled prompt
+        When: POST /api/goals/generate
+        Then: result carries the stub's goals and powered_by names the provider
+        """
+        mock_assemble.return_value = ("sys", "**Job Level**: L30\n")
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+        response = self.client.post("/api/goals/generate", json=payload)
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["powered_by"] == "stub"
+        assert data["result"]["content"].startswith("1. Goal 1 for L30")
+        assert data["result"]["model"] == "stub"
+        assert data["user_context"] == "**Job Level**: L30\n"
+
+    @patch('api.main.assemble_prompt')
+    def test_generated_response_is_not_cacheable(self, mock_assemble):
+        """
+        Given: A stub provider
+        When: POST /api/goals/generate
+        Then: The response has no ETag and Cache-Control: no-store
+        """
+        mock_assemble.return_value = ("sys", "user")
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+        response = self.client.post("/api/goals/generate", json=payload)
+
+        assert "etag" not in response.headers
+        assert response.headers["cache-control"] == "no-store"
+
+    @patch('api.main.assemble_prompt')
+    def test_provider_failure_returns_its_status(self, mock_assemble):
+        """
+        Given: A provider that fails with a gateway error
+        When: POST /api/goals/generate
+        Then: Returns that status with the failure in the detail
+        """
+        mock_assemble.return_value = ("sys", "user")
+
+        async def fail(framework, user_context):
+            raise GenerationError(502, "openai returned 500: boom")
+
+        self.provider.generate = fail
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+        response = self.client.post("/api/goals/generate", json=payload)
+
+        assert response.status_code == 502
+        assert "openai returned 500" in response.json()["detail"]
+
+
+@pytest.mark.unit
+class TestAPIRequestCoalescing:
+    """Test that concurrent identical /api/goals/generate calls share one generation."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Serve generation from a slow stub provider that counts its completions."""
+        self.provider = StubProvider(delay=0.05)
+        self.provider.calls = 0
+        complete = self.provider._complete
+
+        async def counted(*prompt):
+            self.provider.calls += 1
+            return await complete(*prompt)
+
+        self.provider._complete = counted
+        app.dependency_overrides[get_llm_provider] = lambda: self.provider
+        yield
+        app.dependency_overrides.clear()
+
+    def _post_concurrently(self, payloads):
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await asyncio.gather(
+                    *(client.post("/api/goals/generate", json=payload) for payload in payloads)
+                )
+
+        return asyncio.run(run())
+
+    @patch('api.main.assemble_prompt')
+    def test_identical_concurrent_requests_share_one_generation(self, mock_assemble):
+        """
+        Given: Eight concurrent requests for the same inputs
+        When: POST /api/goals/generate
+        Then: The provider runs once, all get the same goals and the calls count as coalesced
+        """
+        mock_assemble.return_value = ("sys", "**Job Level**: L30\n")
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+        before = generation_flights.stats()
+
+        responses = self._post_concurrently([payload] * 8)
+
+        after = generation_flights.stats()
+        assert {response.json()["result"]["content"] for response in responses} == {
+            responses[0].json()["result"]["content"]
+        }
+        assert self.provider.calls == 1
+        assert after["coalesced"] - before["coalesced"] == 7
+        assert after["in_flight"] == 0
+
+    @patch('api.main.assemble_prompt')
+    def test_different_prompts_are_not_coalesced(self, mock_assemble):
+        """
+        Given: Concurrent requests whose prompts differ
+        When: POST /api/goals/generate
+        Then: The provider runs once per distinct prompt
+        """
+        mock_assemble.side_effect = lambda **inputs: ("sys", f"**Job Level**: {inputs['level']}\n")
+        payloads = [
+            {"scale": "technical", "level": level, "growth_intensity": "moderate"}
+            for level in ("L30", "L40", "L30")
+        ]
+
+        self._post_concurrently(payloads)
+
+        assert self.provider.calls == 2
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    """Parse a text/event-stream body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.unit
+class TestAPIGenerateSSEStream:
+    """Test /api/goals/generate/stream server-sent events."""
+
+    PARAMS = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Serve generation from the deterministic stub provider."""
+        self.provider = StubProvider()
+        app.dependency_overrides[get_llm_provider] = lambda: self.provider
+        self.client = TestClient(app)
+        yield
+        app.dependency_overrides.clear()
+
+    @patch('api.main.assemble_prompt')
+    def test_post_streams_prompt_goal_chunks_then_done(self, mock_assemble):
+        """
+        Given: A stub provider and an assembled progressive prompt
+        When: POST /api/goals/generate/stream
+        Then: Sends a prompt event, one delta per goal in order, and a done event with the result
+        """
+        mock_assemble.return_value = ("sys", "**Job Level**: L30\n**Goal Style**: progressive\n")
+
+        response = self.client.post("/api/goals/generate/stream", json=self.PARAMS)
+
+        events = _sse_events(response.text)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-store"
+        assert [name for name, _ in events] == ["prompt"] + ["delta"] * 4 + ["done"]
+        assert events[0][1]["user_context"].startswith("**Job Level**: L30")
+        deltas = "".join(data["content"] for name, data in events if name == "delta")
+        assert events[-1][1]["result"]["content"] == deltas
+        assert events[-1][1]["powered_by"] == "stub"
+
+    @patch('api.main.assemble_prompt')
+    def test_get_takes_inputs_as_query_parameters(self, mock_assemble):
+        """
+        Given: Inputs passed as query parameters
+        When: GET /api/goals/generate/stream
+        Then: Assembles with those inputs and streams the same events as POST
+        """
+        mock_assemble.return_value = ("sys", "**Job Level**: L30\n")
+
+        got = self.client.get("/api/goals/generate/stream", params=self.PARAMS)
+        posted = self.client.post("/api/goals/generate/stream", json=self.PARAMS)
+
+        assert got.text == posted.text
+        mock_assemble.assert_called_with(
+            scale="technical",
+            level="L30",
+            growth_intensity="moderate",
+            org_name="demo",
+            goal_style="independent",
+            focus_area=None,
+        )
+
+    def test_invalid_inputs_are_rejected_before_streaming(self):
+        """
+        Given: A request missing required fields
+        When: GET /api/goals/generate/stream
+        Then: Returns 422 like /api/goals/generate
+        """
+        response = self.client.get("/api/goals/generate/stream", params={"scale": "technical"})
+
+        assert response.status_code == 422
+
+    @patch('api.main.assemble_prompt')
+    def test_assembly_error_keeps_http_status(self, mock_assemble):
+        """
+        Given: The assembler rejects the inputs
+        When: POST /api/goals/generate/stream
+        Then: Returns 400 with a JSON detail instead of a stream
+        """
+        mock_assemble.side_effect = ValueError("Unknown level")
+
+        response = self.client.post("/api/goals/generate/stream", json=self.PARAMS)
+
+        assert response.status_code == 400
+        assert "Unknown level" in response.json()["detail"]
+
+    @patch('api.main.assemble_prompt')
+    def test_generation_failure_ends_stream_with_error_event(self, mock_assemble):
+        """
+        Given: A provider that fails after the stream has started
+        When: POST /api/goals/generate/stream
+        Then: The stream ends with an error event carrying the failure status
+        """
+        mock_assemble.return_value = ("sys", "user")
+
+        async def fail(framework, user_context):
+            yield "1. Goal"
+            raise GenerationError(504, "openai timed out after 60s")
+
+        self.provider.stream = fail
+
+        response = self.client.post("/api/goals/generate/stream", json=self.PARAMS)
+
+        events = _sse_events(response.text)
+        assert [name for name, _ in events] == ["prompt", "delta", "error"]
+        assert events[-1][1]["status_code"] == 504
+
+    @patch('api.main.assemble_prompt')
+    def test_prompts_only_stream_ends_without_result(self, mock_assemble):
+        """
+        Given: No generation provider configured
+        When: POST /api/goals/generate/stream
+        Then: Sends the prompt event, then done with a null result and prompts-only
+        """
+        mock_assemble.return_value = ("sys", "user")
+        app.dependency_overrides[get_llm_provider] = lambda: None
+
+        response = self.client.post("/api/goals/generate/stream", json=self.PARAMS)
+
+        events = _sse_events(response.text)
+        assert [name for name, _ in events] == ["prompt", "done"]
+        assert events[-1][1] == {"result": None, "powered_by": "prompts-only"}
+
+
+@pytest.mark.unit
+class TestAPIOrgsEndpoint:
+    """Test /api/orgs paginated org index endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Set up test fixtures."""
+        self.client = TestClient(app)
+
+    @patch("api.main.list_orgs")
+    def test_orgs_passes_query_to_index_and_returns_page(self, mock_list):
+        """
+        Given: An org index returning one page with a next cursor
+        When: GET /api/orgs?prefix=ac&cursor=acme&limit=2
+        Then: Queries the index with those values and returns the page and cursor
+        """
+        from myimpact.assembler import OrgPage
+
+        mock_list.return_value = OrgPage(["acme-east", "acme-west"], "acme-west")
+
+        response = self.client.get("/api/orgs?prefix=ac&cursor=acme&limit=2")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "organizations": ["acme-east", "acme-west"],
+            "next_cursor": "acme-west",
+        }
+        mock_list.assert_called_once_with(prefix="ac", cursor="acme", limit=2)
+
+    def test_orgs_rejects_out_of_range_limit(self):
+        """
+        Given: /api/orgs endpoint
+        When: limit is 0 or above the maximum page size
+        Then: Returns 422
+        """
+        assert self.client.get("/api/orgs?limit=0").status_code == 422
+        assert self.client.get("/api/orgs?limit=501").status_code == 422
+
+    def test_orgs_includes_demo_org(self):
+        """
+        Given: Shipped org focus areas
+        When: GET /api/orgs?prefix=demo
+        Then: The demo org is on the first page
+        """
+        response = self.client.get("/api/orgs?prefix=demo")
+
+        assert "demo" in response.json()["organizations"]
+
+    def test_metadata_can_omit_organizations(self):
+        """
+        Given: /api/metadata endpoint
+        When: Called with include_orgs=false
+        Then: Returns scales and levels without the organizations list, under its own ETag
+        """
+        full = self.client.get("/api/metadata")
+        response = self.client.get("/api/metadata?include_orgs=false")
+
+        assert response.status_code == 200
+        assert "organizations" not in response.json()
+        assert response.json()["scales"] == full.json()["scales"]
+        assert response.headers["etag"] != full.headers["etag"]
+
 
 @pytest.mark.unit
 class TestAPIOrgFocusAreasEndpoint:
@@ -505,3 +872,383 @@ class TestAPIErrorHandling:
         # Should be sub-100ms (no file I/O)
         assert first_call_time < 0.1, \
             f"Metadata call took {first_call_time}s - may have unnecessary I/O"
+
+
+@pytest.mark.unit
+class TestAPIMetricsEndpoint:
+    """Test /api/metrics endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Set up test fixtures."""
+        self.client = TestClient(app)
+
+    def test_metrics_reports_prompt_cache_counters(self):
+        """
+        Given: API is running
+        When: GET /api/metrics
+        Then: Returns prompt cache hit/miss/eviction counters
+        """
+        response = self.client.get("/api/metrics")
+
+        assert response.status_code == 200
+        stats = response.json()["prompt_cache"]
+        assert {"size", "maxsize", "hits", "misses", "evictions"}.issubset(stats.keys())
+        assert "hits" in response.json()["token_cache"]
+
+    def test_metrics_reports_coalesced_requests(self):
+        """
+        Given: API is running
+        When: GET /api/metrics
+        Then: Reports calls and coalesced calls for prompt assembly and generation
+        """
+        coalescing = self.client.get("/api/metrics").json()["coalescing"]
+
+        assert set(coalescing) == {"prompts", "generation"}
+        assert {"calls", "coalesced", "in_flight"} == set(coalescing["generation"])
+
+
+@pytest.mark.unit
+class TestAPIHTTPCaching:
+    """Test ETag / If-None-Match and Cache-Control handling."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Set up test fixtures."""
+        self.client = TestClient(app)
+
+    def test_metadata_returns_etag_and_cache_control(self):
+        """
+        Given: /api/metadata endpoint
+        When: Called
+        Then: Response carries a strong ETag and a Cache-Control header
+        """
+        response = self.client.get("/api/metadata")
+
+        assert response.headers["etag"].startswith('"')
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_metadata_returns_304_for_matching_if_none_match(self):
+        """
+        Given: A client holding the current metadata ETag
+        When: It revalidates with If-None-Match
+        Then: Returns 304 with an empty body
+        """
+        etag = self.client.get("/api/metadata").headers["etag"]
+
+        response = self.client.get("/api/metadata", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_etags_change_with_a_code_only_deploy(self, monkeypatch):
+        """
+        Given: A client holding the current metadata ETag
+        When: The app version or the prompt code digest changes, with no resource file edited
+        Then: The ETag changes and revalidation returns 200
+        """
+        etag = self.client.get("/api/metadata").headers["etag"]
+
+        monkeypatch.setattr(app, "version", "0.1.0+deploy")
+        new_version = self.client.get("/api/metadata", headers={"If-None-Match": etag})
+        monkeypatch.undo()
+        monkeypatch.setattr("api.main.PROMPT_CODE_DIGEST", "edited template")
+        new_template = self.client.get("/api/metadata", headers={"If-None-Match": etag})
+
+        assert new_version.status_code == 200
+        assert new_version.headers["etag"] != etag
+        assert new_template.status_code == 200
+        assert new_template.headers["etag"] not in (etag, new_version.headers["etag"])
+
+    def test_metadata_returns_200_for_stale_etag(self):
+        """
+        Given: A client holding an outdated ETag
+        When: It revalidates with If-None-Match
+        Then: Returns 200 with the full payload
+        """
+        response = self.client.get("/api/metadata", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert "scales" in response.json()
+
+    def test_weak_validator_in_if_none_match_list_matches(self):
+        """
+        Given: If-None-Match listing several tags, one the weak form of the current ETag
+        When: /api/metadata is revalidated
+        Then: Returns 304 (If-None-Match uses weak comparison)
+        """
+        etag = self.client.get("/api/metadata").headers["etag"]
+
+        response = self.client.get(
+            "/api/metadata", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+    @patch('api.main.load_org_focus_areas')
+    def test_focus_areas_returns_304_without_loading_content(self, mock_load):
+        """
+        Given: A client holding the current focus-areas ETag
+        When: It revalidates with If-None-Match
+        Then: Returns 304 without reading the org file
+        """
+        mock_load.return_value = "content"
+        etag = self.client.get("/api/orgs/demo/focus-areas").headers["etag"]
+        mock_load.reset_mock()
+
+        response = self.client.get(
+            "/api/orgs/demo/focus-areas", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        mock_load.assert_not_called()
+
+    @patch('api.main.assemble_prompt')
+    def test_generate_etag_depends_on_inputs(self, mock_assemble):
+        """
+        Given: Two prompts-only generate requests with different inputs
+        When: POST /api/goals/generate
+        Then: Each response carries a distinct ETag
+        """
+        mock_assemble.return_value = ("sys", "user")
+        payload = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+
+        first = self.client.post("/api/goals/generate", json=payload)
+        second = self.client.post(
+            "/api/goals/generate", json={**payload, "growth_intensity": "minimal"}
+        )
+
+        assert first.headers["etag"] != second.headers["etag"]
+        assert "cache-control" in first.headers
+
+
+@pytest.mark.unit
+class TestAPIBatchGenerateEndpoint:
+    """Test /api/goals/generate:batch endpoint - HTTP contract and per-item errors."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Set up test fixtures."""
+        self.client = TestClient(app)
+
+    @patch('api.main.assemble_prompts')
+    def test_batch_returns_results_in_request_order(self, mock_assemble):
+        """
+        Given: Batch of two valid items
+        When: POST /api/goals/generate:batch
+        Then: Returns 200 with one result per item, in order, and the shared framework
+        """
+        mock_assemble.return_value = [("sys", "user A"), ("sys", "user B")]
+        payload = {
+            "items": [
+                {"scale": "technical", "level": "L30", "growth_intensity": "moderate"},
+                {"scale": "technical", "level": "L40", "growth_intensity": "minimal"},
+            ]
+        }
+
+        response = self.client.post("/api/goals/generate:batch", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["framework"] == "sys"
+        assert [r["user_context"] for r in data["results"]] == ["user A", "user B"]
+        assert [r["inputs"]["level"] for r in data["results"]] == ["L30", "L40"]
+        assert data["count"] == 2 and data["errors"] == 0
+
+    @patch('api.main.assemble_prompts')
+    def test_batch_reports_item_errors_without_failing_request(self, mock_assemble):
+        """
+        Given: Batch where the assembler rejects one item
+        When: POST /api/goals/generate:batch
+        Then: Returns 200; the failing item carries an error with its status code
+        """
+        mock_assemble.return_value = [("sys", "user"), ValueError("No culture data")]
+        payload = {
+            "items": [
+                {"scale": "technical", "level": "L30", "growth_intensity": "moderate"},
+                {"scale": "technical", "level": "L999", "growth_intensity": "moderate"},
+            ]
+        }
+
+        data = self.client.post("/api/goals/generate:batch", json=payload).json()
+
+        assert data["results"][0]["error"] is None
+        assert data["results"][1]["user_context"] is None
+        assert data["results"][1]["error"]["status_code"] == 400
+        assert data["errors"] == 1
+
+    @patch('api.main.assemble_prompts')
+    def test_batch_applies_request_defaults(self, mock_assemble):
+        """
+        Given: Batch item without org or goal_style
+        When: POST /api/goals/generate:batch
+        Then: Assembler receives org 'demo' and goal style 'independent'
+        """
+        received = []
+
+        def capture(requests):
+            received.extend(requests)
+            return [("sys", "user") for _ in received]
+
+        mock_assemble.side_effect = capture
+        payload = {"items": [{"scale": "technical", "level": "L30", "growth_intensity": "moderate"}]}
+
+        self.client.post("/api/goals/generate:batch", json=payload)
+
+        (request,) = received
+        assert request.org_name == "demo"
+        assert request.goal_style == "independent"
+
+    @patch('api.main.assemble_prompts')
+    def test_batch_passes_item_budgets(self, mock_assemble):
+        """
+        Given: Batch where one item has max_tokens
+        When: POST /api/goals/generate:batch
+        Then: The assembler receives one budget per item; results carry token_estimate
+        """
+        mock_assemble.return_value = [("sys", "user A"), ("sys", "user B")]
+        item = {"scale": "technical", "level": "L30", "growth_intensity": "moderate"}
+        payload = {"items": [item, {**item, "max_tokens": 300}]}
+
+        data = self.client.post("/api/goals/generate:batch", json=payload).json()
+
+        assert mock_assemble.call_args[1]["max_tokens"] == [None, 300]
+        assert [r["token_estimate"] for r in data["results"]] == [
+            estimate_prompt_tokens("sys", "user A"),
+            estimate_prompt_tokens("sys", "user B"),
+        ]
+
+    def test_batch_rejects_empty_items(self):
+        """
+        Given: Batch with no items
+        When: POST /api/goals/generate:batch
+        Then: Returns 422 Unprocessable Entity
+        """
+        response = self.client.post("/api/goals/generate:batch", json={"items": []})
+
+        assert response.status_code == 422
+
+    def test_batch_rejects_invalid_item(self):
+        """
+        Given: Batch with an item missing a required field
+        When: POST /api/goals/generate:batch
+        Then: Returns 422 Unprocessable Entity
+        """
+        payload = {"items": [{"scale": "technical", "level": "L30"}]}
+
+        response = self.client.post("/api/goals/generate:batch", json=payload)
+
+        assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestAPIStreamGenerateEndpoint:
+    """Test /api/goals/generate:stream NDJSON endpoint with real data."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """Set up test fixtures."""
+        self.client = TestClient(app)
+        metadata = self.client.get("/api/metadata").json()
+        self.scale = metadata["scales"][0]
+        self.level = metadata["levels"][self.scale][0]
+
+    def _stream(self, lines):
+        body = "\n".join(json.dumps(line) if isinstance(line, dict) else line for line in lines)
+        response = self.client.post(
+            "/api/goals/generate:stream",
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        return response, [json.loads(line) for line in response.text.splitlines()]
+
+    def test_stream_emits_one_line_per_input_in_order(self):
+        """
+        Given: NDJSON body with three valid requests
+        When: POST /api/goals/generate:stream
+        Then: Returns NDJSON with one result line per input, in order
+        """
+        item = {"scale": self.scale, "level": self.level, "growth_intensity": "moderate"}
+        intensities = ["minimal", "moderate", "aggressive"]
+
+        response, results = self._stream([{**item, "growth_intensity": i} for i in intensities])
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert [r["inputs"]["growth_intensity"] for r in results] == intensities
+        assert all(r["user_context"] and r["error"] is None for r in results)
+
+    def test_stream_sends_framework_once(self):
+        """
+        Given: NDJSON body with two valid requests
+        When: POST /api/goals/generate:stream
+        Then: Only the first result line carries the shared framework prompt
+        """
+        item = {"scale": self.scale, "level": self.level, "growth_intensity": "moderate"}
+
+        _, results = self._stream([item, item])
+
+        assert results[0]["framework"]
+        assert "framework" not in results[1]
+
+    def test_stream_reports_invalid_lines_inline(self):
+        """
+        Given: NDJSON body with an unparseable line and an unknown level
+        When: POST /api/goals/generate:stream
+        Then: Each bad line yields an error result; the stream continues
+        """
+        valid = {"scale": self.scale, "level": self.level, "growth_intensity": "moderate"}
+
+        _, results = self._stream(
+            ["{not json", {**valid, "level": "L999 (Invalid)"}, "", valid]
+        )
+
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert results[0]["error"]["status_code"] == 422
+        assert results[1]["error"]["status_code"] == 400
+        assert results[2]["error"] is None
+
+    def test_stream_rejects_overlong_lines_inline(self, monkeypatch):
+        """
+        Given: A 300-byte line limit and a body whose second line is far longer, sent in chunks
+        When: POST /api/goals/generate:stream
+        Then: The long line yields a 413 error line; the lines around it are still served
+        """
+        monkeypatch.setattr("api.main.NDJSON_MAX_LINE_BYTES", 300)
+        item = {"scale": self.scale, "level": self.level, "growth_intensity": "moderate"}
+        valid = json.dumps(item).encode("utf-8")
+        chunks = [valid + b"\n" + b'{"focus_area": "', *([b"x" * 64] * 10), b'"}\n' + valid]
+
+        response = self.client.post(
+            "/api/goals/generate:stream",
+            content=iter(chunks),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        results = [json.loads(line) for line in response.text.splitlines()]
+
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert results[1]["error"]["status_code"] == 413
+        assert results[0]["error"] is None and results[2]["error"] is None
+
+    def test_stream_applies_max_tokens_per_line(self):
+        """
+        Given: The same request unbudgeted, just under its size, and with a 1-token budget
+        When: POST /api/goals/generate:stream
+        Then: The second line is trimmed to fit and the third fails with 400, like the
+              single-item endpoint
+        """
+        item = {"scale": self.scale, "level": self.level, "growth_intensity": "moderate"}
+        _, (full,) = self._stream([item])
+        budget = full["token_estimate"] - 1
+
+        _, results = self._stream(
+            [item, {**item, "max_tokens": budget}, {**item, "max_tokens": 1}]
+        )
+
+        assert results[0]["user_context"] == full["user_context"]
+        assert results[1]["error"] is None
+        assert results[1]["token_estimate"] <= budget
+        assert len(results[1]["user_context"]) < len(full["user_context"])
+        assert results[2]["error"]["status_code"] == 400
@@ -17,8 +17,18 @@ from myimpact.assembler import (
     discover_scales,
     discover_orgs,
     discover_levels,
+    PromptRequest,
+    _assemble_prompt,
     assemble_prompt,
+    assemble_prompts,
+    iter_assemble_prompts,
+    list_orgs,
+    load_metadata,
+    normalize_prompt_request,
+    focus_prompt_cache,
+    prompt_cache,
 )
+from myimpact.tokens import estimate_prompt_tokens
 
 
 @pytest.mark.integration
@@ -461,3 +471,424 @@ class TestDataIntegrity:
             # Should have at least one markdown element
             assert any(marker in content for marker in ["#", "-", "*", "•"]), \
                 f"Org '{org}' should contain markdown formatting"
+
+
+@pytest.mark.integration
+class TestResourceCachingIntegration:
+    """Verify loaders serve repeated calls from the shared resource cache."""
+
+    def test_load_culture_csv_returns_cached_object_on_repeat_call(self):
+        """
+        Given: Culture CSV that has not changed between calls
+        When: load_culture_csv() is called twice for the same scale
+        Then: The same parsed object is returned (no re-parse)
+        """
+        scale = discover_scales()[0]
+
+        assert load_culture_csv(scale) is load_culture_csv(scale)
+
+    def test_load_framework_prompt_returns_cached_object_on_repeat_call(self):
+        """
+        Given: Framework prompt file that has not changed between calls
+        When: load_framework_prompt() is called twice
+        Then: The same string object is returned (no re-read)
+        """
+        assert load_framework_prompt() is load_framework_prompt()
+
+
+@pytest.mark.integration
+class TestPromptCacheIntegration:
+    """Verify assembled prompts are memoized per normalized request."""
+
+    @pytest.fixture(autouse=True)
+    def clear_prompt_cache(self):
+        prompt_cache.clear()
+        focus_prompt_cache.clear()
+        yield
+        prompt_cache.clear()
+        focus_prompt_cache.clear()
+
+    def test_repeat_assemble_prompt_is_served_from_cache(self):
+        """
+        Given: A prompt assembled once
+        When: assemble_prompt() is called again with the same inputs
+        Then: The cached result is returned and counted as a hit
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+
+        first = assemble_prompt(scale, level, "moderate")
+        second = assemble_prompt(scale, level, "moderate")
+
+        assert second is first
+        assert prompt_cache.stats()["hits"] == 1
+
+    def test_focus_area_whitespace_is_normalized(self):
+        """
+        Given: Two focus areas differing only in surrounding whitespace
+        When: assemble_prompt() is called with each
+        Then: Both share one cache entry
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+
+        assemble_prompt(scale, level, "moderate", focus_area="Quality")
+        assemble_prompt(scale, level, "moderate", focus_area="  Quality\n")
+
+        assert len(focus_prompt_cache) == 1
+
+    def test_focus_area_prompts_do_not_evict_grid_prompts(self):
+        """
+        Given: A cached no-focus prompt
+        When: More unique focus areas are requested than focus_prompt_cache holds
+        Then: The no-focus prompt is still cached; only focus prompts were evicted
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+        grid_prompt = assemble_prompt(scale, level, "moderate")
+
+        for i in range(focus_prompt_cache.maxsize + 10):
+            assemble_prompt(scale, level, "moderate", focus_area=f"Focus {i}")
+
+        assert assemble_prompt(scale, level, "moderate") is grid_prompt
+        assert len(prompt_cache) == 1
+        assert focus_prompt_cache.stats()["evictions"] == 10
+
+    def test_inputs_outside_the_grid_do_not_evict_grid_prompts(self):
+        """
+        Given: A cached prompt for a discovered org and listed options
+        When: Unknown orgs and unlisted growth intensities and goal styles are requested
+        Then: Those prompts go to focus_prompt_cache and the grid prompt stays cached
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+        grid_prompt = assemble_prompt(scale, level, "moderate")
+
+        for i in range(focus_prompt_cache.maxsize):
+            assemble_prompt(scale, level, "moderate", org_name=f"no-such-org-{i}")
+            assemble_prompt(scale, level, f"intensity-{i}")
+            assemble_prompt(scale, level, "moderate", goal_style=f"style-{i}")
+
+        assert assemble_prompt(scale, level, "moderate") is grid_prompt
+        assert len(prompt_cache) == 1
+
+    def test_failed_assembly_is_not_cached(self):
+        """
+        Given: A request for an invalid level
+        When: assemble_prompt() raises ValueError
+        Then: Nothing is stored in the cache
+        """
+        with pytest.raises(ValueError):
+            assemble_prompt(discover_scales()[0], "L999 (Invalid)", "moderate")
+
+        assert len(prompt_cache) == 0
+
+
+@pytest.mark.unit
+class TestNormalizePromptRequest:
+    """Test request normalization used for cache keys."""
+
+    def test_blank_focus_area_normalizes_to_none(self):
+        """
+        Given: Whitespace-only focus area
+        When: normalize_prompt_request() is called
+        Then: focus_area is None
+        """
+        request = normalize_prompt_request("technical", "L30", "moderate", focus_area="   ")
+
+        assert request.focus_area is None
+
+    def test_defaults_match_assemble_prompt(self):
+        """
+        Given: Only required arguments
+        When: normalize_prompt_request() is called
+        Then: org_name and goal_style use assemble_prompt's defaults
+        """
+        request = normalize_prompt_request("technical", "L30", "moderate")
+
+        assert request.org_name == "demo"
+        assert request.goal_style == "independent"
+
+
+@pytest.mark.integration
+class TestMetadataIntegration:
+    """Verify the cached metadata payload and header-only level index."""
+
+    def test_load_metadata_matches_discovery_functions(self):
+        """
+        Given: Shipped resource files
+        When: load_metadata() is called
+        Then: Scales, levels and organizations match the discovery functions
+        """
+        _, metadata = load_metadata()
+
+        assert metadata["scales"] == discover_scales()
+        assert metadata["organizations"] == discover_orgs()
+        for scale in metadata["scales"]:
+            assert metadata["levels"][scale] == discover_levels(scale)
+
+    def test_load_metadata_reuses_payload_while_catalog_unchanged(self):
+        """
+        Given: A catalog that does not change between calls
+        When: load_metadata() is called twice
+        Then: The same payload object is returned
+        """
+        _, first = load_metadata()
+        _, second = load_metadata()
+
+        assert second is first
+
+    def test_load_metadata_rebuilds_when_file_added(self, test_workspace):
+        """
+        Given: Metadata loaded from a workspace with one org
+        When: A new org focus areas file is added
+        Then: The next load_metadata() includes the new org
+        """
+        _, before = load_metadata()
+        (test_workspace / "prompts" / "org_focus_areas_globex.md").write_text(
+            "# Focus", encoding="utf-8"
+        )
+
+        _, after = load_metadata()
+
+        assert before["organizations"] == ["acme"]
+        assert after["organizations"] == ["acme", "globex"]
+
+    def test_load_metadata_can_omit_organizations(self, test_workspace):
+        """
+        Given: A workspace with one org
+        When: load_metadata(include_orgs=False) is called
+        Then: The payload has scales and levels but no organizations list
+        """
+        _, metadata = load_metadata(include_orgs=False)
+
+        assert metadata["scales"] == ["technical"]
+        assert "organizations" not in metadata
+        assert load_metadata()[1]["organizations"] == ["acme"]
+
+    def test_list_orgs_pages_by_prefix(self, test_workspace):
+        """
+        Given: A workspace with orgs acme, globex, glacier and gloria
+        When: list_orgs() pages through the "gl" prefix two at a time
+        Then: Returns each matching org once, in order, then no next cursor
+        """
+        for org_name in ("globex", "glacier", "gloria"):
+            (test_workspace / "prompts" / f"org_focus_areas_{org_name}.md").write_text(
+                "# Focus", encoding="utf-8"
+            )
+
+        first = list_orgs(prefix="gl", limit=2)
+        second = list_orgs(prefix="gl", cursor=first.next_cursor, limit=2)
+
+        assert first.organizations == ["glacier", "globex"]
+        assert second.organizations == ["gloria"]
+        assert second.next_cursor is None
+        assert list_orgs(limit=10).organizations == ["acme", "glacier", "globex", "gloria"]
+
+    def test_levels_are_read_from_header_row_only(self, test_workspace):
+        """
+        Given: A culture CSV whose body rows are malformed
+        When: extract_levels_from_csv() is called
+        Then: Levels still come from the header row
+        """
+        (test_workspace / "data" / "culture_expectations_draft.csv").write_text(
+            'Cultural Attribute,L10 (Entry),L20 (Developing)\n"unterminated,\n',
+            encoding="utf-8",
+        )
+
+        assert extract_levels_from_csv("draft") == ["L10 (Entry)", "L20 (Developing)"]
+
+
+@pytest.mark.integration
+class TestBatchAssemblyIntegration:
+    """Verify batch assembly ordering, deduplication and error capture."""
+
+    def test_assemble_prompts_matches_single_assembly_in_order(self):
+        """
+        Given: Several distinct valid requests
+        When: assemble_prompts() is called
+        Then: Each result equals assemble_prompt() for that request, in order
+        """
+        scale = discover_scales()[0]
+        levels = extract_levels_from_csv(scale)[:2]
+        requests = [PromptRequest(scale, level, "moderate") for level in levels]
+
+        results = assemble_prompts(requests)
+
+        assert results == [assemble_prompt(*request) for request in requests]
+
+    def test_assemble_prompts_shares_result_for_duplicate_requests(self):
+        """
+        Given: Two requests that normalize to the same inputs
+        When: assemble_prompts() is called
+        Then: Both positions hold the same result object
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+
+        first, second = assemble_prompts(
+            [
+                PromptRequest(scale, level, "moderate", focus_area="Quality"),
+                PromptRequest(scale, level, "moderate", focus_area=" Quality "),
+            ]
+        )
+
+        assert first is second
+
+    def test_assemble_prompts_returns_exception_for_failing_request(self):
+        """
+        Given: A batch with one invalid level
+        When: assemble_prompts() is called
+        Then: That position holds the ValueError; other results are unaffected
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+
+        ok, failed = assemble_prompts(
+            [PromptRequest(scale, level, "moderate"), PromptRequest(scale, "L999", "moderate")]
+        )
+
+        assert isinstance(ok, tuple)
+        assert isinstance(failed, ValueError)
+
+    def test_assemble_prompts_applies_per_request_budgets(self):
+        """
+        Given: The same request twice, once without a budget and once with a tiny one
+        When: assemble_prompts() is called with max_tokens
+        Then: The unbudgeted one is assembled in full; the budgeted one fails like assemble_prompt()
+        """
+        scale = discover_scales()[0]
+        request = PromptRequest(scale, extract_levels_from_csv(scale)[0], "moderate")
+
+        full, over_budget = assemble_prompts([request, request], max_tokens=[None, 1])
+
+        assert full == assemble_prompt(*request)
+        assert isinstance(over_budget, ValueError)
+
+
+@pytest.mark.integration
+class TestStreamingAssemblyIntegration:
+    """Verify lazy prompt assembly."""
+
+    def test_iter_assemble_prompts_is_lazy(self):
+        """
+        Given: An input iterator that fails after its first item
+        When: Only the first result is consumed
+        Then: The failing input is never pulled
+        """
+        scale = discover_scales()[0]
+        level = extract_levels_from_csv(scale)[0]
+
+        def requests():
+            yield PromptRequest(scale, level, "moderate")
+            raise AssertionError("second request should not be pulled")
+
+        framework, user_context = next(iter_assemble_prompts(requests()))
+
+        assert level in user_context
+
+    def test_iter_assemble_prompts_raises_by_default(self):
+        """
+        Given: A request for an invalid level
+        When: iter_assemble_prompts() is consumed without return_exceptions
+        Then: The ValueError propagates
+        """
+        with pytest.raises(ValueError):
+            list(iter_assemble_prompts([PromptRequest(discover_scales()[0], "L999", "moderate")]))
+
+    def test_iter_assemble_prompts_yields_exceptions_when_requested(self):
+        """
+        Given: A request for an invalid level
+        When: iter_assemble_prompts(return_exceptions=True) is consumed
+        Then: The exception is yielded in place of a result
+        """
+        (result,) = iter_assemble_prompts(
+            [PromptRequest(discover_scales()[0], "L999", "moderate")], return_exceptions=True
+        )
+
+        assert isinstance(result, ValueError)
+
+
+@pytest.mark.integration
+class TestPromptBudgetIntegration:
+    """Verify max_tokens trimming of the org focus section."""
+
+    @pytest.fixture(autouse=True)
+    def workspace(self, test_workspace):
+        (test_workspace / "prompts" / "org_focus_areas_acme.md").write_text(
+            "Ship Faster\n- Automate releases.\n- Add canary deploys.\n\n"
+            "Raise Quality\n- Enforce coverage thresholds.\n- Add contract tests.\n",
+            encoding="utf-8",
+        )
+        self.full = assemble_prompt("technical", "L10 (Entry)", "moderate", org_name="acme")
+        self.full_tokens = estimate_prompt_tokens(*self.full)
+
+    def test_prompt_within_budget_is_unchanged(self):
+        """
+        Given: A budget the full prompt already fits
+        When: assemble_prompt(max_tokens=...) is called
+        Then: Returns the full prompt
+        """
+        prompt = assemble_prompt(
+            "technical", "L10 (Entry)", "moderate", org_name="acme", max_tokens=self.full_tokens
+        )
+
+        assert prompt == self.full
+
+    def test_condenses_org_focus_areas_to_fit(self):
+        """
+        Given: A budget slightly below the full prompt's estimate
+        When: assemble_prompt(max_tokens=...) is called
+        Then: Keeps every focus area heading with its first bullet only, within budget
+        """
+        prompt = assemble_prompt(
+            "technical", "L10 (Entry)", "moderate", org_name="acme", max_tokens=self.full_tokens - 1
+        )
+
+        _, user_context = prompt
+        assert estimate_prompt_tokens(*prompt) < self.full_tokens
+        assert "Ship Faster\n- Automate releases.\n\nRaise Quality\n" in user_context
+        assert "Add canary deploys" not in user_context
+        assert "Add contract tests" not in user_context
+
+    def test_drops_org_section_as_last_resort(self):
+        """
+        Given: A budget only the prompt without org focus areas fits
+        When: assemble_prompt(max_tokens=...) is called
+        Then: The org focus section is left out
+        """
+        request = PromptRequest("technical", "L10 (Entry)", "moderate", org_name="acme")
+        without_org = estimate_prompt_tokens(*_assemble_prompt(request, org_section=""))
+
+        _, user_context = assemble_prompt(
+            "technical", "L10 (Entry)", "moderate", org_name="acme", max_tokens=without_org
+        )
+
+        assert "Organizational Strategic Focus Areas" not in user_context
+        assert "Ship Faster" not in user_context
+
+    def test_trimmed_prompts_are_cached_per_step_not_per_budget(self):
+        """
+        Given: A prompt over budget
+        When: assemble_prompt() is called with many distinct max_tokens values
+        Then: prompt_cache holds the full prompt plus at most one entry per trim step
+        """
+        prompt_cache.clear()
+        request = PromptRequest("technical", "L10 (Entry)", "moderate", org_name="acme")
+        without_org = estimate_prompt_tokens(*_assemble_prompt(request, org_section=""))
+
+        for budget in range(without_org, self.full_tokens):
+            assemble_prompt(
+                "technical", "L10 (Entry)", "moderate", org_name="acme", max_tokens=budget
+            )
+
+        assert len(prompt_cache) <= 4
+
+    def test_rejects_budget_no_prompt_fits(self):
+        """
+        Given: A budget smaller than the prompt without any org focus areas
+        When: assemble_prompt(max_tokens=...) is called
+        Then: Raises ValueError naming the budget
+        """
+        with pytest.raises(ValueError, match="max_tokens budget of 10"):
+            assemble_prompt("technical", "L10 (Entry)", "moderate", org_name="acme", max_tokens=10)
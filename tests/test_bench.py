@@ -0,0 +1,209 @@
+"""Tests for myimpact.bench module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state what is measured and what counts as a regression
+- Bounded: Benchmarks run against the isolated test workspace
+- Fast: Timing windows are milliseconds
+- Reliable: Assertions never depend on how fast this machine is
+"""
+
+import json
+import sys
+
+import pytest
+
+from myimpact.bench import (
+    API_CASES,
+    BenchResult,
+    compare,
+    format_results,
+    load_baseline,
+    measure,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def _result(name="case", ops_per_sec=1000.0, alloc_bytes=2048):
+    return BenchResult(name, 100, ops_per_sec, 900.0, 1500.0, alloc_bytes)
+
+
+@pytest.mark.unit
+class TestMeasure:
+    """Test timing and allocation measurement of one operation."""
+
+    def test_reports_latency_percentiles_and_allocation(self):
+        """
+        Given: An operation that allocates a 64 KiB buffer
+        When: measure() runs it
+        Then: Reports positive throughput, p50 <= p99, and about 64 KiB allocated
+        """
+        result = measure("alloc", lambda: bytearray(64 * 1024), min_time=0.01)
+
+        assert result.name == "alloc"
+        assert result.iterations >= 1
+        assert result.ops_per_sec > 0
+        assert 0 < result.p50_us <= result.p99_us
+        assert 64 * 1024 <= result.alloc_bytes < 80 * 1024
+
+    def test_stops_at_max_iterations(self):
+        """
+        Given: A cheap operation and max_iterations=5
+        When: measure() runs with a long min_time
+        Then: Times exactly five calls
+        """
+        result = measure("noop", lambda: None, min_time=10, max_iterations=5)
+
+        assert result.iterations == 5
+
+
+@pytest.mark.unit
+class TestCompare:
+    """Test regression detection against a baseline."""
+
+    def test_flags_throughput_drop_beyond_tolerance(self):
+        """
+        Given: A baseline of 1000 ops/sec and tolerance 0.25
+        When: A run measures 700 ops/sec
+        Then: Reports an ops_per_sec regression
+        """
+        baseline = {"case": _result()._asdict()}
+
+        regressions = compare([_result(ops_per_sec=700.0)], baseline, tolerance=0.25)
+
+        assert [(r.name, r.metric, r.current) for r in regressions] == [
+            ("case", "ops_per_sec", 700.0)
+        ]
+
+    def test_flags_allocation_growth_beyond_tolerance(self):
+        """
+        Given: A baseline allocating 2 KiB per operation
+        When: A run allocates 8 KiB per operation
+        Then: Reports an alloc_bytes regression
+        """
+        baseline = {"case": _result()._asdict()}
+
+        regressions = compare([_result(alloc_bytes=8192)], baseline, tolerance=0.25)
+
+        assert [r.metric for r in regressions] == ["alloc_bytes"]
+
+    def test_small_changes_and_new_cases_pass(self):
+        """
+        Given: A run within tolerance and a case missing from the baseline
+        When: compare() is called
+        Then: Reports no regressions
+        """
+        baseline = {"case": _result()._asdict()}
+        results = [_result(ops_per_sec=900.0, alloc_bytes=2100), _result(name="new", ops_per_sec=1)]
+
+        assert compare(results, baseline, tolerance=0.25) == []
+
+    def test_flags_baseline_cases_that_did_not_run(self):
+        """
+        Given: A baseline with two cases
+        When: Only one of them ran, with or without naming the cases that were asked for
+        Then: The other is a "missing" regression unless it was not asked for
+        """
+        baseline = {"case": _result()._asdict(), "other": _result(name="other")._asdict()}
+
+        regressions = compare([_result()], baseline)
+
+        assert [(r.name, r.metric, r.current) for r in regressions] == [("other", "missing", 0)]
+        assert compare([_result()], baseline, names=["case"]) == []
+
+
+@pytest.mark.unit
+class TestBaselineFile:
+    """Test saving, loading and displaying baselines."""
+
+    def test_round_trips_results(self, tmp_path):
+        """
+        Given: Results saved with save_baseline()
+        When: load_baseline() reads the file
+        Then: Returns the measurements keyed by case name
+        """
+        path = tmp_path / "baseline.json"
+        save_baseline(path, [_result()])
+
+        assert load_baseline(path) == {"case": _result()._asdict()}
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """
+        Given: A JSON file without the baseline format marker
+        When: load_baseline() reads it
+        Then: Raises ValueError
+        """
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"results": {}}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="baseline format"):
+            load_baseline(path)
+
+    def test_table_shows_change_against_baseline(self):
+        """
+        Given: A result 20% faster than its baseline and one without a baseline
+        When: format_results() renders them
+        Then: Shows +20% and "new" in the comparison column
+        """
+        baseline = {"case": _result()._asdict()}
+
+        table = format_results([_result(ops_per_sec=1200.0), _result(name="other")], baseline)
+
+        assert "+20%" in table
+        assert "new" in table.splitlines()[-1]
+
+
+@pytest.mark.integration
+class TestRunBenchmarks:
+    """Test running benchmark cases against the isolated test workspace."""
+
+    def test_runs_selected_assembler_and_api_cases(self, test_workspace):
+        """
+        Given: The test workspace
+        When: run_benchmarks() runs one assembler case and the generate endpoint case
+        Then: Returns one result per case, in suite order
+        """
+        results, skipped = run_benchmarks(
+            ["api /api/goals/generate", "assemble_prompt[grid]"], min_time=0.01
+        )
+
+        assert [result.name for result in results] == [
+            "assemble_prompt[grid]",
+            "api /api/goals/generate",
+        ]
+        assert skipped == []
+
+    def test_skips_api_cases_only_without_api_extras(self, test_workspace, monkeypatch):
+        """
+        Given: httpx cannot be imported
+        When: run_benchmarks() runs an assembler case and an API case
+        Then: Runs the assembler case and reports the API case as skipped
+        """
+        monkeypatch.setitem(sys.modules, "httpx", None)
+
+        results, skipped = run_benchmarks(
+            ["assemble_prompt[grid]", "api /api/metadata"], min_time=0.01
+        )
+
+        assert [result.name for result in results] == ["assemble_prompt[grid]"]
+        assert skipped == ["api /api/metadata"]
+
+    def test_missing_api_package_is_an_error_not_a_skip(self, test_workspace, monkeypatch):
+        """
+        Given: The api extras installed but api.main not importable (outside the repository)
+        When: run_benchmarks() is asked for the API cases
+        Then: Raises RuntimeError instead of skipping them
+        """
+        monkeypatch.setitem(sys.modules, "api.main", None)
+
+        with pytest.raises(RuntimeError, match="repository root"):
+            run_benchmarks(list(API_CASES), min_time=0.01)
+
+    def test_rejects_unknown_case(self, test_workspace):
+        """
+        Given: A case name that does not exist
+        When: run_benchmarks() is called
+        Then: Raises ValueError naming it
+        """
+        with pytest.raises(ValueError, match="nope"):
+            run_benchmarks(["nope"], min_time=0.01)
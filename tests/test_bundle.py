@@ -0,0 +1,113 @@
+"""Tests for myimpact.bundle module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state build/serve round-trip behavior
+- Bounded: Bundles are built from the isolated test workspace
+- Fast: Tiny resource files, bundles written to tmp_path
+- Reliable: Compares bundle-served results against file-served results
+"""
+
+import pytest
+
+from myimpact import assembler
+from myimpact.bundle import ResourceBundle, build_bundle
+from myimpact.stores import FilesystemStore
+
+
+@pytest.fixture
+def bundle_path(test_workspace):
+    """A bundle built from the test workspace; the assembler is back on files afterwards."""
+    path = test_workspace / "resources.bundle"
+    build_bundle(path, assembler.get_resource_store())
+    yield path
+    assembler.use_resource_bundle(None)
+
+
+@pytest.mark.integration
+class TestResourceBundleIntegration:
+    """Test building a bundle and serving the assembler from it."""
+
+    def test_build_reports_bundled_resources(self, test_workspace):
+        """
+        Given: A workspace with one scale and one org
+        When: build_bundle() is called
+        Then: Reports the bundled scale and org counts
+        """
+        path = test_workspace / "resources.bundle"
+
+        counts = build_bundle(path, assembler.get_resource_store())
+
+        assert counts == {"scales": 1, "orgs": 1}
+
+    def test_bundle_serves_identical_prompts_and_metadata(self, bundle_path):
+        """
+        Given: A bundle built from the workspace files
+        When: The assembler is switched to the bundle
+        Then: Prompts, metadata and fingerprints equal the file-served ones
+        """
+        requests = list(assembler.iter_prompt_grid())
+        requests.append(assembler.PromptRequest("technical", "L10 (Entry)", "minimal", "none"))
+        expected_prompts = [assembler._assemble_prompt(r) for r in requests]
+        expected_metadata = assembler.load_metadata()
+        expected_fingerprint = assembler.resource_fingerprint("technical", "acme")
+
+        assembler.use_resource_bundle(bundle_path)
+
+        assert [assembler._assemble_prompt(r) for r in requests] == expected_prompts
+        assert assembler.load_metadata() == expected_metadata
+        assert assembler.resource_fingerprint("technical", "acme") == expected_fingerprint
+
+    def test_bundle_is_independent_of_source_files(self, bundle_path, test_workspace):
+        """
+        Given: An active bundle
+        When: The source files are deleted
+        Then: Discovery and assembly still succeed from the bundle
+        """
+        assembler.use_resource_bundle(bundle_path)
+        for path in (test_workspace / "data").iterdir():
+            path.unlink()
+
+        assert assembler.discover_scales() == ["technical"]
+        assert assembler.assemble_prompt("technical", "L20 (Developing)", "moderate", "acme")
+
+    def test_missing_resources_raise_file_not_found(self, bundle_path):
+        """
+        Given: An active bundle
+        When: A scale or org it does not hold is loaded
+        Then: Raises FileNotFoundError like a missing file would
+        """
+        assembler.use_resource_bundle(bundle_path)
+
+        with pytest.raises(FileNotFoundError, match="Culture CSV not found"):
+            assembler.load_culture_matrix("leadership")
+        with pytest.raises(FileNotFoundError, match="Org focus areas file not found"):
+            assembler.load_org_focus_areas("globex")
+
+    def test_rejects_files_that_are_not_bundles(self, tmp_path):
+        """
+        Given: A file without the bundle header
+        When: It is opened as a ResourceBundle
+        Then: Raises ValueError
+        """
+        path = tmp_path / "resources.bundle"
+        path.write_bytes(b"not a bundle")
+
+        with pytest.raises(ValueError):
+            ResourceBundle(path)
+
+    def test_build_skips_resources_that_vanished(self, test_workspace):
+        """
+        Given: A source store listing an org whose signature is gone (deleted after listing)
+        When: build_bundle() is called
+        Then: Bundles the remaining resources instead of failing
+        """
+        source = FilesystemStore(test_workspace / "data", test_workspace / "prompts")
+        source.orgs = lambda: ["acme", "globex"]
+        path = test_workspace / "resources.bundle"
+
+        counts = build_bundle(path, source)
+
+        bundle = ResourceBundle(path)
+        assert counts == {"scales": 1, "orgs": 1}
+        assert bundle.orgs() == ["acme"]
+        bundle.close()
@@ -0,0 +1,251 @@
+"""Tests for myimpact.cache module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state caching and revalidation behavior
+- Bounded: Tests exercise the cache only, with counting parsers
+- Fast: Tiny files under tmp_path
+- Reliable: Signatures are forced with os.utime, not wall-clock timing
+"""
+
+import os
+
+import pytest
+
+from myimpact.cache import LRUCache, ResourceCache, TTLCache, stat_signature
+
+
+class CountingParser:
+    """Parser double that records how often it is invoked."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return path.read_text(encoding="utf-8")
+
+
+def _rewrite(path, content, mtime_ns):
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.unit
+class TestResourceCacheUnit:
+    """Test stat-validated loading of parsed resources."""
+
+    def test_load_parses_once_for_unchanged_file(self, tmp_path):
+        """
+        Given: A resource file that does not change
+        When: ResourceCache.load() is called repeatedly
+        Then: The parser runs once and the same object is returned
+        """
+        path = tmp_path / "resource.txt"
+        path.write_text("hello", encoding="utf-8")
+        cache = ResourceCache()
+        parser = CountingParser()
+
+        first = cache.load(path, parser)
+        second = cache.load(path, parser)
+
+        assert parser.calls == 1
+        assert first is second
+
+    def test_load_reparses_after_file_changes(self, tmp_path):
+        """
+        Given: A cached resource file
+        When: The file is rewritten with a new mtime and size
+        Then: The next load re-parses and returns the new content
+        """
+        path = tmp_path / "resource.txt"
+        _rewrite(path, "old", 1_000_000_000)
+        cache = ResourceCache()
+        parser = CountingParser()
+        cache.load(path, parser)
+
+        _rewrite(path, "new content", 2_000_000_000)
+
+        assert cache.load(path, parser) == "new content"
+        assert parser.calls == 2
+
+    def test_load_keeps_kinds_separate(self, tmp_path):
+        """
+        Given: One file loaded under two kinds
+        When: Both kinds are loaded
+        Then: Each kind holds its own parsed value
+        """
+        path = tmp_path / "resource.txt"
+        path.write_text("abc", encoding="utf-8")
+        cache = ResourceCache()
+
+        text = cache.load(path, lambda p: p.read_text(encoding="utf-8"), kind="text")
+        length = cache.load(path, lambda p: len(p.read_text(encoding="utf-8")), kind="length")
+
+        assert text == "abc"
+        assert length == 3
+        assert len(cache) == 2
+
+    def test_load_raises_for_missing_file(self, tmp_path):
+        """
+        Given: A path that does not exist
+        When: ResourceCache.load() is called
+        Then: Raises FileNotFoundError without invoking the parser
+        """
+        cache = ResourceCache()
+        parser = CountingParser()
+
+        with pytest.raises(FileNotFoundError):
+            cache.load(tmp_path / "missing.txt", parser)
+        assert parser.calls == 0
+
+    def test_load_forgets_deleted_file(self, tmp_path):
+        """
+        Given: A cached resource file
+        When: The file is deleted
+        Then: Loading raises FileNotFoundError and the entry is dropped
+        """
+        path = tmp_path / "resource.txt"
+        path.write_text("hello", encoding="utf-8")
+        cache = ResourceCache()
+        cache.load(path, CountingParser())
+
+        path.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            cache.load(path, CountingParser())
+        assert len(cache) == 0
+
+    def test_stat_signature_is_none_for_missing_file(self, tmp_path):
+        """
+        Given: A path that does not exist
+        When: stat_signature() is called
+        Then: Returns None
+        """
+        assert stat_signature(tmp_path / "missing.txt") is None
+
+    def test_trusted_signature_memo_is_bounded(self, tmp_path, monkeypatch):
+        """
+        Given: A trusted cache whose signature memo holds 8 paths
+        When: Signatures of 50 distinct (missing) paths are looked up
+        Then: At most 8 stay memoized and a repeat lookup still answers correctly
+        """
+        monkeypatch.setattr("myimpact.cache.SIGNATURE_MEMO_SIZE", 8)
+        cache = ResourceCache()
+        cache.trusted = True
+
+        for i in range(50):
+            cache.signature(tmp_path / f"org_{i}.md")
+
+        assert len(cache._signatures) == 8
+        assert cache.signature(tmp_path / "org_0.md") is None
+
+
+@pytest.mark.unit
+class TestLRUCacheUnit:
+    """Test bounded LRU behavior and counters."""
+
+    def test_get_counts_hits_and_misses(self):
+        """
+        Given: Cache with one entry
+        When: A present and an absent key are looked up
+        Then: One hit and one miss are recorded
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_put_evicts_least_recently_used(self):
+        """
+        Given: Full cache where 'a' was read after 'b' was stored
+        When: A new entry is stored
+        Then: 'b' (least recently used) is evicted and counted
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        cache.put("c", 3)
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_maxsize_disables_storage(self):
+        """
+        Given: Cache with maxsize 0
+        When: An entry is stored
+        Then: Nothing is kept
+        """
+        cache = LRUCache(maxsize=0)
+        cache.put("a", 1)
+
+        assert len(cache) == 0
+
+    def test_clear_resets_entries_and_counters(self):
+        """
+        Given: Cache with entries and recorded lookups
+        When: clear() is called
+        Then: Entries and counters are reset
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.get("a")
+
+        cache.clear()
+
+        assert cache.stats() == {"size": 0, "maxsize": 2, "hits": 0, "misses": 0, "evictions": 0}
+
+
+class FakeClock:
+    """A clock the test advances by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTTLCacheUnit:
+    """Test TTLCache expiry on top of LRU eviction."""
+
+    def test_entry_expires_after_ttl(self):
+        """
+        Given: An entry stored in a cache with a 10 second TTL
+        When: It is read before and after the TTL elapses
+        Then: It is a hit before and an expired miss after
+        """
+        clock = FakeClock()
+        cache = TTLCache(maxsize=4, ttl=10, clock=clock)
+        cache.put("k", "v")
+
+        clock.now += 9.9
+        assert cache.get("k") == "v"
+        clock.now += 0.2
+        assert cache.get("k") is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 1, 1)
+        assert stats["size"] == 0
+
+    def test_still_evicts_least_recently_used(self):
+        """
+        Given: A full cache
+        When: Another entry is stored
+        Then: The least recently used entry is evicted
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
@@ -7,11 +7,18 @@ Following Martin Fowler's Test Shapes principles:
 - Reliable: Only fail for real CLI contract changes
 """
 
+import json
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import patch
 from click.testing import CliRunner
 from myimpact.cli import main, discover_org_names, discover_scales
 from myimpact.assembler import extract_levels_from_csv
+from myimpact.bundle import ResourceBundle
+from myimpact.stores import SQLiteStore
 
 
 @pytest.mark.unit
@@ -192,6 +199,21 @@ class TestCLIGenerateCommand:
         call_kwargs = mock_assemble.call_args[1]
         assert call_kwargs["goal_style"] == "independent"
 
+    @patch('myimpact.cli.assemble_prompt')
+    def test_generate_passes_max_tokens_only_when_given(self, mock_assemble):
+        """
+        Given: generate command with and without --max-tokens
+        When: Invoked
+        Then: Assembler receives max_tokens only when the flag is set
+        """
+        mock_assemble.return_value = ("sys", "user")
+
+        self.runner.invoke(main, ["generate", "technical", "L30", "moderate"])
+        assert "max_tokens" not in mock_assemble.call_args[1]
+
+        self.runner.invoke(main, ["generate", "technical", "L30", "moderate", "--max-tokens", "800"])
+        assert mock_assemble.call_args[1]["max_tokens"] == 800
+
 
 @pytest.mark.unit
 class TestCLIListOptionsCommand:
@@ -358,6 +380,271 @@ class TestCLIGenerateIntegration:
         assert "====" in result.output or "----" in result.output
 
 
+# ============================================================================
+# MATERIALIZE COMMAND TESTS
+# ============================================================================
+@pytest.mark.integration
+class TestCLIMaterializeCommand:
+    """Test 'materialize' command with real data."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.runner = CliRunner()
+
+    def test_materialize_writes_artifact(self, tmp_path):
+        """
+        Given: materialize command with an output path
+        When: Invoked
+        Then: Succeeds, reports the prompt count and writes the artifact
+        """
+        output = tmp_path / "prompts.json.gz"
+
+        result = self.runner.invoke(main, ["materialize", "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert "Materialized" in result.output
+        assert output.exists() and output.stat().st_size > 0
+
+
+@pytest.mark.integration
+class TestCLIBundleCommand:
+    """Test 'bundle' command against the isolated test workspace."""
+
+    def test_bundle_writes_resource_bundle(self, test_workspace):
+        """
+        Given: bundle command with an output path
+        When: Invoked
+        Then: Succeeds, reports what was bundled and writes the file
+        """
+        output = test_workspace / "resources.bundle"
+
+        result = CliRunner().invoke(main, ["bundle", "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert "Bundled 1 scales and 1 orgs" in result.output
+        assert output.stat().st_size > 0
+
+
+@pytest.mark.integration
+class TestCLIExportSQLiteCommand:
+    """Test 'export-sqlite' command against the isolated test workspace."""
+
+    def test_export_sqlite_writes_database(self, test_workspace):
+        """
+        Given: export-sqlite command with an output path
+        When: Invoked
+        Then: Succeeds and writes a database the SQLite store can serve
+        """
+        output = test_workspace / "resources.db"
+
+        result = CliRunner().invoke(main, ["export-sqlite", "--output", str(output)])
+
+        assert result.exit_code == 0
+        assert "Exported 1 scales and 1 orgs" in result.output
+        assert SQLiteStore(output).scales() == ["technical"]
+
+
+@pytest.mark.integration
+class TestCLIBenchCommand:
+    """Test 'bench' command against the isolated test workspace."""
+
+    def test_bench_reports_and_saves_baseline(self, test_workspace):
+        """
+        Given: bench command for one case with --save-baseline
+        When: Invoked
+        Then: Prints the results table and writes a baseline containing the case
+        """
+        baseline = test_workspace / "baseline.json"
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "bench",
+                "--case", "extract_culture_for_level",
+                "--min-time", "0.01",
+                "--save-baseline", str(baseline),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "ops/sec" in result.output and "extract_culture_for_level" in result.output
+        assert list(json.loads(baseline.read_text())["results"]) == ["extract_culture_for_level"]
+
+    def test_bench_fails_on_regression_against_baseline(self, test_workspace):
+        """
+        Given: A baseline no machine can match (1e12 ops/sec)
+        When: bench runs that case with --baseline
+        Then: Reports the regression and exits with status 1
+        """
+        baseline = test_workspace / "baseline.json"
+        baseline.write_text(
+            json.dumps(
+                {
+                    "format": 1,
+                    "results": {
+                        "extract_culture_for_level": {"ops_per_sec": 1e12, "alloc_bytes": 1e9}
+                    },
+                }
+            )
+        )
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "bench",
+                "--case", "extract_culture_for_level",
+                "--min-time", "0.01",
+                "--baseline", str(baseline),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "REGRESSION extract_culture_for_level: ops_per_sec" in result.output
+
+    def test_bench_fails_when_baseline_case_did_not_run(self, test_workspace, monkeypatch):
+        """
+        Given: A baseline with an API case and no httpx to run it with
+        When: bench runs that case with --baseline
+        Then: Reports the skip and the case missing from the run, and exits with status 1
+        """
+        monkeypatch.setitem(sys.modules, "httpx", None)
+        baseline = test_workspace / "baseline.json"
+        baseline.write_text(
+            json.dumps(
+                {
+                    "format": 1,
+                    "results": {"api /api/metadata": {"ops_per_sec": 1.0, "alloc_bytes": 1}},
+                }
+            )
+        )
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "bench",
+                "--case", "api /api/metadata",
+                "--min-time", "0.01",
+                "--baseline", str(baseline),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "Skipped api /api/metadata: the API extras are not installed" in result.output
+        assert "REGRESSION api /api/metadata: in the baseline but not run" in result.output
+
+
+@pytest.mark.integration
+class TestCLIServeCommand:
+    """Test 'serve' command with uvicorn.run patched out."""
+
+    def test_serve_shares_one_temporary_bundle_with_workers(self, test_workspace, monkeypatch):
+        """
+        Given: No MYIMPACT_RESOURCE_BUNDLE configured
+        When: serve is invoked with several workers
+        Then: uvicorn runs with a freshly built bundle exported, which is removed afterwards
+        """
+        monkeypatch.delenv("MYIMPACT_RESOURCE_BUNDLE", raising=False)
+        seen = {}
+
+        def run(app, **kwargs):
+            seen["bundle"] = os.environ["MYIMPACT_RESOURCE_BUNDLE"]
+            seen["bundled_scales"] = ResourceBundle(seen["bundle"]).scales()
+            seen["kwargs"] = kwargs
+
+        with patch("uvicorn.run", side_effect=run):
+            result = CliRunner().invoke(main, ["serve", "--workers", "4"])
+
+        assert result.exit_code == 0
+        assert seen["bundled_scales"] == ["technical"]
+        assert seen["kwargs"]["workers"] == 4
+        assert not os.path.exists(seen["bundle"])
+        assert "MYIMPACT_RESOURCE_BUNDLE" not in os.environ
+
+    def test_serve_leaves_configured_database_in_charge(self, test_workspace, monkeypatch):
+        """
+        Given: MYIMPACT_RESOURCE_DB configured and no bundle
+        When: serve is invoked
+        Then: No bundle is built or exported, so the workers serve the database
+        """
+        monkeypatch.delenv("MYIMPACT_RESOURCE_BUNDLE", raising=False)
+        monkeypatch.setenv("MYIMPACT_RESOURCE_DB", str(test_workspace / "resources.db"))
+        seen = {}
+
+        def run(app, **kwargs):
+            seen["bundle"] = os.environ.get("MYIMPACT_RESOURCE_BUNDLE")
+
+        with patch("uvicorn.run", side_effect=run), patch(
+            "myimpact.bundle.build_bundle"
+        ) as build_bundle:
+            result = CliRunner().invoke(main, ["serve"])
+
+        assert result.exit_code == 0
+        assert seen["bundle"] is None
+        build_bundle.assert_not_called()
+
+
+# ============================================================================
+# STARTUP TESTS
+# ============================================================================
+# Extra import time `myimpact --help` may spend beyond importing click itself
+IMPORT_BUDGET_US = 15_000
+
+
+def _import_times(code: str) -> dict:
+    """Run code under `python -X importtime` and return {module: self time in us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.slow
+class TestCLIStartup:
+    """Test that CLI startup stays cheap."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.times = _import_times(
+            "from myimpact.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+
+    def test_help_does_not_load_assembler(self):
+        """
+        Given: A fresh interpreter
+        When: The CLI is imported and `--help` runs
+        Then: The assembler and its parsing dependencies are never imported
+        """
+        for module in ("myimpact.assembler", "myimpact.cache", "csv", "json"):
+            assert module not in self.times
+
+    def test_help_import_time_within_budget(self):
+        """
+        Given: A fresh interpreter
+        When: The CLI is imported and `--help` runs
+        Then: Modules imported beyond click itself stay within IMPORT_BUDGET_US
+        """
+        baseline = _import_times("import click")
+
+        extra = {m: us for m, us in self.times.items() if m not in baseline}
+
+        assert sum(extra.values()) <= IMPORT_BUDGET_US, sorted(
+            extra.items(), key=lambda item: -item[1]
+        )
+
+
 # ============================================================================
 # DISCOVERY FUNCTION TESTS
 # ============================================================================
@@ -463,3 +750,88 @@ class TestCLIHelp:
         
         assert result.exit_code == 0
         assert "SCALE" in result.output or "scale" in result.output.lower()
+
+
+@pytest.mark.integration
+class TestCLIGenerateBatchCommand:
+    """Test 'generate-batch' command against the isolated test workspace."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_workspace, tmp_path):
+        self.runner = CliRunner()
+        self.roster = tmp_path / "roster.csv"
+        self.roster.write_text(
+            "id,scale,level,intensity,org\n"
+            "alice,technical,L10 (Entry),moderate,acme\n"
+            "bob,technical,L20 (Developing),aggressive,\n",
+            encoding="utf-8",
+        )
+
+    def test_generate_batch_writes_jsonl(self, tmp_path):
+        """
+        Given: A two-row roster and a JSONL output path
+        When: generate-batch is invoked
+        Then: Writes one line per employee, with the framework only on the first
+        """
+        output = tmp_path / "prompts.jsonl"
+
+        result = self.runner.invoke(
+            main, ["generate-batch", str(self.roster), "--output", str(output)]
+        )
+
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert result.exit_code == 0
+        assert [line["id"] for line in lines] == ["alice", "bob"]
+        assert lines[0]["framework"] == "You generate SMART goals.\n"
+        assert "framework" not in lines[1]
+        assert "L20 (Developing)" in lines[1]["user_context"]
+
+    def test_generate_batch_writes_one_file_per_employee(self, tmp_path):
+        """
+        Given: A two-row roster and an output directory
+        When: generate-batch is invoked
+        Then: Writes <id>.txt files laid out like `generate` output
+        """
+        output_dir = tmp_path / "out"
+
+        result = self.runner.invoke(
+            main, ["generate-batch", str(self.roster), "--output-dir", str(output_dir)]
+        )
+
+        assert result.exit_code == 0
+        assert sorted(p.name for p in output_dir.iterdir()) == ["alice.txt", "bob.txt"]
+        text = (output_dir / "alice.txt").read_text(encoding="utf-8")
+        assert "GOAL FRAMEWORK" in text and "USER CONTEXT" in text
+
+    def test_generate_batch_reports_failed_rows(self, tmp_path):
+        """
+        Given: A roster with an unknown level
+        When: generate-batch is invoked
+        Then: Other rows are still written and the command exits 1
+        """
+        self.roster.write_text(
+            "scale,level,intensity\ntechnical,L999,moderate\ntechnical,L10 (Entry),moderate\n",
+            encoding="utf-8",
+        )
+        output = tmp_path / "prompts.jsonl"
+
+        result = self.runner.invoke(
+            main, ["generate-batch", str(self.roster), "--output", str(output)]
+        )
+
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert result.exit_code == 1
+        assert lines[0]["error"] and lines[1]["user_context"]
+
+    def test_generate_batch_rejects_both_outputs(self, tmp_path):
+        """
+        Given: Both --output and --output-dir
+        When: generate-batch is invoked
+        Then: Fails with a usage error
+        """
+        result = self.runner.invoke(
+            main,
+            ["generate-batch", str(self.roster), "-o", "a.jsonl", "--output-dir", str(tmp_path)],
+        )
+
+        assert result.exit_code == 2
@@ -0,0 +1,102 @@
+"""Tests for myimpact.culture module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state lookup and rendering behavior
+- Bounded: Tests compile in-memory dicts, no file I/O
+- Fast: Tiny hand-built culture data
+- Reliable: Independent of shipped CSV content
+"""
+
+import pytest
+
+from myimpact.culture import compile_culture_matrix
+
+
+@pytest.fixture
+def minimal_culture_data():
+    """Valid minimal culture data in load_culture_csv() shape."""
+    return {
+        "Humble": {"L10 (Entry)": "Asks for help.", "L20 (Developing)": "Shares credit."},
+        "Ownership": {"L10 (Entry)": "Finishes tasks.", "L20 (Developing)": "Owns features."},
+    }
+
+
+@pytest.mark.unit
+class TestCultureMatrixUnit:
+    """Test compiled culture matrix lookups."""
+
+    def test_column_returns_expectations_in_attribute_order(self, minimal_culture_data):
+        """
+        Given: Compiled matrix with two attributes
+        When: column() is called for a known level
+        Then: Returns that level's expectations in attribute order
+        """
+        matrix = compile_culture_matrix(minimal_culture_data)
+
+        assert matrix.column("L20 (Developing)") == ("Shares credit.", "Owns features.")
+
+    def test_column_returns_none_for_unknown_level(self, minimal_culture_data):
+        """
+        Given: Compiled matrix
+        When: column() is called for a level not in the data
+        Then: Returns None
+        """
+        matrix = compile_culture_matrix(minimal_culture_data)
+
+        assert matrix.column("L999 (Invalid)") is None
+
+    def test_expectations_matches_source_mapping(self, minimal_culture_data):
+        """
+        Given: Compiled matrix
+        When: expectations() is called for a level
+        Then: Returns the same {attribute: expectation} mapping as the source data
+        """
+        matrix = compile_culture_matrix(minimal_culture_data)
+
+        assert matrix.expectations("L10 (Entry)") == {
+            "Humble": "Asks for help.",
+            "Ownership": "Finishes tasks.",
+        }
+
+    def test_expectations_skips_attributes_missing_the_level(self):
+        """
+        Given: Culture data where one attribute lacks a level
+        When: expectations() is called for that level
+        Then: Only attributes that define the level are returned
+        """
+        matrix = compile_culture_matrix({"Humble": {"L10": "a"}, "Ownership": {"L20": "b"}})
+
+        assert matrix.expectations("L10") == {"Humble": "a"}
+
+    def test_bullets_are_prerendered_markdown(self, minimal_culture_data):
+        """
+        Given: Compiled matrix
+        When: bullets() is called for a level
+        Then: Returns one markdown bullet per attribute, reused across calls
+        """
+        matrix = compile_culture_matrix(minimal_culture_data)
+
+        bullets = matrix.bullets("L10 (Entry)")
+
+        assert bullets == "- **Humble**: Asks for help.\n- **Ownership**: Finishes tasks."
+        assert matrix.bullets("L10 (Entry)") is bullets
+
+    def test_bullets_are_empty_for_unknown_level(self, minimal_culture_data):
+        """
+        Given: Compiled matrix
+        When: bullets() is called for an unknown level
+        Then: Returns an empty string
+        """
+        matrix = compile_culture_matrix(minimal_culture_data)
+
+        assert matrix.bullets("L999 (Invalid)") == ""
+
+    def test_as_dict_round_trips_source_mapping(self):
+        """
+        Given: Culture data where one attribute lacks a level
+        When: as_dict() is called on the compiled matrix
+        Then: Returns the source mapping, without the missing cell
+        """
+        culture = {"Humble": {"L10": "a", "L20": "b"}, "Ownership": {"L20": "c"}}
+
+        assert compile_culture_matrix(culture).as_dict() == culture
@@ -0,0 +1,336 @@
+"""Tests for myimpact.generation module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state each provider's contract
+- Bounded: HTTP providers talk to an in-process httpx transport, never the network
+- Fast: Stub delays are milliseconds
+- Reliable: Stub output is a pure function of the prompt
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from myimpact.generation import (
+    GenerationError,
+    GenerationResult,
+    LLMProvider,
+    OpenAICompatibleProvider,
+    StubProvider,
+    provider_from_env,
+)
+
+PROMPT = ("You generate SMART goals.", "**Job Level**: L30\n**Goal Style**: progressive\n")
+
+
+def _collect(provider, *prompt):
+    """Run provider.stream() to completion and return everything it yielded."""
+
+    async def run():
+        return [item async for item in provider.stream(*prompt)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+class TestStubProvider:
+    """Test the deterministic offline provider."""
+
+    def test_same_prompt_generates_same_goals(self):
+        """
+        Given: Two stub providers
+        When: Both generate for the same prompt
+        Then: Return identical content with usage estimates
+        """
+        first = asyncio.run(StubProvider().generate(*PROMPT))
+        second = asyncio.run(StubProvider().generate(*PROMPT))
+
+        assert first == second
+        assert first.model == "stub"
+        assert first.usage["prompt_tokens"] > 0
+
+    def test_goal_count_follows_goal_style(self):
+        """
+        Given: A progressive and an independent prompt
+        When: The stub generates goals
+        Then: Returns four quarterly goals and six goals respectively
+        """
+        provider = StubProvider()
+        framework, user_context = PROMPT
+
+        progressive = provider.goals(framework, user_context)
+        independent = provider.goals(framework, user_context.replace("progressive", "independent"))
+
+        assert len(progressive) == 4 and progressive[0].startswith("1. Q1: Goal 1 for L30")
+        assert len(independent) == 6
+
+    def test_limits_concurrent_completions(self):
+        """
+        Given: A provider allowing two concurrent completions
+        When: Six generations are started at once
+        Then: No more than two run at the same time
+        """
+        provider = StubProvider(delay=0.01, max_concurrency=2)
+        running = peak = 0
+        complete = provider._complete
+
+        async def tracked(*prompt):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            try:
+                return await complete(*prompt)
+            finally:
+                running -= 1
+
+        provider._complete = tracked
+
+        async def run():
+            await asyncio.gather(*(provider.generate(*PROMPT) for _ in range(6)))
+
+        asyncio.run(run())
+
+        assert peak == 2
+
+    def test_times_out_slow_generation(self):
+        """
+        Given: A provider slower than its timeout
+        When: generate() is awaited
+        Then: Raises GenerationError with status 504
+        """
+        provider = StubProvider(delay=1.0, timeout=0.01)
+
+        with pytest.raises(GenerationError) as excinfo:
+            asyncio.run(provider.generate(*PROMPT))
+
+        assert excinfo.value.status_code == 504
+
+    def test_streams_one_goal_per_chunk_then_result(self):
+        """
+        Given: A stub provider
+        When: stream() is consumed for a progressive prompt
+        Then: Yields the four goal lines in order, then a result equal to generate()'s
+        """
+        provider = StubProvider()
+
+        items = _collect(provider, *PROMPT)
+
+        *chunks, result = items
+        assert chunks == [f"{goal}\n" for goal in provider.goals(*PROMPT)]
+        assert result == asyncio.run(provider.generate(*PROMPT))
+
+    def test_provider_without_streaming_sends_one_chunk(self):
+        """
+        Given: A provider that only implements _complete()
+        When: stream() is consumed
+        Then: Yields the whole completion as one chunk, then the result
+        """
+
+        class Whole(LLMProvider):
+            async def _complete(self, framework, user_context):
+                return GenerationResult("1. Goal\n", self.model)
+
+        assert _collect(Whole("whole"), *PROMPT) == [
+            "1. Goal\n",
+            GenerationResult("1. Goal\n", "whole"),
+        ]
+
+    def test_provider_must_implement_complete(self):
+        """
+        Given: The LLMProvider base class
+        When: It is instantiated directly
+        Then: Raises TypeError naming the abstract _complete()
+        """
+        with pytest.raises(TypeError, match="_complete"):
+            LLMProvider("base")
+
+
+@pytest.mark.unit
+class TestOpenAICompatibleProvider:
+    """Test the chat completions client against an in-process transport."""
+
+    def _generate(self, handler, **kwargs):
+        async def run():
+            provider = OpenAICompatibleProvider(
+                "https://llm.test/v1/",
+                "gpt-test",
+                headers={"Authorization": "Bearer secret"},
+                transport=httpx.MockTransport(handler),
+                **kwargs,
+            )
+            try:
+                return await provider.generate(*PROMPT)
+            finally:
+                await provider.aclose()
+
+        return asyncio.run(run())
+
+    def test_posts_chat_completion_and_returns_content(self):
+        """
+        Given: An endpoint returning a chat completion
+        When: generate() is awaited
+        Then: Sends system and user messages with auth and returns the completion
+        """
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers["authorization"]
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(
+                200,
+                json={
+                    "model": "gpt-test-0613",
+                    "choices": [{"message": {"role": "assistant", "content": "1. Goal"}}],
+                    "usage": {"prompt_tokens": 12, "completion_tokens": 3},
+                },
+            )
+
+        result = self._generate(handler, temperature=0.2)
+
+        assert seen["url"] == "https://llm.test/v1/chat/completions"
+        assert seen["auth"] == "Bearer secret"
+        assert seen["body"]["messages"] == [
+            {"role": "system", "content": PROMPT[0]},
+            {"role": "user", "content": PROMPT[1]},
+        ]
+        assert seen["body"]["temperature"] == 0.2
+        assert result.content == "1. Goal"
+        assert result.model == "gpt-test-0613"
+        assert result.usage == {"prompt_tokens": 12, "completion_tokens": 3}
+
+    def test_error_status_raises_bad_gateway(self):
+        """
+        Given: An endpoint answering 429
+        When: generate() is awaited
+        Then: Raises GenerationError with status 502
+        """
+        with pytest.raises(GenerationError, match="returned 429") as excinfo:
+            self._generate(lambda request: httpx.Response(429, text="slow down"))
+
+        assert excinfo.value.status_code == 502
+
+    def test_unexpected_body_raises_bad_gateway(self):
+        """
+        Given: An endpoint answering 200 without choices
+        When: generate() is awaited
+        Then: Raises GenerationError with status 502
+        """
+        with pytest.raises(GenerationError, match="unexpected response"):
+            self._generate(lambda request: httpx.Response(200, json={"error": "nope"}))
+
+    def test_transport_timeout_raises_gateway_timeout(self):
+        """
+        Given: A transport that times out
+        When: generate() is awaited
+        Then: Raises GenerationError with status 504
+        """
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with pytest.raises(GenerationError) as excinfo:
+            self._generate(handler)
+
+        assert excinfo.value.status_code == 504
+
+    def _stream(self, handler):
+        provider = OpenAICompatibleProvider(
+            "https://llm.test/v1", "gpt-test", transport=httpx.MockTransport(handler)
+        )
+        return _collect(provider, *PROMPT)
+
+    def test_stream_requests_sse_and_yields_deltas(self):
+        """
+        Given: An endpoint streaming chat completion chunks as server-sent events
+        When: stream() is consumed
+        Then: Sends stream: true, yields each delta, then the joined result
+        """
+        seen = {}
+        chunks = [
+            {"model": "gpt-test-0613", "choices": [{"delta": {"role": "assistant"}}]},
+            {"model": "gpt-test-0613", "choices": [{"delta": {"content": "1. Goal"}}]},
+            {"model": "gpt-test-0613", "choices": [{"delta": {"content": " one\n"}}]},
+        ]
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        items = self._stream(handler)
+
+        assert seen["body"]["stream"] is True
+        assert items == ["1. Goal", " one\n", GenerationResult("1. Goal one\n", "gpt-test-0613")]
+
+    def test_stream_error_status_raises_bad_gateway(self):
+        """
+        Given: An endpoint answering 500 to a streaming request
+        When: stream() is consumed
+        Then: Raises GenerationError with status 502 and the response text
+        """
+        with pytest.raises(GenerationError, match="returned 500: boom") as excinfo:
+            self._stream(lambda request: httpx.Response(500, text="boom"))
+
+        assert excinfo.value.status_code == 502
+
+
+@pytest.mark.unit
+class TestProviderFromEnv:
+    """Test provider configuration from environment variables."""
+
+    def test_unset_means_prompts_only(self):
+        """
+        Given: No MYIMPACT_LLM_PROVIDER
+        When: provider_from_env() is called
+        Then: Returns None
+        """
+        assert provider_from_env({}) is None
+
+    def test_builds_stub_with_limits(self):
+        """
+        Given: MYIMPACT_LLM_PROVIDER=stub with concurrency and timeout settings
+        When: provider_from_env() is called
+        Then: Returns a StubProvider with those limits
+        """
+        provider = provider_from_env(
+            {
+                "MYIMPACT_LLM_PROVIDER": "stub",
+                "MYIMPACT_LLM_MAX_CONCURRENCY": "3",
+                "MYIMPACT_LLM_TIMEOUT": "5",
+            }
+        )
+
+        assert isinstance(provider, StubProvider)
+        assert (provider.max_concurrency, provider.timeout) == (3, 5.0)
+
+    def test_builds_azure_deployment_client(self):
+        """
+        Given: MYIMPACT_LLM_PROVIDER=azure with the Azure OpenAI settings
+        When: provider_from_env() is called
+        Then: Returns a client for the deployment, named azure-openai
+        """
+        provider = provider_from_env(
+            {
+                "MYIMPACT_LLM_PROVIDER": "azure",
+                "AZURE_OPENAI_ENDPOINT": "https://aoai.test/",
+                "AZURE_OPENAI_API_KEY": "key",
+                "AZURE_OPENAI_DEPLOYMENT": "gpt-4o-mini",
+            }
+        )
+
+        assert isinstance(provider, OpenAICompatibleProvider)
+        assert provider.name == "azure-openai"
+        assert provider.model == "gpt-4o-mini"
+        asyncio.run(provider.aclose())
+
+    def test_rejects_unknown_provider(self):
+        """
+        Given: MYIMPACT_LLM_PROVIDER set to an unknown name
+        When: provider_from_env() is called
+        Then: Raises ValueError
+        """
+        with pytest.raises(ValueError, match="Unknown MYIMPACT_LLM_PROVIDER"):
+            provider_from_env({"MYIMPACT_LLM_PROVIDER": "nope"})
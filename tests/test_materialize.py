@@ -0,0 +1,125 @@
+"""Tests for myimpact.materialize module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state build/load round-trip behavior
+- Bounded: Tests exercise the artifact format and prompt-cache seeding
+- Fast: Artifacts are written to tmp_path
+- Reliable: Compares against live assembly rather than fixed prompt text
+"""
+
+import gzip
+import json
+
+import pytest
+
+from myimpact.assembler import assemble_prompt, iter_prompt_grid, prompt_cache
+from myimpact.materialize import load_prompt_artifact, materialize_prompts
+
+
+def _rewrite_artifact(path, mutate):
+    with gzip.open(path, "rb") as f:
+        artifact = json.loads(f.read().decode("utf-8"))
+    mutate(artifact)
+    with gzip.open(path, "wb") as f:
+        f.write(json.dumps(artifact).encode("utf-8"))
+
+
+@pytest.mark.integration
+class TestPromptArtifactIntegration:
+    """Test materializing the option grid and loading it back."""
+
+    @pytest.fixture(autouse=True)
+    def clear_prompt_cache(self):
+        maxsize = prompt_cache.maxsize
+        prompt_cache.clear()
+        yield
+        prompt_cache.clear()
+        prompt_cache.maxsize = maxsize
+
+    def test_materialize_writes_every_grid_combination(self, tmp_path):
+        """
+        Given: The shipped resource files
+        When: materialize_prompts() is called
+        Then: One prompt per no-focus-area grid combination is written
+        """
+        count = materialize_prompts(tmp_path / "prompts.json.gz")
+
+        assert count == len(list(iter_prompt_grid()))
+
+    def test_loaded_artifact_serves_identical_prompts_from_cache(self, tmp_path):
+        """
+        Given: A freshly built artifact loaded into an empty prompt cache
+        When: assemble_prompt() is called for a grid combination
+        Then: It is a cache hit and matches a fresh assembly
+        """
+        path = tmp_path / "prompts.json.gz"
+        materialize_prompts(path)
+        request = next(iter_prompt_grid())
+        expected = assemble_prompt(*request)
+        prompt_cache.clear()
+
+        loaded = load_prompt_artifact(path)
+        actual = assemble_prompt(*request)
+
+        assert loaded > 0
+        assert actual == expected
+        assert prompt_cache.stats()["misses"] == 0
+
+    def test_load_skips_entries_with_stale_sources(self, tmp_path):
+        """
+        Given: An artifact whose recorded source signatures no longer match
+        When: load_prompt_artifact() is called
+        Then: No prompts are loaded
+        """
+        path = tmp_path / "prompts.json.gz"
+        materialize_prompts(path)
+        _rewrite_artifact(path, lambda a: a.update(sources={k: [0, 0] for k in a["sources"]}))
+        prompt_cache.clear()
+
+        assert load_prompt_artifact(path) == 0
+        assert len(prompt_cache) == 0
+
+    def test_load_grows_cache_to_fit_artifact(self, tmp_path):
+        """
+        Given: An artifact with more prompts than the prompt cache holds
+        When: load_prompt_artifact() is called
+        Then: The cache grows by the artifact size and every loaded prompt is retained
+        """
+        path = tmp_path / "prompts.json.gz"
+        count = materialize_prompts(path)
+        prompt_cache.clear()
+        prompt_cache.maxsize = 2
+
+        loaded = load_prompt_artifact(path)
+
+        assert loaded == count > 2
+        assert len(prompt_cache) == count
+        assert prompt_cache.maxsize == count + 2
+        assert prompt_cache.stats()["evictions"] == 0
+
+    def test_load_into_disabled_cache_reports_nothing_retained(self, tmp_path, caplog):
+        """
+        Given: A disabled prompt cache (size 0)
+        When: load_prompt_artifact() is called
+        Then: Returns 0 and warns that the prompts were not kept
+        """
+        path = tmp_path / "prompts.json.gz"
+        materialize_prompts(path)
+        prompt_cache.clear()
+        prompt_cache.maxsize = 0
+
+        assert load_prompt_artifact(path) == 0
+        assert "kept 0 of" in caplog.text
+
+    def test_load_rejects_unknown_format(self, tmp_path):
+        """
+        Given: An artifact with an unsupported format version
+        When: load_prompt_artifact() is called
+        Then: Raises ValueError
+        """
+        path = tmp_path / "prompts.json.gz"
+        materialize_prompts(path)
+        _rewrite_artifact(path, lambda a: a.update(format=999))
+
+        with pytest.raises(ValueError):
+            load_prompt_artifact(path)
@@ -0,0 +1,79 @@
+"""Tests for myimpact.parallel module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state ordering and result-shape contracts
+- Bounded: Worker-side functions are exercised in-process; one test spawns a real pool
+- Fast: In-process tests use the isolated test workspace
+- Reliable: Compares parallel results against in-process assembly
+"""
+
+import pytest
+
+from myimpact.assembler import (
+    PromptRequest,
+    assemble_prompt,
+    assemble_prompts,
+    discover_scales,
+    extract_levels_from_csv,
+)
+from myimpact.cache import resource_cache
+from myimpact.parallel import _assemble_chunk, _init_worker, assemble_parallel
+
+
+@pytest.mark.integration
+class TestWorkerFunctions:
+    """Test the functions that run inside worker processes."""
+
+    def test_init_worker_preloads_resources(self, test_workspace):
+        """
+        Given: An empty resource cache
+        When: The worker initializer runs
+        Then: Culture, org and framework resources are cached
+        """
+        resource_cache.clear()
+
+        _init_worker()
+
+        assert len(resource_cache) >= 3
+
+    def test_assemble_chunk_returns_framework_once(self, test_workspace):
+        """
+        Given: A chunk with a valid and an invalid request
+        When: _assemble_chunk() is called
+        Then: Returns the framework once, then user contexts and exceptions in order
+        """
+        valid = PromptRequest("technical", "L10 (Entry)", "moderate")
+        invalid = PromptRequest("technical", "L999", "moderate")
+
+        framework, results = _assemble_chunk([valid, invalid])
+
+        assert (framework, results[0]) == assemble_prompt(*valid)
+        assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.slow
+class TestAssembleParallel:
+    """Test the process pool with the shipped data."""
+
+    def test_results_match_in_process_assembly_in_order(self):
+        """
+        Given: Requests spanning several small chunks, including an invalid level
+        When: assemble_parallel() runs with two workers
+        Then: Yields exactly what assemble_prompts() returns, in input order
+        """
+        scale = discover_scales()[0]
+        levels = extract_levels_from_csv(scale) + ["L999"]
+        intensities = ["minimal", "moderate", "aggressive"]
+        requests = [
+            PromptRequest(scale, levels[i % len(levels)], intensities[i % 3]) for i in range(50)
+        ]
+
+        results = list(assemble_parallel(requests, workers=2, chunk_size=7))
+        expected = assemble_prompts(requests)
+
+        assert len(results) == len(expected)
+        for result, want in zip(results, expected):
+            if isinstance(want, Exception):
+                assert type(result) is type(want) and str(result) == str(want)
+            else:
+                assert result == want
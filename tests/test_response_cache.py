@@ -0,0 +1,223 @@
+"""Tests for myimpact.response_cache module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state keying, expiry and eviction contracts
+- Bounded: Databases are written to tmp_path; providers are the offline stub
+- Fast: Expiry is driven by a fake clock, never by sleeping
+- Reliable: Deterministic stub output
+"""
+
+import asyncio
+
+import pytest
+
+from myimpact.cache import TTLCache
+from myimpact.generation import GenerationError, StubProvider
+from myimpact.response_cache import (
+    CachingProvider,
+    SQLiteResponseCache,
+    response_cache_from_env,
+    response_cache_key,
+)
+
+PROMPT = ("You generate SMART goals.", "**Job Level**: L30\n")
+
+
+class FakeClock:
+    """A clock the test advances by hand."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestResponseCacheKey:
+    """Test the content hash behind response cache keys."""
+
+    def test_key_covers_prompt_model_and_sampling(self):
+        """
+        Given: A completion request
+        When: Any of prompt, provider, model or sampling parameters changes
+        Then: The key changes; an identical request gets the identical key
+        """
+        base = ("fw", "ctx", "openai", "gpt-4o-mini", {"temperature": 0.9})
+        key = response_cache_key(*base)
+
+        assert response_cache_key(*base) == key
+        assert response_cache_key("fw", "ctx2", *base[2:]) != key
+        assert response_cache_key("fw", "ctx", "azure-openai", *base[3:]) != key
+        assert response_cache_key(*base[:3], "gpt-4o", base[4]) != key
+        assert response_cache_key(*base[:4], {"temperature": 0.2}) != key
+
+
+@pytest.mark.integration
+class TestSQLiteResponseCache:
+    """Test the SQLite response cache backend."""
+
+    def test_round_trips_and_shares_between_instances(self, tmp_path):
+        """
+        Given: A value stored through one cache instance
+        When: Another instance opens the same file
+        Then: It reads the same value
+        """
+        path = tmp_path / "responses.db"
+        SQLiteResponseCache(path).put("k", {"content": "1. Goal", "model": "m", "usage": None})
+
+        assert SQLiteResponseCache(path).get("k") == {
+            "content": "1. Goal",
+            "model": "m",
+            "usage": None,
+        }
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        """
+        Given: An entry stored with a 60 second TTL
+        When: It is read after the TTL elapses
+        Then: It is a miss, and the next write purges it
+        """
+        clock = FakeClock()
+        cache = SQLiteResponseCache(tmp_path / "responses.db", ttl=60, clock=clock)
+        cache.put("old", {"n": 1})
+
+        clock.now += 61
+        assert cache.get("old") is None
+        cache.put("new", {"n": 2})
+
+        assert cache.stats()["size"] == 1
+
+    def test_evicts_oldest_beyond_maxsize(self, tmp_path):
+        """
+        Given: A cache limited to two entries
+        When: A third is stored
+        Then: The oldest entry is evicted
+        """
+        clock = FakeClock()
+        cache = SQLiteResponseCache(tmp_path / "responses.db", maxsize=2, clock=clock)
+        for key in ("a", "b", "c"):
+            cache.put(key, key)
+            clock.now += 1
+
+        assert cache.get("a") is None
+        assert (cache.get("b"), cache.get("c")) == ("b", "c")
+        assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+class TestCachingProvider:
+    """Test the response cache around the generation path."""
+
+    def _counting_stub(self):
+        provider = StubProvider()
+        provider.calls = 0
+        generate = provider.generate
+
+        async def counted(*prompt):
+            provider.calls += 1
+            return await generate(*prompt)
+
+        provider.generate = counted
+        return provider
+
+    def test_repeated_request_is_served_from_cache(self):
+        """
+        Given: A caching provider over a stub
+        When: The same prompt is generated twice
+        Then: The stub runs once and both results are equal
+        """
+        stub = self._counting_stub()
+        provider = CachingProvider(stub, TTLCache(ttl=60))
+
+        first = asyncio.run(provider.generate(*PROMPT))
+        second = asyncio.run(provider.generate(*PROMPT))
+
+        assert first == second
+        assert stub.calls == 1
+        assert provider.name == "stub"
+
+    def test_streamed_result_is_cached_and_replayed(self):
+        """
+        Given: A caching provider over a stub
+        When: A prompt is streamed, then streamed and generated again
+        Then: The replays come from the cache as one chunk with the same result
+        """
+        stub = StubProvider()
+        provider = CachingProvider(stub, TTLCache(ttl=60))
+
+        async def collect():
+            return [item async for item in provider.stream(*PROMPT)]
+
+        streamed = asyncio.run(collect())
+        stub.stream = None  # any further call would have to reach the stub
+        stub.generate = None
+        replayed = asyncio.run(collect())
+
+        assert len(streamed) == len(stub.goals(*PROMPT)) + 1
+        assert replayed == [streamed[-1].content, streamed[-1]]
+        assert asyncio.run(provider.generate(*PROMPT)) == streamed[-1]
+
+    def test_failures_are_not_cached(self):
+        """
+        Given: A provider that fails once, then succeeds
+        When: The same prompt is generated twice
+        Then: The second call reaches the provider and succeeds
+        """
+        stub = self._counting_stub()
+        generate = stub.generate
+
+        async def flaky(*prompt):
+            if stub.calls == 0:
+                stub.calls += 1
+                raise GenerationError(502, "boom")
+            return await generate(*prompt)
+
+        stub.generate = flaky
+        provider = CachingProvider(stub, TTLCache(ttl=60))
+
+        with pytest.raises(GenerationError):
+            asyncio.run(provider.generate(*PROMPT))
+        result = asyncio.run(provider.generate(*PROMPT))
+
+        assert result.content.startswith("1. Goal 1 for L30")
+
+
+@pytest.mark.unit
+class TestResponseCacheFromEnv:
+    """Test response cache configuration from environment variables."""
+
+    def test_defaults_to_in_process_cache(self):
+        """
+        Given: No response cache settings
+        When: response_cache_from_env() is called
+        Then: Returns an in-process TTLCache with the default TTL
+        """
+        cache = response_cache_from_env({})
+
+        assert isinstance(cache, TTLCache)
+        assert cache.ttl == 300
+
+    def test_zero_ttl_disables(self):
+        """
+        Given: MYIMPACT_RESPONSE_CACHE_TTL=0
+        When: response_cache_from_env() is called
+        Then: Returns None
+        """
+        assert response_cache_from_env({"MYIMPACT_RESPONSE_CACHE_TTL": "0"}) is None
+
+    def test_database_path_selects_sqlite(self, tmp_path):
+        """
+        Given: MYIMPACT_RESPONSE_CACHE_DB
+        When: response_cache_from_env() is called
+        Then: Returns a SQLite cache at that path
+        """
+        cache = response_cache_from_env(
+            {
+                "MYIMPACT_RESPONSE_CACHE_DB": str(tmp_path / "r.db"),
+                "MYIMPACT_RESPONSE_CACHE_SIZE": "5",
+            }
+        )
+
+        assert isinstance(cache, SQLiteResponseCache)
+        assert cache.maxsize == 5
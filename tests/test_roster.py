@@ -0,0 +1,136 @@
+"""Tests for myimpact.roster module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state roster parsing and bulk assembly contracts
+- Bounded: Tests exercise roster files written to tmp_path
+- Fast: Uses the isolated test workspace; only the process-pool test spawns workers
+- Reliable: Compares bulk results against single-prompt assembly
+"""
+
+import json
+
+import pytest
+
+from myimpact.assembler import (
+    PromptRequest,
+    assemble_prompt,
+    discover_scales,
+    extract_levels_from_csv,
+)
+from myimpact.roster import assemble_roster, output_filename, read_roster
+
+
+@pytest.mark.unit
+class TestReadRoster:
+    """Test parsing CSV and JSONL rosters."""
+
+    def test_reads_csv_with_aliases_and_defaults(self, tmp_path):
+        """
+        Given: A CSV roster using short column aliases and blank optional cells
+        When: read_roster() is called
+        Then: Rows become normalized PromptRequests with CLI defaults filled in
+        """
+        path = tmp_path / "roster.csv"
+        path.write_text(
+            "id,Scale,Level,Intensity,Org,Style,Focus\n"
+            "alice,technical,L10 (Entry),moderate,acme,progressive,  Ship Faster \n"
+            "bob,technical,L20 (Developing),minimal,,,\n",
+            encoding="utf-8",
+        )
+
+        entries = list(read_roster(path))
+
+        assert entries[0].id == "alice"
+        assert entries[0].request == PromptRequest(
+            "technical", "L10 (Entry)", "moderate", "acme", "Ship Faster", "progressive"
+        )
+        assert entries[1].request == PromptRequest("technical", "L20 (Developing)", "minimal")
+
+    def test_reads_jsonl_and_numbers_rows_without_ids(self, tmp_path):
+        """
+        Given: A JSONL roster without id fields and with a blank line
+        When: read_roster() is called
+        Then: Entries are identified by their 1-based row number
+        """
+        path = tmp_path / "roster.jsonl"
+        row = {"scale": "technical", "level": "L10 (Entry)", "growth_intensity": "moderate"}
+        path.write_text(json.dumps(row) + "\n\n" + json.dumps(row) + "\n", encoding="utf-8")
+
+        entries = list(read_roster(path))
+
+        assert [entry.id for entry in entries] == ["1", "2"]
+        assert entries[0].request == PromptRequest("technical", "L10 (Entry)", "moderate")
+
+    @pytest.mark.parametrize(
+        "rows, message",
+        [
+            ("scale,level\ntechnical,L10\n", "missing growth_intensity"),
+            ("scale,level,intensity\ntechnical,L10,extreme\n", "invalid growth_intensity"),
+            ("scale,level,intensity,style\ntechnical,L10,moderate,solo\n", "invalid goal_style"),
+            (
+                "id,scale,level,intensity\na,technical,L10,moderate\na,technical,L10,moderate\n",
+                "duplicate id",
+            ),
+        ],
+    )
+    def test_rejects_malformed_rows(self, tmp_path, rows, message):
+        """
+        Given: A roster with a missing column, invalid option or duplicate id
+        When: read_roster() is consumed
+        Then: Raises ValueError naming the problem
+        """
+        path = tmp_path / "roster.csv"
+        path.write_text(rows, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=message):
+            list(read_roster(path))
+
+    def test_output_filename_is_filesystem_safe(self):
+        """
+        Given: Entry ids with path separators and spaces
+        When: output_filename() is called
+        Then: Returns a plain .txt file name
+        """
+        assert output_filename("jane doe/eng") == "jane_doe_eng.txt"
+        assert output_filename("../") == "prompt.txt"
+
+
+@pytest.mark.integration
+class TestAssembleRosterIntegration:
+    """Test in-process roster assembly."""
+
+    def test_results_match_single_assembly_in_order(self, test_workspace):
+        """
+        Given: Valid and invalid requests
+        When: assemble_roster() is consumed
+        Then: Yields one result per request in order, with exceptions in place
+        """
+        requests = [
+            PromptRequest("technical", "L20 (Developing)", "moderate", "acme"),
+            PromptRequest("technical", "L999", "moderate"),
+            PromptRequest("technical", "L10 (Entry)", "aggressive"),
+        ]
+
+        results = list(assemble_roster(requests))
+
+        assert len(results) == 3
+        assert results[0] == assemble_prompt(*requests[0])
+        assert isinstance(results[1], ValueError)
+        assert results[2] == assemble_prompt(*requests[2])
+
+
+@pytest.mark.slow
+class TestAssembleRosterWorkers:
+    """Test process-pool roster assembly with the shipped data."""
+
+    def test_worker_results_match_in_process_results(self):
+        """
+        Given: More requests than fit in one worker chunk
+        When: assemble_roster() runs with two workers
+        Then: Results equal the in-process results, in order
+        """
+        scale = discover_scales()[0]
+        levels = extract_levels_from_csv(scale)
+        requests = [PromptRequest(scale, levels[i % len(levels)], "moderate") for i in range(300)]
+
+        assert list(assemble_roster(requests, workers=2)) == list(assemble_roster(requests))
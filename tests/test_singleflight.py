@@ -0,0 +1,119 @@
+"""Tests for myimpact.singleflight module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state when calls are coalesced and when they are not
+- Bounded: Work is plain coroutines, no I/O
+- Fast: Calls overlap through events, not sleeps
+- Reliable: Each test runs its own event loop
+"""
+
+import asyncio
+
+import pytest
+
+from myimpact.singleflight import SingleFlight
+
+
+def _gated_work(release: asyncio.Event, calls: list, value="result"):
+    """Return work that records each start and finishes once release is set."""
+
+    async def work():
+        calls.append(value)
+        await release.wait()
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    return work
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test coalescing of concurrent identical calls."""
+
+    def test_concurrent_calls_with_same_key_share_one_run(self):
+        """
+        Given: Five concurrent calls with the same key
+        When: The work completes
+        Then: It ran once, every caller gets its result and four calls count as coalesced
+        """
+        flights = SingleFlight()
+        calls = []
+
+        async def run():
+            release = asyncio.Event()
+            work = _gated_work(release, calls)
+            waiters = [asyncio.ensure_future(flights.do("key", work)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*waiters)
+
+        results = asyncio.run(run())
+
+        assert results == ["result"] * 5
+        assert calls == ["result"]
+        assert flights.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    def test_different_keys_and_later_calls_run_separately(self):
+        """
+        Given: Calls with different keys, then a repeat after the first finished
+        When: They are awaited
+        Then: Each runs its own work; nothing is coalesced
+        """
+        flights = SingleFlight()
+
+        async def value(result):
+            return result
+
+        async def run():
+            first = await asyncio.gather(
+                flights.do("a", lambda: value(1)), flights.do("b", lambda: value(2))
+            )
+            return first, await flights.do("a", lambda: value(3))
+
+        assert asyncio.run(run()) == ([1, 2], 3)
+        assert flights.coalesced == 0
+
+    def test_exception_reaches_every_caller(self):
+        """
+        Given: Concurrent calls whose shared work fails
+        When: They are awaited
+        Then: Every caller gets the exception and the key is no longer in flight
+        """
+        flights = SingleFlight()
+        calls = []
+
+        async def run():
+            release = asyncio.Event()
+            work = _gated_work(release, calls, ValueError("boom"))
+            waiters = [asyncio.ensure_future(flights.do("key", work)) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*waiters, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert [str(result) for result in results] == ["boom"] * 3
+        assert len(calls) == 1
+        assert flights.stats()["in_flight"] == 0
+
+    def test_cancelled_caller_does_not_cancel_shared_work(self):
+        """
+        Given: Two callers sharing work, the first of which is cancelled
+        When: The work completes
+        Then: The second caller still gets the result
+        """
+        flights = SingleFlight()
+
+        async def run():
+            release = asyncio.Event()
+            work = _gated_work(release, [])
+            first = asyncio.ensure_future(flights.do("key", work))
+            second = asyncio.ensure_future(flights.do("key", work))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return first.cancelled(), await second
+
+        assert asyncio.run(run()) == (True, "result")
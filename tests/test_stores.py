@@ -0,0 +1,257 @@
+"""Tests for myimpact.stores module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state the ResourceStore contract per implementation
+- Bounded: Stores are built from the isolated test workspace
+- Fast: Tiny resource files, databases written to tmp_path
+- Reliable: Compares every store against the filesystem store
+"""
+
+import sqlite3
+
+import pytest
+
+from myimpact import assembler
+from myimpact.stores import (
+    FilesystemStore,
+    SQLiteStore,
+    _prefix_upper_bound,
+    build_sqlite_store,
+)
+
+
+@pytest.fixture
+def filesystem_store(test_workspace):
+    return FilesystemStore(test_workspace / "data", test_workspace / "prompts")
+
+
+@pytest.fixture
+def sqlite_path(filesystem_store, tmp_path):
+    """A database copied from the test workspace; the assembler is back on files afterwards."""
+    path = tmp_path / "resources.db"
+    build_sqlite_store(path, filesystem_store)
+    yield path
+    assembler.use_resource_store(None)
+
+
+@pytest.mark.integration
+class TestFilesystemStore:
+    """Test the default store over data/ and prompts/."""
+
+    def test_discovers_and_loads_workspace_resources(self, filesystem_store):
+        """
+        Given: A workspace with one scale and one org
+        When: The store is queried
+        Then: Returns the workspace's scales, levels, orgs and texts
+        """
+        assert filesystem_store.scales() == ["technical"]
+        assert filesystem_store.levels("technical") == ["L10 (Entry)", "L20 (Developing)"]
+        assert filesystem_store.orgs() == ["acme"]
+        assert filesystem_store.framework_prompt() == "You generate SMART goals.\n"
+        assert filesystem_store.culture_matrix("technical").bullets("L10 (Entry)")
+
+    def test_missing_resources_raise_and_have_no_signature(self, filesystem_store):
+        """
+        Given: The filesystem store
+        When: An absent org is looked up
+        Then: Loading raises FileNotFoundError and its signature is None
+        """
+        with pytest.raises(FileNotFoundError):
+            filesystem_store.org_focus_areas("globex")
+        assert filesystem_store.org_signature("globex") is None
+
+    def test_org_index_is_revalidated_by_directory_signature(
+        self, filesystem_store, test_workspace, monkeypatch
+    ):
+        """
+        Given: A store whose org names were listed once, with no watcher running
+        When: orgs() is called again, then again after an org file is added
+        Then: The unchanged directory is not re-globbed; the added org is listed
+        """
+        first = filesystem_store.orgs()
+        globs = []
+        org_files = filesystem_store._org_files
+        monkeypatch.setattr(filesystem_store, "_org_files", lambda: globs.append(1) or org_files())
+
+        assert filesystem_store.orgs() is first
+        assert globs == []
+
+        (test_workspace / "prompts" / "org_focus_areas_globex.md").write_text("Grow\n")
+
+        assert filesystem_store.orgs() == ["acme", "globex"]
+        assert globs == [1]
+
+    def test_assembler_defaults_to_filesystem_store(self, test_workspace):
+        """
+        Given: No store configured
+        When: get_resource_store() is called
+        Then: Returns a filesystem store over the resource directories
+        """
+        store = assembler.get_resource_store()
+
+        assert isinstance(store, FilesystemStore)
+        assert store.data_dir == test_workspace / "data"
+
+
+@pytest.mark.integration
+class TestSQLiteStore:
+    """Test the indexed SQLite store."""
+
+    def test_matches_filesystem_store(self, filesystem_store, sqlite_path):
+        """
+        Given: A database built from the workspace
+        When: It is queried like the filesystem store
+        Then: Every resource, signature and the catalog fingerprint match
+        """
+        store = SQLiteStore(sqlite_path)
+
+        assert store.scales() == filesystem_store.scales()
+        assert store.orgs() == filesystem_store.orgs()
+        assert store.levels("technical") == filesystem_store.levels("technical")
+        assert store.culture("technical") == filesystem_store.culture("technical")
+        assert store.org_focus_areas("acme") == filesystem_store.org_focus_areas("acme")
+        assert store.framework_prompt() == filesystem_store.framework_prompt()
+        assert store.catalog_fingerprint() == filesystem_store.catalog_fingerprint()
+
+    def test_assembler_serves_identical_prompts(self, sqlite_path):
+        """
+        Given: A database built from the workspace
+        When: The assembler is switched to it
+        Then: Prompts and metadata equal the file-served ones
+        """
+        requests = list(assembler.iter_prompt_grid())
+        expected = [assembler._assemble_prompt(r) for r in requests]
+        expected_metadata = assembler.load_metadata()
+
+        assembler.use_resource_store(SQLiteStore(sqlite_path))
+
+        assert [assembler._assemble_prompt(r) for r in requests] == expected
+        assert assembler.load_metadata() == expected_metadata
+
+    def test_recompiles_matrix_when_signature_changes(self, sqlite_path):
+        """
+        Given: A compiled matrix cached by the store
+        When: A cell is rewritten and its scale's signature bumped
+        Then: The next lookup returns the new expectation
+        """
+        store = SQLiteStore(sqlite_path)
+        store.culture_matrix("technical")
+        with sqlite3.connect(sqlite_path) as connection:
+            connection.execute(
+                "UPDATE culture_cells SET expectation = 'Asks early.' "
+                "WHERE scale = 'technical' AND level = 'L10 (Entry)' AND position = 0"
+            )
+            connection.execute("UPDATE scales SET mtime_ns = mtime_ns + 1")
+        connection.close()
+
+        expectations = store.culture_matrix("technical").expectations("L10 (Entry)")
+
+        assert expectations["Humble"] == "Asks early."
+
+    def test_missing_resources_raise_file_not_found(self, sqlite_path):
+        """
+        Given: A database built from the workspace
+        When: An absent scale or org is loaded through the assembler
+        Then: Raises FileNotFoundError like a missing file would
+        """
+        assembler.use_resource_store(SQLiteStore(sqlite_path))
+
+        with pytest.raises(FileNotFoundError, match="Culture CSV not found"):
+            assembler.load_culture_matrix("leadership")
+        assert assembler.org_focus_areas_fingerprint("globex") is None
+
+    def test_org_page_matches_filesystem_store(self, filesystem_store, test_workspace, tmp_path):
+        """
+        Given: A workspace with several orgs sharing prefixes, copied into a database
+        When: Both stores are paged by prefix and cursor
+        Then: The SQL range scan returns the same pages as the in-memory index
+        """
+        for org_name in ("acme-east", "acmf", "beta", "acme-west"):
+            (test_workspace / "prompts" / f"org_focus_areas_{org_name}.md").write_text(
+                "# Focus", encoding="utf-8"
+            )
+        path = tmp_path / "orgs.db"
+        build_sqlite_store(path, filesystem_store)
+        store = SQLiteStore(path)
+
+        cases = [
+            ("", None, 50),
+            ("acme", None, 2),
+            ("acme", "acme-east", 5),
+            ("b", None, 5),
+            ("z", None, 5),
+            ("", "acmf", 1),
+        ]
+        for prefix, after, limit in cases:
+            assert store.org_page(prefix, after, limit) == filesystem_store.org_page(
+                prefix, after, limit
+            )
+        assert store.org_page("acme", None, 10) == ["acme", "acme-east", "acme-west"]
+
+    def test_build_treats_short_csv_rows_as_missing_cells(
+        self, filesystem_store, test_workspace, tmp_path
+    ):
+        """
+        Given: A culture CSV with a row shorter than its header
+        When: build_sqlite_store() copies it
+        Then: The absent cell is missing in both stores rather than failing the build
+        """
+        (test_workspace / "data" / "culture_expectations_technical.csv").write_text(
+            "Cultural Attribute,L10 (Entry),L20 (Developing)\n"
+            "Humble,Asks for help.,Shares credit.\n"
+            "Ownership,Finishes tasks.\n",
+            encoding="utf-8",
+        )
+        path = tmp_path / "short.db"
+
+        build_sqlite_store(path, filesystem_store)
+        store = SQLiteStore(path)
+
+        expected = {"L10 (Entry)": "Finishes tasks."}
+        assert filesystem_store.culture("technical")["Ownership"] == expected
+        assert store.culture("technical") == filesystem_store.culture("technical")
+        assert "Ownership" not in store.culture_matrix("technical").bullets("L20 (Developing)")
+
+    def test_build_skips_resources_that_vanished(self, filesystem_store, tmp_path):
+        """
+        Given: A source store listing an org whose signature is gone (deleted after listing)
+        When: build_sqlite_store() is called
+        Then: Copies the remaining resources instead of failing
+        """
+        filesystem_store.orgs = lambda: ["acme", "globex"]
+        path = tmp_path / "resources.db"
+
+        counts = build_sqlite_store(path, filesystem_store)
+
+        assert counts == {"scales": 1, "orgs": 1}
+        assert SQLiteStore(path).orgs() == ["acme"]
+
+    def test_rejects_missing_database(self, tmp_path):
+        """
+        Given: A path with no database
+        When: A SQLiteStore is opened on it
+        Then: Raises FileNotFoundError
+        """
+        with pytest.raises(FileNotFoundError):
+            SQLiteStore(tmp_path / "missing.db")
+
+
+@pytest.mark.unit
+class TestPrefixUpperBound:
+    """Test the exclusive upper bound used for prefix range scans."""
+
+    def test_increments_last_character(self):
+        """
+        Given: A prefix
+        When: _prefix_upper_bound() is called
+        Then: Returns the prefix with its last character incremented
+        """
+        assert _prefix_upper_bound("acme") == "acmf"
+
+    def test_drops_trailing_maximum_code_points(self):
+        """
+        Given: A prefix ending in the largest code point
+        When: _prefix_upper_bound() is called
+        Then: Increments the last character that can be incremented
+        """
+        assert _prefix_upper_bound("ab\U0010ffff") == "ac"
@@ -0,0 +1,83 @@
+"""Tests for myimpact.template module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state compile and render behavior
+- Bounded: Tests exercise the template compiler only
+- Fast: Pure string operations, no I/O
+- Reliable: Independent of shipped prompt content
+"""
+
+import pytest
+
+from myimpact.template import compile_template
+
+
+@pytest.mark.unit
+class TestPromptTemplateUnit:
+    """Test template compilation and rendering."""
+
+    def test_render_substitutes_slots(self):
+        """
+        Given: Template with two slots
+        When: render() is called with values for both
+        Then: Returns the static text with values substituted
+        """
+        template = compile_template("Level: {level}\nStyle: {style}\n")
+
+        assert template.render(level="L30", style="independent") == (
+            "Level: L30\nStyle: independent\n"
+        )
+
+    def test_render_reuses_repeated_slot(self):
+        """
+        Given: Template that references the same slot twice
+        When: render() is called
+        Then: Both positions receive the value
+        """
+        template = compile_template("{level} / {level}")
+
+        assert template.render(level="L30") == "L30 / L30"
+        assert template.slots == ("level",)
+
+    def test_render_handles_adjacent_slots(self):
+        """
+        Given: Template with slots next to each other
+        When: render() is called, one value empty
+        Then: Values are joined without separators
+        """
+        template = compile_template("A{first}{second}B")
+
+        assert template.render(first="", second="x") == "AxB"
+
+    def test_double_braces_are_literal(self):
+        """
+        Given: Template containing escaped braces
+        When: render() is called
+        Then: Escaped braces render as single literal braces
+        """
+        template = compile_template("{{literal}} {value}")
+
+        assert template.render(value="v") == "{literal} v"
+
+    def test_render_requires_every_slot(self):
+        """
+        Given: Template with a slot
+        When: render() is called without that slot
+        Then: Raises KeyError
+        """
+        template = compile_template("{level}")
+
+        with pytest.raises(KeyError):
+            template.render()
+
+    def test_render_is_repeatable(self):
+        """
+        Given: Compiled template
+        When: render() is called twice with different values
+        Then: Earlier renders do not leak into later ones
+        """
+        template = compile_template("[{value}]")
+
+        template.render(value="first")
+
+        assert template.render(value="second") == "[second]"
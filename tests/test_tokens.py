@@ -0,0 +1,123 @@
+"""Tests for myimpact.tokens module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state the estimator's contract
+- Bounded: Pure functions over literal strings
+- Fast: No file I/O
+- Reliable: Asserts properties, not exact counts a retuned heuristic would change
+"""
+
+import pytest
+
+from myimpact.tokens import (
+    _PIECE_PATTERN,
+    _segments,
+    estimate_prompt_tokens,
+    estimate_tokens,
+    segment_token_cache,
+)
+
+
+@pytest.mark.unit
+class TestEstimateTokens:
+    """Test the offline token estimator."""
+
+    def test_empty_text_has_no_tokens(self):
+        """
+        Given: An empty string
+        When: estimate_tokens() is called
+        Then: Returns 0
+        """
+        assert estimate_tokens("") == 0
+
+    def test_common_words_are_one_token_each(self):
+        """
+        Given: Short English words separated by spaces
+        When: estimate_tokens() is called
+        Then: Counts one token per word
+        """
+        assert estimate_tokens("Generate quarterly career goals now") == 5
+
+    def test_long_and_non_ascii_words_cost_more(self):
+        """
+        Given: A short word, a long word and a word with non-ASCII letters
+        When: Each is estimated
+        Then: The long and non-ASCII words cost more than the short one
+        """
+        assert estimate_tokens("interoperability") > estimate_tokens("goals")
+        assert estimate_tokens("Zusammenführung") > estimate_tokens("Zusammen")
+
+    def test_pieces_cover_the_whole_text(self):
+        """
+        Given: Markdown prompt text with digits, punctuation and blank lines
+        When: It is pre-tokenized
+        Then: The pieces join back to the original text
+        """
+        text = "### Growth\n\n- **Job Level**: L30–35 (Career)\n  snake_case 12345 it's\n"
+
+        assert "".join(_PIECE_PATTERN.findall(text)) == text
+
+    def test_estimate_grows_with_text(self):
+        """
+        Given: A paragraph
+        When: It is repeated
+        Then: The estimate is additive across repeats that start on a line boundary
+        """
+        paragraph = "- Automate deployment pipelines for integration environments.\n"
+
+        assert estimate_tokens(paragraph * 3) == 3 * estimate_tokens(paragraph)
+
+    def test_prompt_estimate_sums_both_parts(self):
+        """
+        Given: A framework and a user context
+        When: estimate_prompt_tokens() is called
+        Then: Returns the sum of both estimates
+        """
+        framework, user_context = "You generate SMART goals.", "Level: L30"
+
+        assert estimate_prompt_tokens(framework, user_context) == (
+            estimate_tokens(framework) + estimate_tokens(user_context)
+        )
+
+
+@pytest.mark.unit
+class TestSegmentTokenCache:
+    """Test per-segment token counting."""
+
+    FRAMEWORK = "You generate SMART goals.\n\n## Rules\n- Be specific.\n"
+    CONTEXT = "## Context\n**Level**: L30\n\n### Your Focus Areas\n{focus}\n\n### Your Task\nGo.\n"
+
+    def test_segments_split_after_blank_lines(self):
+        """
+        Given: Text with blank lines before headings, a triple newline and indented text
+        When: _segments() splits it
+        Then: Splits only after blank lines followed by non-space text, losing nothing
+        """
+        text = "a\n\nb\n\n\nc\n\n  d\n"
+
+        assert list(_segments(text)) == ["a\n\n", "b\n\n\n", "c\n\n  d\n"]
+
+    def test_segmented_estimate_equals_whole_text_estimate(self):
+        """
+        Given: A framework and user context with several blank-line separated sections
+        When: estimate_prompt_tokens() sums their segments
+        Then: The total equals estimating each part as one text
+        """
+        user_context = self.CONTEXT.format(focus="Cloud cost\n\n  and reliability")
+
+        assert estimate_prompt_tokens(self.FRAMEWORK, user_context) == (
+            estimate_tokens(self.FRAMEWORK) + estimate_tokens(user_context)
+        )
+
+    def test_only_new_segments_are_tokenized(self):
+        """
+        Given: A prompt whose segments were already counted
+        When: The same prompt with a different focus area is estimated
+        Then: Only the focus area's segment misses the cache
+        """
+        estimate_prompt_tokens(self.FRAMEWORK, self.CONTEXT.format(focus="Reliability"))
+        misses = segment_token_cache.stats()["misses"]
+
+        estimate_prompt_tokens(self.FRAMEWORK, self.CONTEXT.format(focus="Cloud cost"))
+
+        assert segment_token_cache.stats()["misses"] == misses + 1
@@ -0,0 +1,116 @@
+"""Tests for myimpact.watcher module.
+
+Following Martin Fowler's Test Shapes principles:
+- Expressive: Tests clearly state invalidation behavior
+- Bounded: Polling backend only, so results do not depend on OS notification APIs
+- Fast: Short poll intervals against tmp_path workspaces
+- Reliable: Waits for changes with generous deadlines, not fixed sleeps
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from myimpact.assembler import discover_orgs, load_framework_prompt
+from myimpact.cache import ResourceCache
+from myimpact.watcher import ResourceWatcher, stop_watching, watch_resources
+
+
+@pytest.mark.integration
+class TestResourceWatcherIntegration:
+    """Test change detection with the polling backend."""
+
+    def test_polling_watcher_reports_added_file(self, tmp_path):
+        """
+        Given: A polling watcher on an empty directory
+        When: A file is created
+        Then: on_change receives the new path
+        """
+        seen = []
+        changed = threading.Event()
+
+        def on_change(paths):
+            seen.append(paths)
+            changed.set()
+
+        watcher = ResourceWatcher([tmp_path], on_change, interval=0.01, force_polling=True)
+        watcher.start()
+        try:
+            (tmp_path / "org_focus_areas_new.md").write_text("# New", encoding="utf-8")
+            assert changed.wait(timeout=5)
+        finally:
+            watcher.stop()
+
+        assert str(tmp_path / "org_focus_areas_new.md") in seen[0]
+        assert not watcher.running
+
+    def test_watched_cache_serves_loads_without_stat_calls(self, test_workspace, monkeypatch):
+        """
+        Given: Resources warmed while a watcher keeps the cache trusted
+        When: os.stat and globbing are made to fail
+        Then: Loads and discovery are still served from memory
+        """
+        watcher = watch_resources(interval=0.01, force_polling=True)
+        try:
+            framework = load_framework_prompt()
+            orgs = discover_orgs()
+
+            def no_stat(*args, **kwargs):
+                raise AssertionError("filesystem call in steady state")
+
+            monkeypatch.setattr("myimpact.cache.os.stat", no_stat)
+            monkeypatch.setattr("pathlib.Path.glob", no_stat)
+
+            assert load_framework_prompt() is framework
+            assert discover_orgs() == orgs
+        finally:
+            monkeypatch.undo()
+            stop_watching(watcher)
+
+    def test_watched_cache_picks_up_new_org(self, test_workspace):
+        """
+        Given: A watcher on the workspace and a discovered org list
+        When: A new org focus areas file is added
+        Then: discover_orgs() includes it once the watcher has fired
+        """
+        watcher = watch_resources(interval=0.01, force_polling=True)
+        try:
+            assert discover_orgs() == ["acme"]
+            (test_workspace / "prompts" / "org_focus_areas_globex.md").write_text(
+                "# Globex", encoding="utf-8"
+            )
+
+            deadline = time.monotonic() + 5
+            while discover_orgs() == ["acme"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert discover_orgs() == ["acme", "globex"]
+        finally:
+            stop_watching(watcher)
+
+
+@pytest.mark.unit
+class TestTrustedResourceCacheUnit:
+    """Test memoization in trusted mode."""
+
+    def test_trusted_cache_ignores_changes_until_invalidated(self, tmp_path):
+        """
+        Given: A trusted cache holding a loaded file
+        When: The file changes on disk
+        Then: The old value is served until invalidate() is called
+        """
+        path = tmp_path / "resource.txt"
+        path.write_text("old", encoding="utf-8")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        cache = ResourceCache()
+        cache.trusted = True
+        read = lambda p: p.read_text(encoding="utf-8")
+        cache.load(path, read)
+
+        path.write_text("new content", encoding="utf-8")
+
+        assert cache.load(path, read) == "old"
+        cache.invalidate()
+        assert cache.load(path, read) == "new content"
@@ -48,6 +48,66 @@ async function generateGoals(payload) {
     }
 }
 
+/**
+ * Generate goals as a server-sent event stream, calling handlers as events arrive:
+ * onPrompt(prompt) once the prompts are assembled, onDelta(text) for each chunk of generated
+ * goals, and onDone(done) with the complete result. Resolves with the done event's data.
+ */
+async function streamGoals(payload, { onPrompt, onDelta, onDone } = {}) {
+    const response = await fetch(`${API_BASE_URL}/api/goals/generate/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'Accept': 'text/event-stream',
+        },
+        body: JSON.stringify(payload),
+    });
+
+    if (!response.ok) {
+        const errorData = await response.json();
+        throw new Error(errorData.detail || `API error: ${response.status}`);
+    }
+
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    let done = null;
+
+    // Events are separated by a blank line; each has an "event:" and a JSON "data:" line
+    const dispatch = (block) => {
+        let event = 'message';
+        let data = '';
+        for (const line of block.split('\n')) {
+            if (line.startsWith('event:')) event = line.slice(6).trim();
+            else if (line.startsWith('data:')) data += line.slice(5).trim();
+        }
+        if (!data) return;
+        const message = JSON.parse(data);
+        if (event === 'prompt' && onPrompt) onPrompt(message);
+        else if (event === 'delta' && onDelta) onDelta(message.content);
+        else if (event === 'done') {
+            done = message;
+            if (onDone) onDone(message);
+        } else if (event === 'error') {
+            throw new Error(message.detail || `API error: ${message.status_code}`);
+        }
+    };
+
+    while (true) {
+        const { value, done: finished } = await reader.read();
+        if (finished) break;
+        buffer += value;
+        const blocks = buffer.split('\n\n');
+        buffer = blocks.pop();
+        blocks.forEach(dispatch);
+    }
+    if (buffer.trim()) dispatch(buffer);
+
+    if (!done) {
+        throw new Error('Generation stream ended unexpectedly');
+    }
+    return done;
+}
+
 /**
  * Fetch full org focus areas content
  */
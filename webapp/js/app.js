@@ -159,30 +159,49 @@ async function onFormSubmit(event) {
     document.getElementById('results-section').scrollIntoView({ behavior: 'smooth' });
 
     try {
-        // Call API
-        const response = await generateGoals(formData);
-
-        // Extract prompts from new response format
-        const frameworkPrompt = response.framework;
-        const userContext = response.user_context;
-
-        // Display results
-        document.getElementById('framework-prompt-content').textContent = frameworkPrompt;
-        document.getElementById('user-context-content').textContent = userContext;
-
-        // Display full prompt preview
-        const fullPromptPreview = `[GOAL FRAMEWORK]\n${frameworkPrompt}\n\n[YOUR CUSTOMIZATION]\n${userContext}`;
-        document.getElementById('full-prompt-preview').value = fullPromptPreview;
-
-        // Store in window for copy operations
-        window.currentPrompts = {
-            framework: frameworkPrompt,
-            user: userContext,
-        };
-
-        // Hide loading, show results
-        document.getElementById('loading').classList.add('hidden');
-        document.getElementById('results-container').classList.remove('hidden');
+        const goalsPanel = document.getElementById('generated-goals');
+        const goalsContent = document.getElementById('generated-goals-content');
+        goalsPanel.classList.add('hidden');
+        goalsContent.textContent = '';
+        document.getElementById('generated-goals-model').textContent = '';
+
+        // Stream from the API: prompts arrive first, generated goals (if enabled) follow
+        await streamGoals(formData, {
+            onPrompt: (response) => {
+                const frameworkPrompt = response.framework;
+                const userContext = response.user_context;
+
+                // Display results
+                document.getElementById('framework-prompt-content').textContent = frameworkPrompt;
+                document.getElementById('user-context-content').textContent = userContext;
+
+                // Display full prompt preview
+                const fullPromptPreview = `[GOAL FRAMEWORK]\n${frameworkPrompt}\n\n[YOUR CUSTOMIZATION]\n${userContext}`;
+                document.getElementById('full-prompt-preview').value = fullPromptPreview;
+
+                // Store in window for copy operations
+                window.currentPrompts = {
+                    framework: frameworkPrompt,
+                    user: userContext,
+                };
+
+                // Hide loading, show results
+                document.getElementById('loading').classList.add('hidden');
+                document.getElementById('results-container').classList.remove('hidden');
+            },
+            onDelta: (text) => {
+                // Render goals progressively as chunks arrive
+                goalsPanel.classList.remove('hidden');
+                goalsContent.textContent += text;
+            },
+            onDone: (done) => {
+                if (done.result) {
+                    goalsPanel.classList.remove('hidden');
+                    goalsContent.textContent = done.result.content;
+                    document.getElementById('generated-goals-model').textContent = done.result.model;
+                }
+            },
+        });
 
         // Keep collapsible sections collapsed by default (user can expand if needed)
     } catch (error) {